@@ -0,0 +1,175 @@
+# backend/apps/building/migrations/0001_building_tables.py
+from django.db import migrations
+
+# 크롤러(crawlers/*)가 적재하는 테이블. 운영 DB 에는 이미 존재하므로 IF NOT EXISTS 로만 생성하고,
+# PK/UNIQUE 는 각 크롤러의 CONFLICT_TARGET (ON CONFLICT 대상)과 일치해야 함
+CREATE_SQL = """
+CREATE TABLE IF NOT EXISTS building_registrations (
+    bbl TEXT PRIMARY KEY,
+    bin INTEGER,
+    boro_id INTEGER,
+    boro TEXT,
+    block INTEGER,
+    lot INTEGER,
+    house_number TEXT,
+    street_name TEXT,
+    zip TEXT,
+    community_board INTEGER,
+    last_registration_date TIMESTAMP,
+    registration_end_date TIMESTAMP,
+    registration_id INTEGER,
+    building_id INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS building_registration_contacts (
+    registration_contact_id INTEGER PRIMARY KEY,
+    registration_id INTEGER,
+    type TEXT,
+    contact_description TEXT,
+    first_name TEXT,
+    last_name TEXT,
+    corporation_name TEXT,
+    business_house_number TEXT,
+    business_street_name TEXT,
+    business_city TEXT,
+    business_state TEXT,
+    business_zip TEXT,
+    business_apartment TEXT
+);
+
+CREATE TABLE IF NOT EXISTS building_affordable_housing (
+    project_id INTEGER PRIMARY KEY,
+    bbl TEXT,
+    project_name TEXT,
+    project_start_date TIMESTAMP,
+    reporting_construction_type TEXT,
+    extended_affordability_status TEXT,
+    prevailing_wage_status TEXT,
+    extremely_low_income_units INTEGER,
+    very_low_income_units INTEGER,
+    low_income_units INTEGER,
+    counted_rental_units INTEGER,
+    all_counted_units INTEGER,
+    total_units INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS building_complaints (
+    complaint_id INTEGER PRIMARY KEY,
+    bbl TEXT,
+    borough TEXT,
+    block INTEGER,
+    lot INTEGER,
+    problem_id INTEGER,
+    unit_type TEXT,
+    space_type TEXT,
+    type TEXT,
+    major_category TEXT,
+    minor_category TEXT,
+    complaint_status TEXT,
+    complaint_status_date TIMESTAMP,
+    problem_status TEXT,
+    problem_status_date TIMESTAMP,
+    status_description TEXT,
+    house_number TEXT,
+    street_name TEXT,
+    post_code TEXT,
+    apartment TEXT
+);
+
+CREATE TABLE IF NOT EXISTS building_violations (
+    violation_id INTEGER PRIMARY KEY,
+    bbl TEXT,
+    bin INTEGER,
+    block INTEGER,
+    lot INTEGER,
+    boro TEXT,
+    nov_description TEXT,
+    nov_type TEXT,
+    class TEXT,
+    rent_impairing BOOLEAN,
+    violation_status TEXT,
+    current_status TEXT,
+    current_status_id INTEGER,
+    current_status_date TIMESTAMP,
+    inspection_date TIMESTAMP,
+    nov_issued_date TIMESTAMP,
+    approved_date TIMESTAMP,
+    house_number TEXT,
+    street_name TEXT,
+    apartment TEXT,
+    story TEXT
+);
+
+CREATE TABLE IF NOT EXISTS building_evictions (
+    docket_number TEXT,
+    court_index_number TEXT,
+    bbl TEXT,
+    bin INTEGER,
+    borough TEXT,
+    eviction_zip TEXT,
+    eviction_address TEXT,
+    eviction_apt_num TEXT,
+    community_board INTEGER,
+    council_district INTEGER,
+    census_tract TEXT,
+    nta TEXT,
+    latitude NUMERIC,
+    longitude NUMERIC,
+    executed_date TIMESTAMP,
+    residential_commercial_ind TEXT,
+    ejectment TEXT,
+    eviction_possession TEXT,
+    marshal_first_name TEXT,
+    marshal_last_name TEXT,
+    PRIMARY KEY (docket_number, court_index_number)
+);
+
+CREATE TABLE IF NOT EXISTS building_rent_stabilized_list (
+    bbl TEXT,
+    borough TEXT,
+    block INTEGER,
+    lot INTEGER,
+    zip TEXT,
+    city TEXT,
+    status TEXT,
+    source_year INTEGER,
+    PRIMARY KEY (source_year, bbl)
+);
+
+CREATE TABLE IF NOT EXISTS building_acris_master (
+    document_id TEXT PRIMARY KEY,
+    borough INTEGER,
+    doc_type TEXT,
+    doc_date TIMESTAMP,
+    doc_amount NUMERIC
+);
+
+CREATE TABLE IF NOT EXISTS building_acris_legals (
+    document_id TEXT,
+    borough INTEGER,
+    block INTEGER,
+    lot INTEGER,
+    bbl TEXT,
+    PRIMARY KEY (document_id, borough, block, lot)
+);
+
+CREATE TABLE IF NOT EXISTS building_acris_parties (
+    document_id TEXT,
+    party_type TEXT,
+    name TEXT,
+    address1 TEXT,
+    city TEXT,
+    state TEXT,
+    zip TEXT,
+    UNIQUE (document_id, party_type, name, address1)
+);
+"""
+
+
+class Migration(migrations.Migration):
+    initial = True
+    dependencies = []
+    operations = [
+        # 크롤링 데이터가 들어 있는 테이블이므로 롤백 시에도 DROP 하지 않음
+        migrations.RunSQL(sql=CREATE_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
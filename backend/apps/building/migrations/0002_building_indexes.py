@@ -0,0 +1,62 @@
+# backend/apps/building/migrations/0002_building_indexes.py
+from django.db import migrations
+
+# (name, definition) - 저장소 쿼리의 WHERE 조건 기준.
+# ACRIS document_id 조회는 PK/UNIQUE (document_id, ...) 의 선두 컬럼으로 이미 인덱싱됨
+INDEXES = [
+    # 단일 BBL 프로필 / ANY(%s) 배치 조회
+    ("idx_building_affordable_housing_bbl", "building_affordable_housing (bbl)"),
+    ("idx_building_rent_stabilized_list_bbl", "building_rent_stabilized_list (bbl)"),
+    ("idx_building_acris_legals_bbl", "building_acris_legals (bbl)"),
+    (
+        "idx_building_registration_contacts_registration_id",
+        "building_registration_contacts (registration_id)",
+    ),
+    # bbl 조회 + 월별 추이 (get_neighborhood_trends)
+    (
+        "idx_building_violations_bbl_inspection_date",
+        "building_violations (bbl, inspection_date)",
+    ),
+    (
+        "idx_building_complaints_bbl_problem_status_date",
+        "building_complaints (bbl, problem_status_date)",
+    ),
+    (
+        "idx_building_evictions_bbl_executed_date",
+        "building_evictions (bbl, executed_date)",
+    ),
+    # 히트맵/구 요약의 미해결 건수 집계 (index-only scan)
+    (
+        "idx_building_violations_open_bbl",
+        "building_violations (bbl) WHERE violation_status = 'Open'",
+    ),
+    (
+        "idx_building_complaints_open_bbl",
+        "building_complaints (bbl) WHERE complaint_status = 'Open'",
+    ),
+    # 최근 N년 퇴거 범위 조회
+    ("idx_building_evictions_executed_date", "building_evictions (executed_date)"),
+    # 뷰포트 lat/lng BETWEEN 조회
+    (
+        "idx_building_evictions_lat_lng",
+        "building_evictions (latitude, longitude) "
+        "WHERE latitude IS NOT NULL AND longitude IS NOT NULL",
+    ),
+]
+
+
+class Migration(migrations.Migration):
+    # CONCURRENTLY 는 트랜잭션 밖에서만 실행 가능 - 운영 테이블의 쓰기를 막지 않음
+    atomic = False
+
+    dependencies = [
+        ("building", "0001_building_tables"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition};",
+            reverse_sql=f"DROP INDEX CONCURRENTLY IF EXISTS {name};",
+        )
+        for name, definition in INDEXES
+    ]
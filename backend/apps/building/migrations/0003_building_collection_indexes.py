@@ -0,0 +1,38 @@
+# backend/apps/building/migrations/0003_building_collection_indexes.py
+from django.db import migrations
+
+# (name, definition) - BuildingRepository 의 컬렉션 keyset 페이지 정렬 순서 그대로.
+# PagedCollection.sort_columns 와 식이 같아야 ORDER BY ... DESC LIMIT 이 인덱스 역방향 스캔으로 끝남
+INDEXES = [
+    (
+        "idx_building_violations_bbl_page",
+        "building_violations "
+        "(bbl, (COALESCE(inspection_date, '-infinity'::timestamp)), violation_id)",
+    ),
+    (
+        "idx_building_complaints_bbl_page",
+        "building_complaints "
+        "(bbl, (COALESCE(complaint_status_date, '-infinity'::timestamp)), complaint_id)",
+    ),
+    (
+        "idx_building_evictions_bbl_page",
+        "building_evictions "
+        "(bbl, (COALESCE(executed_date, '-infinity'::timestamp)), docket_number, court_index_number)",
+    ),
+]
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("building", "0002_building_indexes"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition};",
+            reverse_sql=f"DROP INDEX CONCURRENTLY IF EXISTS {name};",
+        )
+        for name, definition in INDEXES
+    ]
@@ -0,0 +1,37 @@
+# backend/apps/building/migrations/0004_building_profile_snapshot.py
+from django.db import migrations
+
+# BBL 당 미리 조립한 건물 프로필 (BuildingRepository 의 snapshot 읽기 경로).
+# 크롤러 load() 가 건드린 BBL 만 refresh_profile_snapshots 로 다시 만들며,
+# 원본 테이블에서 언제든 재생성할 수 있으므로 롤백 시 DROP 해도 됨
+CREATE_SQL = """
+CREATE TABLE IF NOT EXISTS building_profile_snapshot (
+    bbl TEXT PRIMARY KEY,
+    profile JSONB NOT NULL,
+    counts JSONB NOT NULL,
+    refreshed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+"""
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("building", "0003_building_collection_indexes"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=CREATE_SQL,
+            reverse_sql="DROP TABLE IF EXISTS building_profile_snapshot;",
+        ),
+        # 등록 연락처 크롤러 배치 -> 건드린 BBL (registration_id 로 역조회)
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_building_registrations_registration_id "
+                "ON building_registrations (registration_id);"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS idx_building_registrations_registration_id;",
+        ),
+    ]
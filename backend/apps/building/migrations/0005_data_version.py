@@ -0,0 +1,27 @@
+# backend/apps/building/migrations/0005_data_version.py
+from django.db import migrations
+
+# 이름별 데이터 버전. 크롤러 load() 가 커밋과 함께 올리고 (bump_data_version),
+# 각 워커의 ProfileCache 가 주기적으로 읽어 바뀌면 캐시를 비움
+CREATE_SQL = """
+CREATE TABLE IF NOT EXISTS data_version (
+    name TEXT PRIMARY KEY,
+    version BIGINT NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+INSERT INTO data_version (name, version) VALUES ('building', 1)
+ON CONFLICT (name) DO NOTHING;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("building", "0004_building_profile_snapshot"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=CREATE_SQL,
+            reverse_sql="DROP TABLE IF EXISTS data_version;",
+        ),
+    ]
@@ -0,0 +1,38 @@
+# backend/apps/building/migrations/0006_building_acris_documents.py
+from django.db import migrations
+
+# BBL 별 ACRIS 문서 인덱스 (legals ⋈ master). 한 필지의 문서 이력을 PK 범위 스캔 한 번으로 읽음
+# (INCLUDE 컬럼으로 index-only). 크롤러 load() 가 refresh_acris_documents 로 건드린 BBL 만
+# 다시 만들고, 원본 테이블에서 언제든 재생성할 수 있으므로 롤백 시 DROP 해도 됨
+CREATE_SQL = """
+CREATE TABLE IF NOT EXISTS building_acris_documents (
+    bbl TEXT NOT NULL,
+    document_id TEXT NOT NULL,
+    borough INTEGER,
+    doc_type TEXT,
+    doc_date TIMESTAMP,
+    doc_amount NUMERIC,
+    CONSTRAINT building_acris_documents_pkey PRIMARY KEY (bbl, document_id)
+        INCLUDE (borough, doc_type, doc_date, doc_amount)
+);
+INSERT INTO building_acris_documents (bbl, document_id, borough, doc_type, doc_date, doc_amount)
+SELECT DISTINCT l.bbl, m.document_id, m.borough, m.doc_type, m.doc_date, m.doc_amount
+FROM building_acris_legals l
+JOIN building_acris_master m ON m.document_id = l.document_id
+WHERE l.bbl IS NOT NULL AND l.bbl <> ''
+ON CONFLICT DO NOTHING;
+ANALYZE building_acris_documents;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("building", "0005_data_version"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=CREATE_SQL,
+            reverse_sql="DROP TABLE IF EXISTS building_acris_documents;",
+        ),
+    ]
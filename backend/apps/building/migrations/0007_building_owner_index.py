@@ -0,0 +1,67 @@
+# backend/apps/building/migrations/0007_building_owner_index.py
+from django.db import migrations
+
+# 정규화된 소유자 이름 -> BBL 인덱스 (OwnerRepository.get_portfolio).
+# 이름 정규화는 SQL 함수 하나로 - 적재(refresh_owner_index)와 조회가 같은 규칙을 씀:
+# 대문자, 마침표/따옴표 제거 ("L.L.C." -> "LLC"), 나머지 기호는 공백, 공백 정리.
+# 크롤러 load() 가 건드린 BBL 만 다시 만들며, 원본 테이블에서 언제든 재생성할 수 있음
+CREATE_SQL = """
+CREATE OR REPLACE FUNCTION normalize_owner_name(name TEXT) RETURNS TEXT
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT NULLIF(
+        btrim(regexp_replace(
+            regexp_replace(upper(name), '[.'']', '', 'g'), '[^A-Z0-9]+', ' ', 'g'
+        )),
+        ''
+    )
+$$;
+
+CREATE TABLE IF NOT EXISTS building_owner_index (
+    owner_name TEXT NOT NULL,
+    bbl TEXT NOT NULL,
+    source TEXT NOT NULL,
+    display_name TEXT NOT NULL,
+    PRIMARY KEY (owner_name, bbl, source)
+);
+CREATE INDEX IF NOT EXISTS idx_building_owner_index_bbl ON building_owner_index (bbl);
+
+INSERT INTO building_owner_index (owner_name, bbl, source, display_name)
+SELECT owner_name, bbl, source, min(display_name)
+FROM (
+    SELECT normalize_owner_name(c.corporation_name) AS owner_name, r.bbl,
+           'registration' AS source, c.corporation_name AS display_name
+    FROM building_registrations r
+    JOIN building_registration_contacts c ON c.registration_id = r.registration_id
+    WHERE c.corporation_name IS NOT NULL
+    UNION ALL
+    SELECT normalize_owner_name(concat_ws(' ', c.first_name, c.last_name)), r.bbl,
+           'registration', concat_ws(' ', c.first_name, c.last_name)
+    FROM building_registrations r
+    JOIN building_registration_contacts c ON c.registration_id = r.registration_id
+    WHERE c.type = 'IndividualOwner'
+    UNION ALL
+    SELECT normalize_owner_name(p.name), l.bbl, 'acris', p.name
+    FROM building_acris_legals l
+    JOIN building_acris_parties p ON p.document_id = l.document_id
+    WHERE p.party_type = '2'
+) names
+WHERE owner_name IS NOT NULL AND bbl IS NOT NULL AND bbl <> ''
+GROUP BY owner_name, bbl, source
+ON CONFLICT DO NOTHING;
+ANALYZE building_owner_index;
+"""
+
+REVERSE_SQL = """
+DROP TABLE IF EXISTS building_owner_index;
+DROP FUNCTION IF EXISTS normalize_owner_name(TEXT);
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("building", "0006_building_acris_documents"),
+    ]
+
+    operations = [
+        migrations.RunSQL(sql=CREATE_SQL, reverse_sql=REVERSE_SQL),
+    ]
@@ -0,0 +1,53 @@
+# backend/apps/building/migrations/0008_owner_index_deeds_only.py
+from django.db import migrations
+
+# 0007 의 소유자 인덱스는 모든 연락처 유형의 법인명(관리회사 포함)과 모든 ACRIS 문서의
+# party 2 (모기지 대출기관 포함)를 소유자로 넣었음. 소유자 유형 연락처와 BBL 별 최신
+# 양도증서의 양수인만으로 다시 만들고, 캐시/ETag 가 옛 포트폴리오를 내주지 않게 버전을 올림.
+# 인덱스는 원본 테이블에서 재생성되므로 되돌릴 것은 없음
+REBUILD_SQL = """
+TRUNCATE building_owner_index;
+INSERT INTO building_owner_index (owner_name, bbl, source, display_name)
+SELECT owner_name, bbl, source, min(display_name)
+FROM (
+    SELECT normalize_owner_name(c.corporation_name) AS owner_name, r.bbl,
+           'registration' AS source, c.corporation_name AS display_name
+    FROM building_registrations r
+    JOIN building_registration_contacts c ON c.registration_id = r.registration_id
+    WHERE c.corporation_name IS NOT NULL
+      AND c.type IN ('CorporateOwner', 'IndividualOwner', 'JointOwner')
+    UNION ALL
+    SELECT normalize_owner_name(concat_ws(' ', c.first_name, c.last_name)), r.bbl,
+           'registration', concat_ws(' ', c.first_name, c.last_name)
+    FROM building_registrations r
+    JOIN building_registration_contacts c ON c.registration_id = r.registration_id
+    WHERE c.type IN ('IndividualOwner', 'JointOwner')
+    UNION ALL
+    SELECT normalize_owner_name(p.name), deed.bbl, 'acris', p.name
+    FROM (
+        SELECT DISTINCT ON (d.bbl) d.bbl, d.document_id
+        FROM building_acris_documents d
+        WHERE d.doc_type IN ('DEED', 'DEEDO', 'DEED, RC', 'CORRD')
+        ORDER BY d.bbl, d.doc_date DESC NULLS LAST, d.document_id DESC
+    ) deed
+    JOIN building_acris_parties p ON p.document_id = deed.document_id
+    WHERE p.party_type = '2'
+) names
+WHERE owner_name IS NOT NULL AND bbl IS NOT NULL AND bbl <> ''
+GROUP BY owner_name, bbl, source
+ON CONFLICT DO NOTHING;
+ANALYZE building_owner_index;
+INSERT INTO data_version (name, version) VALUES ('building', 1)
+ON CONFLICT (name) DO UPDATE
+SET version = data_version.version + 1, updated_at = clock_timestamp();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("building", "0007_building_owner_index"),
+    ]
+
+    operations = [
+        migrations.RunSQL(sql=REBUILD_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -3,6 +3,7 @@
 import importlib
 import inspect
 import unittest
+from datetime import date, datetime
 from decimal import Decimal
 
 from django.http import HttpResponse
@@ -12,6 +13,7 @@ from common.models.building import (
     Building,
     as_acris_master,
     as_violation,
+    build_building_from_profile_row,
     build_building_from_rows,
 )
 from common.models.acris import AcrisMaster
@@ -570,6 +572,33 @@ class BuildingModelTests(TestCase):
         self.building.add_eviction(eviction2)
         self.assertEqual(len(self.building.evictions), 1)
 
+    def test_add_complaint_dedupes_after_list_changes(self):
+        """Test the key index follows replaced or externally appended lists"""
+        from types import SimpleNamespace
+
+        self.building.add_complaint(SimpleNamespace(complaint_id=1))
+        self.building.complaints.append(SimpleNamespace(complaint_id=2))
+        self.building.add_complaint(SimpleNamespace(complaint_id=2))
+        self.assertEqual([c.complaint_id for c in self.building.complaints], [1, 2])
+
+        self.building.complaints = [SimpleNamespace(complaint_id=3)]
+        self.building.add_complaint(SimpleNamespace(complaint_id=1))
+        self.building.add_complaint(SimpleNamespace(complaint_id=3))
+        self.assertEqual([c.complaint_id for c in self.building.complaints], [3, 1])
+
+    def test_extend_unique_then_add(self):
+        """Test bulk-extended rows still dedupe later add_* calls"""
+        from types import SimpleNamespace
+
+        self.building.extend_unique(
+            "violations", (SimpleNamespace(violation_id=i) for i in range(3))
+        )
+        self.building.add_violation(SimpleNamespace(violation_id=1, class_="A"))
+        self.building.add_violation(SimpleNamespace(violation_id=5, class_="B"))
+        self.assertEqual(
+            [v.violation_id for v in self.building.violations], [0, 1, 2, 5]
+        )
+
 
 class BuildingFactoryFunctionTests(TestCase):
     def test_as_acris_master_with_string_amount(self):
@@ -712,9 +741,78 @@ class BuildBuildingFromRowsTests(TestCase):
         self.assertEqual(building.registration.house_number, "123")
 
 
+class BuildBuildingFromProfileRowTests(TestCase):
+    def test_build_building_from_profile_row_none(self):
+        """Test profile row decoding when the query returned nothing"""
+        building = build_building_from_profile_row("1234567890", None)
+        self.assertEqual(building.bbl, "1234567890")
+        self.assertIsNone(building.registration)
+        self.assertEqual(building.violations, [])
+
+    def test_build_building_from_profile_row_sections(self):
+        """Test JSON sections are decoded with dates and Decimals restored"""
+        row = {
+            "registration": '{"bbl": "1234567890", "house_number": "123", '
+            '"last_registration_date": "2023-01-01T00:00:00"}',
+            "contacts": "[]",
+            "affordable": "[]",
+            "complaints": "[]",
+            "violations": "[]",
+            "evictions": "[]",
+            "rent_stabilized": None,
+            "acris_legals": '[{"document_id": "D1", "bbl": "1234567890", '
+            '"borough": 1, "block": 1, "lot": 1}]',
+            "acris_master": '[{"document_id": "D1", "borough": 1, "doc_type": "DEED", '
+            '"doc_date": "2010-01-01", "doc_amount": 1000.50}]',
+            "acris_parties": "[]",
+        }
+        building = build_building_from_profile_row("1234567890", row)
+        self.assertEqual(
+            building.registration.last_registration_date, datetime(2023, 1, 1)
+        )
+        master = building.acris_master["D1"]
+        self.assertEqual(master.doc_amount, Decimal("1000.50"))
+        self.assertEqual(master.doc_date, date(2010, 1, 1))
+        self.assertEqual(len(building.acris_legals["D1"]), 1)
+
+
+class BuildingLazySectionTests(TestCase):
+    def test_fully_built_building_has_all_row_sections(self):
+        """Test a normally built Building reports every row section as loaded"""
+        from common.models.building import ROW_SECTIONS
+
+        building = Building(bbl="1234567890")
+        self.assertEqual(building.loaded_sections, ROW_SECTIONS)
+        self.assertFalse(building.is_loaded("counts"))
+        with self.assertRaises(ValueError):
+            building.load("counts")
+
+    def test_load_calls_loader_for_missing_sections_only(self):
+        """Test lazy sections are fetched once through the loader"""
+        calls = []
+
+        def loader(building, sections):
+            calls.append(sections)
+            building.copy_sections(
+                Building(bbl="1234567890", complaints=["c1"]), sections
+            )
+
+        building = Building(bbl="1234567890")
+        building.set_lazy({"registration"}, loader)
+        self.assertEqual(len(building.section("complaints")), 1)
+        building.load("registration", "complaints")
+        self.assertEqual(calls, [frozenset({"complaints"})])
+        with self.assertRaises(ValueError):
+            building.load("unknown")
+
+
 class BuildingViewsAPITests(TestCase):
     def setUp(self):
+        from infrastructures.postgres.profile_cache import get_profile_cache
+
         self.building_url = "/api/building/"
+        # 워커 캐시는 프로세스 전역 - 다른 테스트의 (mock) 결과가 남지 않도록
+        get_profile_cache().invalidate()
 
     def test_building_by_bbl_view_success(self):
         """Test GET /api/building/?bbl=1013510030 with valid BBL"""
@@ -729,6 +827,166 @@ class BuildingViewsAPITests(TestCase):
         except Exception as e:
             self.skipTest(f"Database connection failed: {e}")
 
+    def test_building_by_bbl_view_sections(self):
+        """Test sections= returns only the requested sections"""
+        from unittest.mock import patch
+
+        from common.models.building import Building
+        from infrastructures.postgres.profile_cache import ProfileCache
+
+        cache = ProfileCache(version_loader=lambda: 1)
+        building = Building(bbl="1013510030", counts={"violations": 3})
+        building.set_lazy({"counts", "violations"}, None)
+        with patch("apps.building.views.get_profile_cache", return_value=cache), patch(
+            "apps.building.views.BuildingRepository.get_by_bbl", return_value=building
+        ) as get_by_bbl:
+            response = self.client.get(
+                self.building_url,
+                {"bbl": "1013510030", "sections": "counts, violations"},
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data), {"bbl", "counts", "violations"})
+        self.assertEqual(
+            get_by_bbl.call_args.kwargs["sections"], {"counts", "violations"}
+        )
+
+    def test_building_by_bbl_view_cached(self):
+        """Test repeated requests (found and 404) are served from the profile cache"""
+        from unittest.mock import patch
+
+        from common.models.building import Building
+        from infrastructures.postgres.profile_cache import ProfileCache
+
+        cache = ProfileCache(version_loader=lambda: 1)
+        building = Building(bbl="1013510030", counts={"violations": 3})
+        building.set_lazy({"counts"}, None)
+        with patch("apps.building.views.get_profile_cache", return_value=cache), patch(
+            "apps.building.views.BuildingRepository.get_by_bbl",
+            side_effect=lambda bbl, **kwargs: (
+                building if bbl == "1013510030" else Building(bbl=bbl)
+            ),
+        ) as get_by_bbl:
+            for _ in range(3):
+                found = self.client.get(
+                    self.building_url, {"bbl": "1013510030", "sections": "counts"}
+                )
+                missing = self.client.get(
+                    self.building_url, {"bbl": "9999999999", "sections": "counts"}
+                )
+                self.assertEqual(found.status_code, 200)
+                self.assertEqual(found.data["counts"], {"violations": 3})
+                self.assertEqual(missing.status_code, 404)
+            self.client.get(
+                self.building_url,
+                {"bbl": "1013510030", "sections": "counts", "limit": "10"},
+            )
+
+        self.assertEqual(get_by_bbl.call_count, 3)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["negative_hits"]), (2, 2))
+
+    def test_building_by_bbl_view_version_unavailable(self):
+        """Test a failing data version read bypasses the cache instead of a 500"""
+        from unittest.mock import patch
+
+        from common.exceptions.db_error import DatabaseError
+        from common.models.building import Building
+        from infrastructures.postgres.profile_cache import ProfileCache
+
+        def version_loader():
+            raise DatabaseError("Failed to connect to DB")
+
+        cache = ProfileCache(version_loader=version_loader)
+        building = Building(bbl="1013510030", counts={"violations": 3})
+        building.set_lazy({"counts"}, None)
+        with patch(
+            "middlewares.conditional_get.get_profile_cache", return_value=cache
+        ), patch("apps.building.views.get_profile_cache", return_value=cache), patch(
+            "apps.building.views.BuildingRepository.get_by_bbl", return_value=building
+        ) as get_by_bbl:
+            for _ in range(2):
+                response = self.client.get(
+                    self.building_url, {"bbl": "1013510030", "sections": "counts"}
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data["counts"], {"violations": 3})
+
+        self.assertEqual(get_by_bbl.call_count, 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_building_by_bbl_view_not_modified(self):
+        """Test If-None-Match with the current ETag is a 304 without repository queries"""
+        from unittest.mock import patch
+
+        from common.models.building import Building
+        from infrastructures.postgres.profile_cache import DataVersion, ProfileCache
+
+        cache = ProfileCache(max_size=0, version_loader=lambda: DataVersion(1, None))
+        building = Building(bbl="1013510030", counts={"violations": 3})
+        building.set_lazy({"counts"}, None)
+        with patch(
+            "middlewares.conditional_get.get_profile_cache", return_value=cache
+        ), patch("apps.building.views.get_profile_cache", return_value=cache), patch(
+            "apps.building.views.BuildingRepository.get_by_bbl", return_value=building
+        ) as get_by_bbl:
+            params = {"bbl": "1013510030", "sections": "counts"}
+            first = self.client.get(self.building_url, params)
+            self.assertEqual(first.status_code, 200)
+            second = self.client.get(
+                self.building_url, params, HTTP_IF_NONE_MATCH=first["ETag"]
+            )
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(get_by_bbl.call_count, 1)
+
+    def test_building_by_bbl_view_invalid_sections(self):
+        """Test unknown section names are rejected"""
+        response = self.client.get(
+            self.building_url, {"bbl": "1013510030", "sections": "counts,bogus"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_building_by_bbl_view_invalid_limit(self):
+        """Test limit= outside 1..MAX_PAGE_SIZE is rejected"""
+        for limit in ("0", "abc", "100000"):
+            response = self.client.get(
+                self.building_url, {"bbl": "1013510030", "limit": limit}
+            )
+            self.assertEqual(response.status_code, 400)
+
+    def test_building_collection_view_pages(self):
+        """Test GET /api/building/violations/ returns one page and its cursor"""
+        from unittest.mock import patch
+
+        from common.models.building import CollectionPage
+
+        page = CollectionPage(items=[], next_cursor="abc", limit=20)
+        with patch(
+            "apps.building.views.BuildingRepository.get_collection_page",
+            return_value=page,
+        ) as get_page:
+            response = self.client.get(
+                "/api/building/violations/",
+                {"bbl": "1013510030", "cursor": "xyz", "limit": "20"},
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data,
+            {"bbl": "1013510030", "violations": [], "next_cursor": "abc", "limit": 20},
+        )
+        get_page.assert_called_once_with(
+            "1013510030", "violations", cursor="xyz", limit=20
+        )
+
+    def test_building_collection_view_invalid_cursor(self):
+        """Test a malformed cursor is a 400, not a 500"""
+        response = self.client.get(
+            "/api/building/complaints/", {"bbl": "1013510030", "cursor": "bogus"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get("/api/building/evictions/", {"bbl": "123"})
+        self.assertEqual(response.status_code, 400)
+
     def test_building_by_bbl_view_missing_bbl(self):
         """Test GET /api/building/ without bbl parameter"""
         try:
@@ -790,85 +1048,41 @@ class BuildingViewsAPITests(TestCase):
 
 
 class BuildingViewsHelperFunctionTests(TestCase):
-    def test_default_serializer_dataclass(self):
-        """Test _default_serializer with dataclass"""
-        from apps.building.views import _default_serializer
-        from common.models.building import Building
-
-        building = Building(bbl="1234567890")
-        result = _default_serializer(building)
-        self.assertIsInstance(result, dict)
-        self.assertEqual(result["bbl"], "1234567890")
-
-    def test_default_serializer_datetime(self):
-        """Test _default_serializer with datetime"""
-        from apps.building.views import _default_serializer
-        from datetime import datetime
-
-        dt = datetime(2023, 1, 1, 12, 0, 0)
-        result = _default_serializer(dt)
-        self.assertEqual(result, "2023-01-01T12:00:00")
-
-    def test_default_serializer_date(self):
-        """Test _default_serializer with date"""
-        from apps.building.views import _default_serializer
-        from datetime import date
-
-        d = date(2023, 1, 1)
-        result = _default_serializer(d)
-        self.assertEqual(result, "2023-01-01")
-
-    def test_default_serializer_decimal(self):
-        """Test _default_serializer with Decimal"""
-        from apps.building.views import _default_serializer
-        from decimal import Decimal
-
-        dec = Decimal("123.45")
-        result = _default_serializer(dec)
-        self.assertEqual(result, "123.45")
-
-    def test_default_serializer_string(self):
-        """Test _default_serializer with string"""
-        from apps.building.views import _default_serializer
-
-        result = _default_serializer("test")
-        self.assertEqual(result, "test")
-
     def test_to_primitive_dataclass(self):
-        """Test _to_primitive with dataclass"""
-        from apps.building.views import _to_primitive
+        """Test to_primitive with dataclass"""
+        from common.utils.json_util import to_primitive
         from common.models.building import Building
 
         building = Building(bbl="1234567890")
-        result = _to_primitive(building)
+        result = to_primitive(building)
         self.assertIsInstance(result, dict)
         self.assertEqual(result["bbl"], "1234567890")
 
     def test_to_primitive_dict(self):
-        """Test _to_primitive with dict"""
-        from apps.building.views import _to_primitive
+        """Test to_primitive with dict"""
+        from common.utils.json_util import to_primitive
         from datetime import datetime
 
         data = {"bbl": "1234567890", "date": datetime(2023, 1, 1, 12, 0, 0)}
-        result = _to_primitive(data)
+        result = to_primitive(data)
         self.assertEqual(result["bbl"], "1234567890")
         self.assertEqual(result["date"], "2023-01-01T12:00:00")
 
     def test_to_primitive_list(self):
-        """Test _to_primitive with list"""
-        from apps.building.views import _to_primitive
+        """Test to_primitive with list"""
+        from common.utils.json_util import to_primitive
         from datetime import date
 
         data = [date(2023, 1, 1), date(2023, 1, 2)]
-        result = _to_primitive(data)
+        result = to_primitive(data)
         self.assertEqual(result, ["2023-01-01", "2023-01-02"])
 
     def test_to_primitive_decimal(self):
-        """Test _to_primitive with Decimal"""
-        from apps.building.views import _to_primitive
+        """Test to_primitive with Decimal"""
+        from common.utils.json_util import to_primitive
         from decimal import Decimal
 
-        result = _to_primitive(Decimal("123.45"))
+        result = to_primitive(Decimal("123.45"))
         self.assertEqual(result, "123.45")
 
     def test_is_empty_building_empty(self):
@@ -1092,31 +1306,38 @@ class BuildingViewsHelperFunctionTests(TestCase):
         result = _is_empty_building(building)
         self.assertFalse(result)
 
-    def test_safe_len_with_none(self):
-        """Test _safe_len with None value"""
-        from apps.building.views import _safe_len
-
-        result = _safe_len(None)
-        self.assertEqual(result, 0)
-
-    def test_safe_len_with_list(self):
-        """Test _safe_len with list"""
-        from apps.building.views import _safe_len
-
-        result = _safe_len([1, 2, 3])
-        self.assertEqual(result, 3)
-
-    def test_sum_dict_values_len_with_none(self):
-        """Test _sum_dict_values_len with None"""
-        from apps.building.views import _sum_dict_values_len
 
-        result = _sum_dict_values_len(None)
-        self.assertEqual(result, 0)
+class BuildingMigrationTests(TestCase):
+    def test_building_tables_and_indexes_exist(self):
+        """Migrations create every building_* table and the query indexes"""
+        from django.db import connection
 
-    def test_sum_dict_values_len_with_dict(self):
-        """Test _sum_dict_values_len with dict"""
-        from apps.building.views import _sum_dict_values_len
-
-        data = {"key1": [1, 2, 3], "key2": [4, 5], "key3": None}
-        result = _sum_dict_values_len(data)
-        self.assertEqual(result, 5)  # 3 + 2 + 0
+        migration = importlib.import_module(
+            "apps.building.migrations.0002_building_indexes"
+        )
+        with connection.cursor() as cur:
+            cur.execute(
+                "SELECT tablename FROM pg_tables WHERE tablename LIKE 'building\\_%%'"
+            )
+            tables = {r[0] for r in cur.fetchall()}
+            cur.execute(
+                "SELECT indexname FROM pg_indexes WHERE tablename LIKE 'building\\_%%'"
+            )
+            indexes = {r[0] for r in cur.fetchall()}
+
+        self.assertTrue(
+            {
+                "building_registrations",
+                "building_registration_contacts",
+                "building_affordable_housing",
+                "building_complaints",
+                "building_violations",
+                "building_evictions",
+                "building_rent_stabilized_list",
+                "building_acris_master",
+                "building_acris_legals",
+                "building_acris_parties",
+            }.issubset(tables)
+        )
+        for name, _ in migration.INDEXES:
+            self.assertIn(name, indexes)
@@ -1,9 +1,18 @@
 from django.urls import path
 
-from .views import BuildingByBblView
+from .views import BuildingByBblView, BuildingCollectionView
 
 urlpatterns = [
     path(
         "", BuildingByBblView.as_view(), name="building_by_bbl"
     ),  # GET /api/building?bbl=1000010001
+    # GET /api/building/violations?bbl=1000010001&cursor=...
+    *(
+        path(
+            f"{name}/",
+            BuildingCollectionView.as_view(collection=name),
+            name=f"building_{name}",
+        )
+        for name in ("violations", "complaints", "evictions")
+    ),
 ]
@@ -1,122 +1,228 @@
-from dataclasses import asdict, is_dataclass
-from datetime import date, datetime
-from decimal import Decimal
-from typing import Any
+from dataclasses import fields
+from functools import partial
 
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from infrastructures.postgres.building_repository import BuildingRepository
-
-
-def _default_serializer(obj: Any):
-    # dataclass → dict
-    if is_dataclass(obj):
-        return asdict(obj)
-    # datetime/date → iso
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    # Decimal → str (금액 손실 방지)
-    if isinstance(obj, Decimal):
-        return str(obj)
-    # 나머지는 문자열 변환
-    return str(obj)
-
-
-def _to_primitive(value):
-    """중첩된 dataclass/리스트/딕셔너리를 전부 기본 타입으로 변환"""
-    if is_dataclass(value):
-        value = asdict(value)
-    if isinstance(value, dict):
-        return {k: _to_primitive(v) for k, v in value.items()}
-    if isinstance(value, list):
-        return [_to_primitive(v) for v in value]
-    if isinstance(value, (datetime, date)):
-        return value.isoformat()
-    if isinstance(value, Decimal):
-        return str(value)
-    return value
+from common.exceptions.db_error import DatabaseError, DatabaseTimeoutError
+from common.models.building import SECTION_FIELDS
+from infrastructures.postgres.building_repository import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    BuildingRepository,
+)
+from infrastructures.postgres.profile_cache import get_profile_cache
+from middlewares.conditional_get import conditional_get
 
 
 def _is_empty_building(b) -> bool:
-    """등록/태그/컨텐츠가 전혀 없으면 비어있다고 간주 (취향껏 조정)"""
+    """로드된 섹션에 데이터가 전혀 없으면 비어있다고 간주 (sections= 로 일부만 요청한 경우 포함)"""
+    loaded = b.loaded_sections
+    if "counts" in loaded and any((b.counts or {}).values()):
+        return False
     return all(
-        [
-            b.registration is None,
-            b.rent_stabilized is None,
-            not b.contacts,
-            not b.affordable,
-            not b.complaints,
-            not b.violations,
-            not b.evictions,
-            not b.acris_master,
-            not b.acris_legals,
-            not b.acris_parties,
-        ]
+        getattr(b, f) in (None, [], {})
+        for section in loaded - {"counts"}
+        for f in SECTION_FIELDS[section]
     )
 
 
-def _safe_len(x):
-    return len(x) if x is not None else 0
+def _parse_sections(raw: str):
+    """'registration,counts' -> frozenset; None if any name is unknown."""
+    names = frozenset(s.strip() for s in raw.split(",") if s.strip())
+    if not names or names - set(SECTION_FIELDS):
+        return None
+    return names
 
 
-def _sum_dict_values_len(d):
-    if not isinstance(d, dict):
-        return 0
-    return sum(len(v) for v in d.values() if v is not None)
+def _parse_limit(raw):
+    """Page size from ?limit= (default DEFAULT_PAGE_SIZE); None if out of range."""
+    if raw is None:
+        return DEFAULT_PAGE_SIZE
+    try:
+        limit = int(raw)
+    except ValueError:
+        return None
+    return limit if 1 <= limit <= MAX_PAGE_SIZE else None
+
+
+def _invalid_limit_response():
+    return Response(
+        {
+            "detail": f"Invalid limit. Expected an integer between 1 and {MAX_PAGE_SIZE}."
+        },
+        status=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+def _invalid_bbl_response(bbl):
+    """400 response for a missing/malformed bbl, None when it is valid."""
+    if not bbl:
+        return Response(
+            {"detail": "Query parameter 'bbl' is required."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    if not (len(bbl) == 10 and bbl.isdigit()):
+        return Response(
+            {"detail": "Invalid bbl format. Expected 10-digit numeric string."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return None
+
+
+def _load_building(bbl, sections, limit):
+    """Building for the profile view, or None when the API answers 404."""
+    # 크롤러가 갱신하는 snapshot 을 먼저 PK 로 읽고, 없으면 한 문장 프로필로 조립
+    repo = BuildingRepository(single_query=True, snapshot=True)
+    building = repo.get_by_bbl(
+        bbl,
+        sections=sections if sections is not None else frozenset(SECTION_FIELDS),
+        page_size=limit,
+    )
+    if building is None or _is_empty_building(building):
+        return None
+    return building
+
+
+def _cached_building(bbl, sections, limit):
+    load = partial(_load_building, bbl, sections, limit)
+    cache = get_profile_cache()
+    try:
+        cache.data_version()
+    except DatabaseError:
+        # 데이터 버전을 못 읽으면 캐시를 건너뛰고 직접 조회 (조회도 실패하면 그 오류로)
+        return load()
+    # 같은 (bbl, sections, limit) 은 워커 캐시에서 (404 포함), 크롤러 적재 시 무효화
+    return cache.get_or_load((bbl, sections, limit), load)
 
 
 class BuildingByBblView(APIView):
     """
     GET /api/building?bbl=1000010001
+    GET /api/building?bbl=1000010001&sections=registration,counts
+
+    sections= limits the response (and the queries) to the named sections:
+    registration, rent_stabilized, contacts, affordable, complaints,
+    violations, evictions, acris, counts. Without it every section is
+    returned. counts are computed in SQL.
+
+    violations, complaints and evictions hold only the newest limit= rows
+    (default DEFAULT_PAGE_SIZE); cursors[name] is the cursor= for the next
+    page on /api/building/<name>/ (null when everything fit).
+
+    Responses (404s included) are served from the per-worker ProfileCache
+    until its TTL passes or a crawler load bumps the data version; the
+    same version backs ETag / Last-Modified, so revalidations get a 304.
+    If the data version cannot be read the cache is bypassed.
     """
 
     permission_classes = [AllowAny]
 
+    @conditional_get()
     def get(self, request):
         bbl = request.query_params.get("bbl")
-        if not bbl:
-            return Response(
-                {"detail": "Query parameter 'bbl' is required."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        if not (len(bbl) == 10 and bbl.isdigit()):
-            return Response(
-                {"detail": "Invalid bbl format. Expected 10-digit numeric string."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+        invalid = _invalid_bbl_response(bbl)
+        if invalid is not None:
+            return invalid
+
+        sections = None
+        raw_sections = request.query_params.get("sections")
+        if raw_sections is not None:
+            sections = _parse_sections(raw_sections)
+            if sections is None:
+                return Response(
+                    {
+                        "detail": "Invalid sections. Expected a comma-separated list of: "
+                        + ", ".join(SECTION_FIELDS)
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        limit = _parse_limit(request.query_params.get("limit"))
+        if limit is None:
+            return _invalid_limit_response()
 
         try:
-            repo = BuildingRepository()
-            building = repo.get_by_bbl(bbl)
+            building = _cached_building(bbl, sections, limit)
+        except DatabaseTimeoutError:
+            raise
         except Exception as e:
             return Response(
                 {"detail": f"Internal error while fetching building: {e}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        if building is None or _is_empty_building(building):
+        if building is None:
             return Response(
                 {"detail": "Building not found for given bbl."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        payload = _to_primitive(building)
-        payload["counts"] = {
-            "contacts": _safe_len(getattr(building, "contacts", None)),
-            "affordable": _safe_len(getattr(building, "affordable", None)),
-            "complaints": _safe_len(getattr(building, "complaints", None)),
-            "violations": _safe_len(getattr(building, "violations", None)),
-            "evictions": _safe_len(getattr(building, "evictions", None)),
-            "acris_docs": _safe_len(getattr(building, "acris_master", None)),
-            "acris_legals": _sum_dict_values_len(
-                getattr(building, "acris_legals", None)
-            ),
-            "acris_parties": _sum_dict_values_len(
-                getattr(building, "acris_parties", None)
-            ),
-        }
+        # 모델 객체 그대로 응답 - OkJSONRenderer 가 한 번에 JSON 으로 인코딩
+        if sections is None:
+            payload = {f.name: getattr(building, f.name) for f in fields(building)}
+            return Response(payload, status=status.HTTP_200_OK)
+
+        payload = {"bbl": building.bbl}
+        for section in SECTION_FIELDS:
+            if section in sections:
+                for f in SECTION_FIELDS[section]:
+                    payload[f] = getattr(building, f)
+        if building.cursors:
+            payload["cursors"] = building.cursors
         return Response(payload, status=status.HTTP_200_OK)
+
+
+class BuildingCollectionView(APIView):
+    """
+    GET /api/building/violations?bbl=1000010001
+    GET /api/building/violations?bbl=1000010001&cursor=<next_cursor>&limit=100
+
+    One page of violations / complaints / evictions, newest first. Pass
+    next_cursor back as cursor= for the following page; it is null on the
+    last page.
+    """
+
+    permission_classes = [AllowAny]
+    collection = None  # as_view(collection="violations")
+
+    @conditional_get()
+    def get(self, request):
+        bbl = request.query_params.get("bbl")
+        invalid = _invalid_bbl_response(bbl)
+        if invalid is not None:
+            return invalid
+
+        limit = _parse_limit(request.query_params.get("limit"))
+        if limit is None:
+            return _invalid_limit_response()
+
+        try:
+            repo = BuildingRepository()
+            page = repo.get_collection_page(
+                bbl,
+                self.collection,
+                cursor=request.query_params.get("cursor") or None,
+                limit=limit,
+            )
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except DatabaseTimeoutError:
+            raise
+        except Exception as e:
+            return Response(
+                {"detail": f"Internal error while fetching {self.collection}: {e}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        return Response(
+            {
+                "bbl": bbl,
+                self.collection: page.items,
+                "next_cursor": page.next_cursor,
+                "limit": page.limit,
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -30,13 +30,11 @@ class DummyItemListCreateView(APIView):
     def get(self, request):
         try:
             with PostgresClient() as db:
-                rows = db.query_all(
-                    """
+                rows = db.query_all("""
                     SELECT id, title, detail, created_at, updated_at
                     FROM demo_item
                     ORDER BY id DESC
-                    """
-                )
+                    """)
             data = [_row_to_item(r) for r in rows]
             return Response(data, status=status.HTTP_200_OK)
         except DatabaseError as e:
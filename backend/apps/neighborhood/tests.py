@@ -253,48 +253,72 @@ class NeighborhoodViewsAPITests(TestCase):
         except Exception as e:
             self.skipTest(f"Database connection failed: {e}")
 
+    def test_heatmap_view_timeout_returns_504(self):
+        """A statement timeout surfaces as a clean 504 instead of a 500"""
+        from unittest.mock import patch
+
+        from common.exceptions.db_error import DatabaseTimeoutError
+
+        params = {
+            "min_lat": "40.0",
+            "max_lat": "41.0",
+            "min_lng": "-75.0",
+            "max_lng": "-73.0",
+            "data_type": "violations",
+        }
+        with patch(
+            "apps.neighborhood.views.NeighborhoodRepository.get_heatmap_batch",
+            side_effect=DatabaseTimeoutError("canceling statement"),
+        ):
+            response = self.client.get(self.heatmap_url, params)
+        self.assertEqual(response.status_code, 504)
+        self.assertEqual(
+            response.json(),
+            {"result": False, "error_message": "Database query timed out."},
+        )
+
 
 class NeighborhoodViewsHelperFunctionTests(TestCase):
     def test_to_primitive_dataclass(self):
-        """Test _to_primitive with dataclass"""
-        from apps.neighborhood.views import _to_primitive
+        """Test to_primitive with dataclass"""
+        from common.utils.json_util import to_primitive
         from common.models.building import Building
 
         building = Building(bbl="1234567890")
-        result = _to_primitive(building)
+        result = to_primitive(building)
         self.assertIsInstance(result, dict)
         self.assertEqual(result["bbl"], "1234567890")
 
     def test_to_primitive_dict(self):
-        """Test _to_primitive with dict"""
-        from apps.neighborhood.views import _to_primitive
+        """Test to_primitive with dict"""
+        from common.utils.json_util import to_primitive
         from datetime import datetime
 
         data = {"bbl": "1234567890", "date": datetime(2023, 1, 1, 12, 0, 0)}
-        result = _to_primitive(data)
+        result = to_primitive(data)
         self.assertEqual(result["bbl"], "1234567890")
         self.assertEqual(result["date"], "2023-01-01T12:00:00")
 
     def test_to_primitive_list(self):
-        """Test _to_primitive with list"""
-        from apps.neighborhood.views import _to_primitive
+        """Test to_primitive with list"""
+        from common.utils.json_util import to_primitive
         from datetime import date
 
         data = [date(2023, 1, 1), date(2023, 1, 2)]
-        result = _to_primitive(data)
+        result = to_primitive(data)
         self.assertEqual(result, ["2023-01-01", "2023-01-02"])
 
     def test_to_primitive_decimal(self):
-        """Test _to_primitive with Decimal"""
-        from apps.neighborhood.views import _to_primitive
+        """Test to_primitive with Decimal"""
+        from common.utils.json_util import to_primitive
         from decimal import Decimal
 
-        result = _to_primitive(Decimal("123.45"))
+        result = to_primitive(Decimal("123.45"))
         self.assertEqual(result, "123.45")
 
     def test_to_primitive_nested_structure(self):
-        """Test _to_primitive with nested structure"""
-        from apps.neighborhood.views import _to_primitive
+        """Test to_primitive with nested structure"""
+        from common.utils.json_util import to_primitive
         from datetime import datetime
         from decimal import Decimal
 
@@ -306,7 +330,7 @@ class NeighborhoodViewsHelperFunctionTests(TestCase):
                 "list": [Decimal("100"), datetime(2023, 1, 2)],
             }
         }
-        result = _to_primitive(data)
+        result = to_primitive(data)
         self.assertEqual(result["building"]["bbl"], "1234567890")
         self.assertEqual(result["building"]["amount"], "1000.50")
         self.assertEqual(result["building"]["date"], "2023-01-01T12:00:00")
@@ -1,28 +1,11 @@
-from dataclasses import asdict, is_dataclass
-from datetime import date, datetime
-from decimal import Decimal
-
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from common.exceptions.db_error import DatabaseTimeoutError
 from infrastructures.postgres.neighborhood_repository import NeighborhoodRepository
-
-
-def _to_primitive(value):
-    """Convert nested dataclass/list/dict to primitive types"""
-    if is_dataclass(value):
-        value = asdict(value)
-    if isinstance(value, dict):
-        return {k: _to_primitive(v) for k, v in value.items()}
-    if isinstance(value, list):
-        return [_to_primitive(v) for v in value]
-    if isinstance(value, (datetime, date)):
-        return value.isoformat()
-    if isinstance(value, Decimal):
-        return str(value)
-    return value
+from middlewares.conditional_get import conditional_get
 
 
 class NeighborhoodStatsView(APIView):
@@ -34,6 +17,7 @@ class NeighborhoodStatsView(APIView):
 
     permission_classes = [AllowAny]
 
+    @conditional_get(daily=True)
     def get(self, request):
         # Get query parameters
         min_lat = request.query_params.get("min_lat")
@@ -82,8 +66,8 @@ class NeighborhoodStatsView(APIView):
                 data_type=data_type,
             )
 
-            # Convert to primitive types for JSON serialization
-            payload = _to_primitive(stats)
+            # Dataclasses are encoded by OkJSONRenderer
+            payload = stats
 
             return Response(
                 {
@@ -101,6 +85,8 @@ class NeighborhoodStatsView(APIView):
                 status=status.HTTP_200_OK,
             )
 
+        except DatabaseTimeoutError:
+            raise
         except Exception as e:
             return Response(
                 {"detail": f"Internal error while fetching neighborhood stats: {e}"},
@@ -117,6 +103,7 @@ class HeatmapDataView(APIView):
 
     permission_classes = [AllowAny]
 
+    @conditional_get(daily=True)
     def get(self, request):
         # Get query parameters
         min_lat = request.query_params.get("min_lat")
@@ -162,7 +149,8 @@ class HeatmapDataView(APIView):
 
         try:
             repo = NeighborhoodRepository()
-            heatmap_data = repo.get_heatmap_data(
+            # Columnar HeatmapBatch; OkJSONRenderer encodes the columns in one pass
+            payload = repo.get_heatmap_batch(
                 min_lat=min_lat,
                 max_lat=max_lat,
                 min_lng=min_lng,
@@ -172,9 +160,6 @@ class HeatmapDataView(APIView):
                 limit=limit,
             )
 
-            # Convert to primitive types for JSON serialization
-            payload = _to_primitive(heatmap_data)
-
             return Response(
                 {
                     "result": True,
@@ -192,6 +177,8 @@ class HeatmapDataView(APIView):
                 status=status.HTTP_200_OK,
             )
 
+        except DatabaseTimeoutError:
+            raise
         except Exception as e:
             return Response(
                 {"detail": f"Internal error while fetching heatmap data: {e}"},
@@ -208,6 +195,7 @@ class BoroughSummaryView(APIView):
 
     permission_classes = [AllowAny]
 
+    @conditional_get(daily=True)
     def get(self, request):
         borough = request.query_params.get("borough")
 
@@ -215,8 +203,7 @@ class BoroughSummaryView(APIView):
             repo = NeighborhoodRepository()
             summary = repo.get_borough_summary(borough=borough)
 
-            # Convert to primitive types for JSON serialization
-            payload = _to_primitive(summary)
+            payload = summary
 
             return Response(
                 {
@@ -228,6 +215,8 @@ class BoroughSummaryView(APIView):
                 status=status.HTTP_200_OK,
             )
 
+        except DatabaseTimeoutError:
+            raise
         except Exception as e:
             return Response(
                 {"detail": f"Internal error while fetching borough summary: {e}"},
@@ -244,6 +233,7 @@ class NeighborhoodTrendsView(APIView):
 
     permission_classes = [AllowAny]
 
+    @conditional_get(daily=True)
     def get(self, request):
         bbl = request.query_params.get("bbl")
         days_back = request.query_params.get("days_back", "365")
@@ -277,14 +267,15 @@ class NeighborhoodTrendsView(APIView):
             repo = NeighborhoodRepository()
             trends = repo.get_neighborhood_trends(bbl=bbl, days_back=days_back)
 
-            # Convert to primitive types for JSON serialization
-            payload = _to_primitive(trends)
+            payload = trends
 
             return Response(
                 {"result": True, "data": payload, "bbl": bbl, "days_back": days_back},
                 status=status.HTTP_200_OK,
             )
 
+        except DatabaseTimeoutError:
+            raise
         except Exception as e:
             return Response(
                 {"detail": f"Internal error while fetching trends: {e}"},
@@ -0,0 +1 @@
+# Owner app for Housing Transparency
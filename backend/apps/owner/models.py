@@ -0,0 +1 @@
+# Create your models here.
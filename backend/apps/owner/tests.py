@@ -0,0 +1,121 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from common.exceptions.db_error import DatabaseTimeoutError
+from common.models.owner import OwnerBuilding, OwnerPortfolio
+from infrastructures.postgres.profile_cache import DataVersion, ProfileCache
+
+PORTFOLIO = OwnerPortfolio(
+    name="RODRIGUEZ 0 LLC",
+    names=["RODRIGUEZ 0 LLC", "Rodriguez 0, L.L.C."],
+    total_buildings=2,
+    total_violations=7,
+    open_violations=3,
+    total_evictions=1,
+    open_complaints=2,
+    buildings=[
+        OwnerBuilding(
+            bbl="2001210090",
+            address="1124 VICTORY BOULEVARD",
+            borough="BRONX",
+            zip_code="10457",
+            sources=["acris", "registration"],
+            total_violations=5,
+            open_violations=3,
+            total_evictions=1,
+            open_complaints=2,
+        ),
+        OwnerBuilding(bbl="1013510030", sources=["registration"], total_violations=2),
+    ],
+)
+
+
+class OwnerViewsAPITests(TestCase):
+    def setUp(self):
+        self.owner_url = "/api/owner/"
+
+    def test_owner_portfolio_view_success(self):
+        """Test GET /api/owner/ returns the portfolio totals and its buildings"""
+        with patch(
+            "apps.owner.views.OwnerRepository.get_portfolio", return_value=PORTFOLIO
+        ) as get_portfolio:
+            response = self.client.get(
+                self.owner_url, {"name": " Rodriguez 0, L.L.C. ", "limit": "10"}
+            )
+        self.assertEqual(response.status_code, 200)
+        get_portfolio.assert_called_once_with("Rodriguez 0, L.L.C.", limit=10)
+
+        body = response.json()
+        self.assertTrue(body["result"])
+        self.assertEqual(body["limit"], 10)
+        self.assertEqual(body["data"]["name"], "RODRIGUEZ 0 LLC")
+        self.assertEqual(body["data"]["total_buildings"], 2)
+        self.assertEqual(body["data"]["open_violations"], 3)
+        self.assertEqual(
+            [b["bbl"] for b in body["data"]["buildings"]], ["2001210090", "1013510030"]
+        )
+        self.assertEqual(
+            body["data"]["buildings"][0]["sources"], ["acris", "registration"]
+        )
+
+    def test_owner_portfolio_view_missing_name(self):
+        """Test a missing or blank name is rejected"""
+        for params in ({}, {"name": "   "}):
+            response = self.client.get(self.owner_url, params)
+            self.assertEqual(response.status_code, 400)
+            self.assertIn("detail", response.data)
+
+    def test_owner_portfolio_view_invalid_limit(self):
+        """Test limit= outside 1..MAX_PORTFOLIO_SIZE is rejected"""
+        for limit in ("0", "abc", "100000"):
+            response = self.client.get(
+                self.owner_url, {"name": "RODRIGUEZ 0 LLC", "limit": limit}
+            )
+            self.assertEqual(response.status_code, 400)
+
+    def test_owner_portfolio_view_not_found(self):
+        """Test an owner without linked buildings is a 404"""
+        with patch("apps.owner.views.OwnerRepository.get_portfolio", return_value=None):
+            response = self.client.get(self.owner_url, {"name": "NOBODY"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_owner_portfolio_view_timeout_returns_504(self):
+        """A statement timeout surfaces as a clean 504 instead of a 500"""
+        with patch(
+            "apps.owner.views.OwnerRepository.get_portfolio",
+            side_effect=DatabaseTimeoutError("canceling statement"),
+        ):
+            response = self.client.get(self.owner_url, {"name": "RODRIGUEZ 0 LLC"})
+        self.assertEqual(response.status_code, 504)
+
+    def test_owner_portfolio_view_not_modified(self):
+        """Test If-None-Match with the current ETag is a 304 without repository queries"""
+        cache = ProfileCache(max_size=0, version_loader=lambda: DataVersion(1, None))
+        with patch(
+            "middlewares.conditional_get.get_profile_cache", return_value=cache
+        ), patch(
+            "apps.owner.views.OwnerRepository.get_portfolio", return_value=PORTFOLIO
+        ) as get_portfolio:
+            params = {"name": "RODRIGUEZ 0 LLC"}
+            first = self.client.get(self.owner_url, params)
+            second = self.client.get(
+                self.owner_url, params, HTTP_IF_NONE_MATCH=first["ETag"]
+            )
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(get_portfolio.call_count, 1)
+
+    def test_owner_portfolio_view_live(self):
+        """Test the endpoint end to end against the database"""
+        try:
+            response = self.client.get(
+                self.owner_url, {"name": "rodriguez 0 llc", "limit": "5"}
+            )
+        except Exception as e:
+            self.skipTest(f"Database connection failed: {e}")
+        if response.status_code != 200:
+            self.skipTest("Owner index is empty or unavailable")
+        data = response.json()["data"]
+        self.assertEqual(data["name"], "RODRIGUEZ 0 LLC")
+        self.assertLessEqual(len(data["buildings"]), 5)
+        self.assertGreaterEqual(data["total_buildings"], len(data["buildings"]))
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import OwnerPortfolioView
+
+urlpatterns = [
+    path("", OwnerPortfolioView.as_view(), name="owner_portfolio"),
+]
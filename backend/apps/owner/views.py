@@ -0,0 +1,78 @@
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from common.exceptions.db_error import DatabaseTimeoutError
+from infrastructures.postgres.owner_repository import (
+    DEFAULT_PORTFOLIO_SIZE,
+    MAX_PORTFOLIO_SIZE,
+    OwnerRepository,
+)
+from middlewares.conditional_get import conditional_get
+
+
+class OwnerPortfolioView(APIView):
+    """
+    GET /api/owner/?name=RODRIGUEZ%200%20LLC&limit=100
+
+    Every building linked to an owner name through HPD registration
+    contacts or ACRIS deeds, with violation / eviction / open complaint
+    counts per building and for the whole portfolio.
+
+    The name is matched after normalization (case, punctuation and spacing
+    are ignored, so "Rodriguez 0, L.L.C." finds "RODRIGUEZ 0 LLC").
+    Totals cover every building; `buildings` lists at most `limit` of them,
+    most open violations first.
+    """
+
+    permission_classes = [AllowAny]
+
+    @conditional_get()
+    def get(self, request):
+        name = (request.query_params.get("name") or "").strip()
+        limit = request.query_params.get("limit", str(DEFAULT_PORTFOLIO_SIZE))
+
+        if not name:
+            return Response(
+                {"detail": "Missing required parameter: name"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            limit = int(limit)
+        except (ValueError, TypeError):
+            return Response(
+                {"detail": "Invalid limit value. Must be a valid integer."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if limit <= 0 or limit > MAX_PORTFOLIO_SIZE:
+            return Response(
+                {
+                    "detail": f"Invalid limit. Must be between 1 and {MAX_PORTFOLIO_SIZE}."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            repo = OwnerRepository()
+            portfolio = repo.get_portfolio(name, limit=limit)
+        except DatabaseTimeoutError:
+            raise
+        except Exception as e:
+            return Response(
+                {"detail": f"Internal error while fetching owner portfolio: {e}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        if portfolio is None:
+            return Response(
+                {"detail": "No buildings found for given owner name."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        # 모델 객체 그대로 응답 - OkJSONRenderer 가 한 번에 JSON 으로 인코딩
+        return Response(
+            {"result": True, "data": portfolio, "limit": limit},
+            status=status.HTTP_200_OK,
+        )
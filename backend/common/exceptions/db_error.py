@@ -1,2 +1,11 @@
 class DatabaseError(Exception):
     pass
+
+
+class DatabaseTimeoutError(DatabaseError):
+    """Statement timeout (504) or no pooled connection in time (503)."""
+
+    def __init__(self, message="Database timeout", status=504):
+        self.message = message
+        self.status = status
+        super().__init__(message)
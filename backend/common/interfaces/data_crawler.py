@@ -3,6 +3,11 @@ from typing import Any, Dict, List
 
 
 class DataCrawler(ABC):
+    # load() 가 PostgresClient.bulk_insert 의 COPY 경로를 쓸지 여부 (대용량 테이블용)
+    USE_COPY = False
+    # load() 후 building_profile_snapshot 을 다시 만들 BBL 을 찾는 행 키 (bbl / registration_id / document_id)
+    SNAPSHOT_KEY = "bbl"
+
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -6,7 +6,7 @@ from decimal import Decimal
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AcrisMaster:
     document_id: str
     borough: Optional[int]
@@ -15,7 +15,7 @@ class AcrisMaster:
     doc_amount: Optional[Decimal]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AcrisLegal:
     document_id: str
     bbl: Optional[str]
@@ -24,7 +24,7 @@ class AcrisLegal:
     lot: Optional[int]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AcrisParty:
     document_id: str
     party_type: Optional[str]
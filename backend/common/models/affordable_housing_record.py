@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AffordableHousingRecord:
     project_id: int
     bbl: Optional[str]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 from common.models.acris import AcrisLegal, AcrisMaster, AcrisParty
 from common.models.affordable_housing_record import AffordableHousingRecord
@@ -13,6 +16,30 @@ from common.models.registration_contact import RegistrationContact
 from common.models.rent_stabilized_tag import RentStabilizedTag
 from common.models.violation import Violation
 
+# /api/building 의 sections= 이름 -> Building 필드
+SECTION_FIELDS: Dict[str, tuple] = {
+    "registration": ("registration",),
+    "rent_stabilized": ("rent_stabilized",),
+    "contacts": ("contacts",),
+    "affordable": ("affordable",),
+    "complaints": ("complaints",),
+    "violations": ("violations",),
+    "evictions": ("evictions",),
+    "acris": ("acris_master", "acris_legals", "acris_parties"),
+    "counts": ("counts",),
+}
+# 행을 가져오는 섹션 (counts 는 SQL 집계만)
+ROW_SECTIONS = frozenset(SECTION_FIELDS) - {"counts"}
+_FIELD_SECTION = {f: name for name, fs in SECTION_FIELDS.items() for f in fs}
+
+# 중복 제거하는 컬렉션 필드 -> 키 (DB 에서는 모두 PK)
+COLLECTION_KEYS: Dict[str, Callable[[Any], Any]] = {
+    "affordable": attrgetter("project_id"),
+    "complaints": attrgetter("complaint_id"),
+    "violations": attrgetter("violation_id"),
+    "evictions": lambda e: (e.docket_number or "", e.court_index_number or ""),
+}
+
 
 @dataclass
 class Building:
@@ -27,6 +54,60 @@ class Building:
     acris_legals: Dict[str, List[AcrisLegal]] = field(default_factory=dict)
     acris_parties: Dict[str, List[AcrisParty]] = field(default_factory=dict)
     evictions: List[Eviction] = field(default_factory=list)
+    # 섹션별 행 수 (sections=counts 로 요청했을 때만 SQL 로 채워짐)
+    counts: Optional[Dict[str, int]] = None
+    # 페이지로 잘린 컬렉션의 다음 페이지 cursor (마지막 페이지면 None)
+    cursors: Optional[Dict[str, Optional[str]]] = None
+
+    def __post_init__(self):
+        # None 이면 모든 행 섹션이 로드된 상태 (기존 동작)
+        self._loaded: Optional[FrozenSet[str]] = None
+        self._loader: Optional[Callable[[Building, FrozenSet[str]], None]] = None
+        # 컬렉션별 (색인한 list, 색인 시점 길이, 키 집합) - add_* 의 중복 검사용
+        self._keys: Dict[str, Tuple[list, int, Set[Any]]] = {}
+
+    # ---------- lazy sections ----------
+
+    @property
+    def loaded_sections(self) -> FrozenSet[str]:
+        if self._loaded is None:
+            return ROW_SECTIONS | ({"counts"} if self.counts is not None else set())
+        return self._loaded
+
+    def is_loaded(self, section: str) -> bool:
+        return section in self.loaded_sections
+
+    def set_lazy(
+        self,
+        loaded: Iterable[str],
+        loader: Optional[Callable[[Building, FrozenSet[str]], None]],
+    ) -> None:
+        """Mark only `loaded` as fetched; `loader(building, sections)` fills the rest on demand."""
+        self._loaded = frozenset(loaded)
+        self._loader = loader
+
+    def load(self, *sections: str) -> Building:
+        """Fetch any of `sections` that are not loaded yet (no-op otherwise)."""
+        unknown = set(sections) - set(SECTION_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown building sections: {sorted(unknown)}")
+        missing = frozenset(sections) - self.loaded_sections
+        if missing:
+            if self._loader is None:
+                raise ValueError(f"Sections not loaded: {sorted(missing)}")
+            self._loader(self, missing)
+            self._loaded = self.loaded_sections | missing
+        return self
+
+    def section(self, name: str):
+        """Field value, loading its section first if needed (e.g. "violations")."""
+        self.load(_FIELD_SECTION.get(name, name))
+        return getattr(self, name)
+
+    def copy_sections(self, other: Building, sections: Iterable[str]) -> None:
+        for name in sections:
+            for f in SECTION_FIELDS[name]:
+                setattr(self, f, getattr(other, f))
 
     def set_registration(self, r: Registration):
         if r and r.bbl == self.bbl:
@@ -36,33 +117,58 @@ class Building:
         if tag and tag.bbl == self.bbl:
             self.rent_stabilized = tag
 
+    # ---------- collections ----------
+
+    def _key_index(self, name: str) -> Set[Any]:
+        """
+        Keys already in collection `name`. Rebuilt only when the list was
+        replaced or changed in length outside add_*/extend_unique.
+        """
+        items = getattr(self, name)
+        cached = self._keys.get(name)
+        if cached is None or cached[0] is not items or cached[1] != len(items):
+            key = COLLECTION_KEYS[name]
+            cached = (items, len(items), {key(x) for x in items})
+            self._keys[name] = cached
+        return cached[2]
+
+    def _contains(self, name: str, item) -> bool:
+        return COLLECTION_KEYS[name](item) in self._key_index(name)
+
+    def _append(self, name: str, item) -> None:
+        keys = self._key_index(name)
+        items = getattr(self, name)
+        items.append(item)
+        keys.add(COLLECTION_KEYS[name](item))
+        self._keys[name] = (items, len(items), keys)
+
+    def extend_unique(self, name: str, items: Iterable[Any]) -> None:
+        """
+        Bulk append to a collection without per-item duplicate checks, for
+        rows already unique by key (e.g. PK rows straight from SQL).
+        """
+        getattr(self, name).extend(items)
+        self._keys.pop(name, None)
+
     def add_contact(self, c: RegistrationContact):
         self.contacts.append(c)
 
     def add_affordable(self, a: AffordableHousingRecord):
-        if a and all(x.project_id != a.project_id for x in self.affordable):
-            self.affordable.append(a)
+        if a and not self._contains("affordable", a):
+            self._append("affordable", a)
 
     def add_complaint(self, c: Complaint):
-        if c and all(x.complaint_id != c.complaint_id for x in self.complaints):
-            self.complaints.append(c)
+        if c and not self._contains("complaints", c):
+            self._append("complaints", c)
 
     def add_violation(self, v: Violation):
-        if v and all(x.violation_id != v.violation_id for x in self.violations):
-            if v.class_ is None and hasattr(v, "class"):
-                v.class_ = getattr(v, "class")
-            self.violations.append(v)
+        # "class" -> class_ 변환은 as_violation / dataclass_row(rename=...) 에서 끝남
+        if v and not self._contains("violations", v):
+            self._append("violations", v)
 
     def add_eviction(self, e: Eviction):
-        if not e:
-            return
-        key = (e.docket_number or "", e.court_index_number or "")
-        exists = any(
-            (x.docket_number or "", x.court_index_number or "") == key
-            for x in self.evictions
-        )
-        if not exists:
-            self.evictions.append(e)
+        if e and not self._contains("evictions", e):
+            self._append("evictions", e)
 
     def upsert_acris_master(self, m: AcrisMaster):
         if m and m.document_id:
@@ -77,6 +183,33 @@ class Building:
             self.acris_parties.setdefault(p.document_id, []).append(p)
 
 
+@dataclass
+class BuildingBatchResult:
+    """Result of a batched lookup: assembled buildings plus per-BBL errors."""
+
+    buildings: Dict[str, Building] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def __getitem__(self, bbl: str) -> Building:
+        return self.buildings[bbl]
+
+    def __contains__(self, bbl: object) -> bool:
+        return bbl in self.buildings
+
+    def __len__(self) -> int:
+        return len(self.buildings)
+
+
+@dataclass
+class CollectionPage:
+    """One keyset page of a building collection, newest first."""
+
+    items: List[Any] = field(default_factory=list)
+    # 다음 페이지 요청에 넘길 cursor (마지막 페이지면 None)
+    next_cursor: Optional[str] = None
+    limit: int = 0
+
+
 def as_registration(row: dict) -> Registration:
     return Registration(**row)
 
@@ -111,6 +244,9 @@ def as_acris_master(row: dict) -> AcrisMaster:
             row = {**row, "doc_amount": Decimal(amt)}
         except Exception:
             row = {**row, "doc_amount": None}
+    elif isinstance(amt, (int, float)) and not isinstance(amt, bool):
+        # JSON 으로 읽은 정수값 NUMERIC (예: 0) 도 다중 쿼리 경로처럼 Decimal 로
+        row = {**row, "doc_amount": Decimal(str(amt))}
     return AcrisMaster(**row)
 
 
@@ -128,37 +264,117 @@ def as_rent_tag(row: dict) -> RentStabilizedTag:
 
 def build_building_from_rows(
     bbl: str,
-    reg_row: Optional[dict],
-    contact_rows: List[dict],
-    affordable_rows: List[dict],
-    complaint_rows: List[dict],
-    violation_rows: List[dict],
-    acris_master_rows: List[dict],
-    acris_legal_rows: List[dict],
-    acris_party_rows: List[dict],
+    reg_row: Optional[dict] = None,
+    contact_rows: Optional[List[dict]] = None,
+    affordable_rows: Optional[List[dict]] = None,
+    complaint_rows: Optional[List[dict]] = None,
+    violation_rows: Optional[List[dict]] = None,
+    acris_master_rows: Optional[List[dict]] = None,
+    acris_legal_rows: Optional[List[dict]] = None,
+    acris_party_rows: Optional[List[dict]] = None,
     rent_tag_row: Optional[dict] = None,
     eviction_rows: Optional[List[dict]] = None,
+    unique: bool = False,
 ) -> Building:
+    """
+    unique=True: the collection rows are already unique by COLLECTION_KEYS
+    (PK rows from SQL) and are bulk-appended without duplicate checks.
+    """
     b = Building(bbl=bbl)
     if reg_row:
         b.set_registration(as_registration(reg_row))
     if rent_tag_row:
         b.set_rent_stabilized(as_rent_tag(rent_tag_row))
-    for r in contact_rows:
+    for r in contact_rows or ():
         b.add_contact(as_registration_contact(r))
-    for a in affordable_rows:
-        b.add_affordable(as_affordable(a))
-    for c in complaint_rows:
-        b.add_complaint(as_complaint(c))
-    for v in violation_rows:
-        b.add_violation(as_violation(v))
-    for m in acris_master_rows:
+    if unique:
+        b.extend_unique("affordable", map(as_affordable, affordable_rows or ()))
+        b.extend_unique("complaints", map(as_complaint, complaint_rows or ()))
+        b.extend_unique("violations", map(as_violation, violation_rows or ()))
+        b.extend_unique("evictions", map(as_eviction, eviction_rows or ()))
+    else:
+        for a in affordable_rows or ():
+            b.add_affordable(as_affordable(a))
+        for c in complaint_rows or ():
+            b.add_complaint(as_complaint(c))
+        for v in violation_rows or ():
+            b.add_violation(as_violation(v))
+        for e in eviction_rows or ():
+            b.add_eviction(as_eviction(e))
+    for m in acris_master_rows or ():
         b.upsert_acris_master(as_acris_master(m))
-    for l in acris_legal_rows:
+    for l in acris_legal_rows or ():
         b.add_acris_legal(as_acris_legal(l))
-    for p in acris_party_rows:
+    for p in acris_party_rows or ():
         b.add_acris_party(as_acris_party(p))
-    if eviction_rows:
-        for e in eviction_rows:
-            b.add_eviction(as_eviction(e))
     return b
+
+
+# JSON 으로 집계된 섹션은 날짜가 문자열로 오므로 모델 타입으로 되돌린다
+PROFILE_TEMPORAL_FIELDS = {
+    "registration": ("last_registration_date", "registration_end_date"),
+    "affordable": ("project_start_date",),
+    "complaints": ("complaint_status_date", "problem_status_date"),
+    "violations": (
+        "current_status_date",
+        "inspection_date",
+        "nov_issued_date",
+        "approved_date",
+    ),
+    "evictions": ("executed_date",),
+    "acris_master": ("doc_date",),
+}
+
+
+def _parse_temporal(value: Any):
+    if not isinstance(value, str):
+        return value
+    try:
+        if len(value) == 10:
+            return date.fromisoformat(value)
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+def decode_profile_json(raw: str):
+    """Parse profile JSON (live profile sections or a stored snapshot)."""
+    # numeric 정밀도 유지를 위해 float 대신 Decimal 로 파싱; 정수값 NUMERIC 은 as_acris_master 에서 Decimal 로
+    return json.loads(raw, parse_float=Decimal)
+
+
+def _decode_profile_section(row: dict, section: str):
+    raw = row.get(section)
+    if raw is None:
+        return None
+    data = decode_profile_json(raw) if isinstance(raw, str) else raw
+    fields = PROFILE_TEMPORAL_FIELDS.get(section, ())
+    items = data if isinstance(data, list) else [data]
+    for item in items:
+        for f in fields:
+            if f in item:
+                item[f] = _parse_temporal(item[f])
+    return data
+
+
+def build_building_from_profile_row(bbl: str, row: Optional[dict]) -> Building:
+    """Build a Building from the single-statement profile row (one JSON column per section)."""
+    row = row or {}
+
+    def section(name: str) -> List[dict]:
+        return _decode_profile_section(row, name) or []
+
+    return build_building_from_rows(
+        bbl=bbl,
+        reg_row=_decode_profile_section(row, "registration"),
+        contact_rows=section("contacts"),
+        affordable_rows=section("affordable"),
+        complaint_rows=section("complaints"),
+        violation_rows=section("violations"),
+        acris_master_rows=section("acris_master"),
+        acris_legal_rows=section("acris_legals"),
+        acris_party_rows=section("acris_parties"),
+        rent_tag_row=_decode_profile_section(row, "rent_stabilized"),
+        eviction_rows=section("evictions"),
+        unique=True,
+    )
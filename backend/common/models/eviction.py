@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Eviction:
     docket_number: Optional[str]
     court_index_number: Optional[str]
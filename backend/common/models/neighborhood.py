@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from itertools import repeat
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NeighborhoodStats:
     """Aggregated statistics for a neighborhood/area"""
 
@@ -45,7 +48,7 @@ class NeighborhoodStats:
     last_updated: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HeatmapPoint:
     """Point data for heatmap visualization"""
 
@@ -59,7 +62,94 @@ class HeatmapPoint:
     borough: str
 
 
-@dataclass
+class HeatmapBatch(Sequence):
+    """
+    Columnar, read-only batch of HeatmapPoints for bulk responses.
+
+    Numeric columns are array.array buffers and text columns plain lists,
+    so a 50k-point heatmap holds a handful of containers instead of 50k
+    objects. Indexing or iterating builds HeatmapPoints on demand;
+    json_util encodes the columns directly without building them.
+    """
+
+    __slots__ = (
+        "data_type",
+        "bbl",
+        "latitude",
+        "longitude",
+        "intensity",
+        "count",
+        "address",
+        "borough",
+    )
+    row_type = HeatmapPoint
+
+    def __init__(self, data_type: str):
+        self.data_type = data_type
+        self.bbl: List[str] = []
+        self.latitude = array("d")
+        self.longitude = array("d")
+        self.intensity = array("d")
+        self.count = array("q")
+        self.address: List[str] = []
+        self.borough: List[str] = []
+
+    @classmethod
+    def from_rows(cls, data_type: str, rows: Iterable[tuple]) -> HeatmapBatch:
+        """
+        Build a batch from heatmap query tuples in SELECT order:
+        (bbl, latitude, longitude, address, borough, count, intensity).
+        Numeric values (NUMERIC -> Decimal) are stored as floats.
+        """
+        batch = cls(data_type)
+        bbl, lat, lng = batch.bbl.append, batch.latitude.append, batch.longitude.append
+        address, borough = batch.address.append, batch.borough.append
+        count, intensity = batch.count.append, batch.intensity.append
+        for b, la, ln, a, bo, c, i in rows:
+            bbl(b)
+            lat(la)
+            lng(ln)
+            address(a)
+            borough(bo)
+            count(c)
+            intensity(i)
+        return batch
+
+    def columns(self) -> Tuple[Iterable, ...]:
+        """Column iterables in HeatmapPoint field order."""
+        return (
+            self.bbl,
+            self.latitude,
+            self.longitude,
+            self.intensity,
+            repeat(self.data_type, len(self.bbl)),
+            self.count,
+            self.address,
+            self.borough,
+        )
+
+    def __len__(self) -> int:
+        return len(self.bbl)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return HeatmapPoint(
+            self.bbl[index],
+            self.latitude[index],
+            self.longitude[index],
+            self.intensity[index],
+            self.data_type,
+            self.count[index],
+            self.address[index],
+            self.borough[index],
+        )
+
+    def __iter__(self) -> Iterator[HeatmapPoint]:
+        return map(HeatmapPoint, *self.columns())
+
+
+@dataclass(slots=True, frozen=True)
 class NeighborhoodSummary:
     """Summary data for neighborhood comparison"""
 
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from typing import List, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class OwnerBuilding:
+    """One building of an owner portfolio with its row counts"""
+
+    bbl: str
+    address: Optional[str] = None
+    borough: Optional[str] = None
+    zip_code: Optional[str] = None
+    # 이름이 연결된 출처: 'registration' (HPD 등록) / 'acris' (등기 양수인)
+    sources: List[str] = field(default_factory=list)
+
+    total_violations: int = 0
+    open_violations: int = 0
+    total_evictions: int = 0
+    open_complaints: int = 0
+
+
+@dataclass(slots=True, frozen=True)
+class OwnerPortfolio:
+    """Every building linked to one normalized owner name, with portfolio totals"""
+
+    name: str  # normalize_owner_name() 결과
+    names: List[str]  # 원본 표기들
+    total_buildings: int
+    total_violations: int
+    open_violations: int
+    total_evictions: int
+    open_complaints: int
+    # 미해결 위반이 많은 순, 최대 limit 채 (합계는 전체 기준)
+    buildings: List[OwnerBuilding] = field(default_factory=list)
+
+
+_OWNER_BUILDING_FIELDS = tuple(f.name for f in fields(OwnerBuilding))
+
+
+def as_owner_building(row: dict) -> OwnerBuilding:
+    """Convert a portfolio row (which also carries portfolio_* columns) to OwnerBuilding"""
+    return OwnerBuilding(**{name: row[name] for name in _OWNER_BUILDING_FIELDS})
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RegistrationContact:
     registration_contact_id: int
     registration_id: Optional[int]
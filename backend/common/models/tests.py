@@ -3,6 +3,7 @@ from datetime import datetime
 from unittest import TestCase
 
 from common.models.neighborhood import (
+    HeatmapBatch,
     HeatmapPoint,
     NeighborhoodStats,
     NeighborhoodSummary,
@@ -117,6 +118,45 @@ class NeighborhoodModelsTests(TestCase):
         self.assertEqual(point.address, "123 Main St")
         self.assertEqual(point.borough, "Manhattan")
 
+    def test_models_are_slotted_and_frozen(self):
+        """Test row models carry no per-instance __dict__ and reject mutation"""
+        from dataclasses import FrozenInstanceError
+
+        point = HeatmapPoint("1", 40.7, -73.9, 0.5, "violations", 1, "A", "B")
+        self.assertFalse(hasattr(point, "__dict__"))
+        with self.assertRaises(FrozenInstanceError):
+            point.count = 2
+
+    def test_heatmap_batch_columns(self):
+        """Test HeatmapBatch stores columns and rebuilds points on demand"""
+        from decimal import Decimal
+
+        batch = HeatmapBatch.from_rows(
+            "evictions",
+            [
+                (
+                    "1",
+                    Decimal("40.7"),
+                    Decimal("-73.9"),
+                    "A",
+                    "BRONX",
+                    2,
+                    Decimal("0.4"),
+                ),
+                ("2", 40.8, -74.0, "B", "QUEENS", 1, 0.2),
+            ],
+        )
+
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.latitude.typecode, "d")
+        self.assertEqual(
+            batch[0], HeatmapPoint("1", 40.7, -73.9, 0.4, "evictions", 2, "A", "BRONX")
+        )
+        self.assertEqual(batch[-1].borough, "QUEENS")
+        self.assertEqual(list(batch), batch[:])
+        with self.assertRaises(IndexError):
+            batch[2]
+
     def test_neighborhood_summary_initialization(self):
         """Test NeighborhoodSummary initialization"""
         summary = NeighborhoodSummary(
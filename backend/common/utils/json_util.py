@@ -0,0 +1,280 @@
+"""
+One-pass JSON encoding for API payloads built from dataclass models.
+
+dumps() writes the JSON text directly from dataclasses, dates and
+Decimals, with no asdict() deep copy and no second conversion pass. Every
+dataclass type gets its own encoder, compiled on first use from its
+fields and annotations. For a field annotated str/int/float/bool/date/
+datetime, the compiled code handles a value of that exact type inline.
+Any other value goes through the generic encode().
+
+Columnar batches (a `row_type` dataclass plus `columns()` in field order,
+e.g. HeatmapBatch) are written row by row straight from the columns with
+the same compiled code, without building row objects.
+
+Conventions follow DRF's JSONRenderer defaults:
+- datetime/date: isoformat(), with a UTC "+00:00" offset written as "Z".
+- Decimal: str.
+- Non-finite floats: ValueError (STRICT_JSON).
+- Non-ASCII text: emitted as is (UNICODE_JSON).
+"""
+
+import dataclasses
+import json
+import math
+import threading
+import typing
+from datetime import date, datetime
+from decimal import Decimal
+from json.encoder import encode_basestring
+from typing import Any, Callable, Dict, Optional
+
+from rest_framework.utils.encoders import JSONEncoder as DRFJSONEncoder
+
+Encoder = Callable[[Any], str]
+
+_drf_default = DRFJSONEncoder().default
+
+
+def _str(v: str) -> str:
+    return encode_basestring(v)
+
+
+def _int(v: int) -> str:
+    return int.__repr__(v)
+
+
+def _float(v: float) -> str:
+    if not math.isfinite(v):
+        raise ValueError(f"Out of range float values are not JSON compliant: {v!r}")
+    return float.__repr__(v)
+
+
+def _bool(v: bool) -> str:
+    return "true" if v else "false"
+
+
+def _none(v: None) -> str:
+    return "null"
+
+
+def _datetime(v: datetime) -> str:
+    text = v.isoformat()
+    if text.endswith("+00:00"):
+        text = text[:-6] + "Z"
+    return '"' + text + '"'
+
+
+def _date(v: date) -> str:
+    return '"' + v.isoformat() + '"'
+
+
+def _decimal(v: Decimal) -> str:
+    # 금액 정밀도 유지를 위해 숫자가 아닌 문자열로
+    return '"' + str(v) + '"'
+
+
+def _list(v) -> str:
+    if not v:
+        return "[]"
+    # 보통 같은 타입(HeatmapPoint 등)만 담긴 리스트 - 인코더를 한 번만 찾는다
+    cls = v[0].__class__
+    enc = _ENCODERS.get(cls) or _resolve(cls)
+    return (
+        "[" + ",".join([enc(x) if x.__class__ is cls else encode(x) for x in v]) + "]"
+    )
+
+
+def _columns(v) -> str:
+    return "[" + _rows_encoder(v.row_type)(zip(*v.columns())) + "]"
+
+
+def _key(k) -> str:
+    if k.__class__ is str:
+        return encode_basestring(k)
+    if isinstance(k, str):
+        return encode_basestring(str(k))
+    # json.dumps 와 같은 키 변환 (None/bool/숫자 -> 문자열)
+    if k is None or isinstance(k, (bool, int, float)):
+        return '"' + encode(k).strip('"') + '"'
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(k).__name__}"
+    )
+
+
+def _dict(v) -> str:
+    return "{" + ",".join([_key(k) + ":" + encode(x) for k, x in v.items()]) + "}"
+
+
+# 정확한 타입 -> 인코더. 서브클래스/데이터클래스는 처음 볼 때 _resolve 로 등록
+_ENCODERS: Dict[type, Encoder] = {
+    str: _str,
+    int: _int,
+    float: _float,
+    bool: _bool,
+    type(None): _none,
+    datetime: _datetime,
+    date: _date,
+    Decimal: _decimal,
+    list: _list,
+    tuple: _list,
+    dict: _dict,
+}
+# 컬럼형 배치의 row_type -> 행 튜플 인코더
+_ROW_ENCODERS: Dict[type, Encoder] = {}
+_lock = threading.Lock()
+
+
+def encode(v: Any) -> str:
+    """JSON text for `v`."""
+    enc = _ENCODERS.get(v.__class__)
+    if enc is None:
+        enc = _resolve(v.__class__)
+    return enc(v)
+
+
+def dumps(v: Any) -> bytes:
+    """UTF-8 JSON bytes for `v`; U+2028/U+2029 escaped for JavaScript like DRF."""
+    text = encode(v)
+    if "\u2028" in text or "\u2029" in text:
+        text = text.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+    return text.encode("utf-8")
+
+
+def to_primitive(v: Any):
+    """Plain dict/list/str/number form of `v`, as the client will decode it."""
+    return json.loads(encode(v))
+
+
+def encoder_for(cls: type) -> Encoder:
+    """The (cached) encoder for instances of `cls`."""
+    enc = _ENCODERS.get(cls)
+    return enc if enc is not None else _resolve(cls)
+
+
+def _resolve(cls: type) -> Encoder:
+    if dataclasses.is_dataclass(cls):
+        enc = _compile_dataclass(cls)
+    elif dataclasses.is_dataclass(getattr(cls, "row_type", None)) and hasattr(
+        cls, "columns"
+    ):
+        enc = _columns
+    elif issubclass(cls, bool):
+        enc = _bool
+    elif issubclass(cls, str):
+        enc = _str
+    elif issubclass(cls, int):
+        enc = _int
+    elif issubclass(cls, float):
+        enc = _float
+    elif issubclass(cls, datetime):
+        enc = _datetime
+    elif issubclass(cls, date):
+        enc = _date
+    elif issubclass(cls, Decimal):
+        enc = _decimal
+    elif issubclass(cls, (list, tuple)):
+        enc = _list
+    elif issubclass(cls, dict):
+        enc = _dict
+    else:
+        # UUID, lazy 문자열, QuerySet, 제너레이터 등은 DRF 인코더 규칙으로 변환 후 인코딩
+        def enc(v):
+            return encode(_drf_default(v))
+
+    with _lock:
+        _ENCODERS.setdefault(cls, enc)
+    return enc
+
+
+# 어노테이션 -> 값이 정확히 그 타입일 때 쓰는 인라인 식 ({v} = 필드 값).
+# float 은 유한할 때만 (v - v == 0), 아니면 encode() 가 ValueError
+_FAST_PATHS = {
+    str: "_esc({v})",
+    int: "_int_repr({v})",
+    float: "_float_repr({v}) if {v} - {v} == 0.0 else encode({v})",
+    bool: "'true' if {v} else 'false'",
+    datetime: "_datetime({v})",
+    date: "_date({v})",
+    Decimal: "_decimal({v})",
+}
+
+
+def _fast_type(annotation) -> Optional[type]:
+    """str for `str` / `Optional[str]`, etc.; None if there is no fast path."""
+    if typing.get_origin(annotation) is typing.Union:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    return annotation if annotation in _FAST_PATHS else None
+
+
+def _rows_encoder(cls: type) -> Encoder:
+    enc = _ROW_ENCODERS.get(cls)
+    if enc is None:
+        enc = _compile_dataclass(cls, rows=True)
+        with _lock:
+            enc = _ROW_ENCODERS.setdefault(cls, enc)
+    return enc
+
+
+def _compile_dataclass(cls: type, rows: bool = False) -> Encoder:
+    """
+    Build `encode(obj) -> str` for one dataclass: a straight-line function
+    that reads each field once and concatenates the JSON object in one
+    f-string. Only dataclass fields are written (no private attributes).
+
+    With rows=True it builds `encode(rows) -> str` instead, which writes an
+    iterable of field-value tuples (zipped from a columnar batch) as
+    comma-separated objects in a single list comprehension.
+    """
+    try:
+        hints = typing.get_type_hints(cls)
+    except Exception:
+        hints = {}
+
+    namespace: Dict[str, Any] = {
+        "encode": encode,
+        "_esc": encode_basestring,
+        "_int_repr": int.__repr__,
+        "_float_repr": float.__repr__,
+        "_datetime": _datetime,
+        "_date": _date,
+        "_decimal": _decimal,
+    }
+    exprs = []
+    for i, f in enumerate(dataclasses.fields(cls)):
+        fast = _fast_type(hints.get(f.name))
+        if fast is None:
+            exprs.append(f"encode(v{i})")
+        else:
+            namespace[f"T{i}"] = fast
+            inline = _FAST_PATHS[fast].format(v=f"v{i}")
+            exprs.append(f"(({inline}) if v{i}.__class__ is T{i} else encode(v{i}))")
+    names = [encode_basestring(f.name) for f in dataclasses.fields(cls)]
+
+    if rows:
+        # 행마다 함수 호출 없이 f-string 컴프리헨션 한 번 (식 안의 'true' 때문에 ''' 로 감쌈)
+        body = ",".join(f"{name}:{{{expr}}}" for name, expr in zip(names, exprs))
+        targets = "".join(f"v{i}, " for i in range(len(exprs)))
+        quote = "'''"
+        lines = [
+            "def encode_rows(rows):",
+            f"    return ','.join([f{quote}{{{{{body}}}}}{quote} for {targets}in rows])",
+        ]
+    else:
+        lines = ["def encode_dataclass(o):"]
+        for i, f in enumerate(dataclasses.fields(cls)):
+            lines.append(f"    v{i} = o.{f.name}")
+            lines.append(f"    p{i} = {exprs[i]}")
+        body = ",".join(f"{name}:{{p{i}}}" for i, name in enumerate(names)).replace(
+            "'", "\\'"
+        )
+        lines.append(f"    return f'{{{{{body}}}}}'")
+
+    exec(
+        compile("\n".join(lines), f"<json encoder {cls.__qualname__}>", "exec"),
+        namespace,
+    )
+    return namespace["encode_rows" if rows else "encode_dataclass"]
@@ -74,3 +74,113 @@ class EnvUtilTests(TestCase):
             self.assertIsNotNone(env)
         except ImportError as e:
             self.fail(f"Import failed: {e}")
+
+
+class JsonUtilTests(TestCase):
+    def test_dumps_dataclass_matches_stdlib_json(self):
+        """Test the compiled dataclass encoder matches json.dumps of the asdict form"""
+        import json
+        from dataclasses import asdict
+        from datetime import date, datetime
+        from decimal import Decimal
+
+        from common.models.acris import AcrisMaster
+        from common.models.building import Building
+        from common.models.neighborhood import HeatmapPoint
+        from common.utils.json_util import dumps
+
+        building = Building(bbl="1234567890", counts={"violations": 2})
+        building.acris_master["D1"] = AcrisMaster(
+            document_id="D1",
+            borough=1,
+            doc_type="DEED",
+            doc_date=date(2020, 1, 2),
+            doc_amount=Decimal("1000.50"),
+        )
+        point = HeatmapPoint(
+            "1", 40.5, -73.9, 0.25, "violations", 3, "1 Main St ü", "BRONX"
+        )
+        payload = {
+            "building": building,
+            "points": [point, point],
+            "at": datetime(2024, 5, 1, 9, 30, 0, 12),
+            "flags": (True, None),
+        }
+
+        def default(o):
+            return o.isoformat() if hasattr(o, "isoformat") else str(o)
+
+        expected = {
+            "building": asdict(building),
+            "points": [asdict(point)] * 2,
+            "at": payload["at"],
+            "flags": [True, None],
+        }
+        self.assertEqual(
+            json.loads(dumps(payload)),
+            json.loads(json.dumps(expected, default=default)),
+        )
+        self.assertEqual(
+            json.loads(dumps(building))["acris_master"]["D1"]["doc_amount"], "1000.50"
+        )
+        self.assertNotIn(b"_loaded", dumps(building))
+        self.assertIn("ü".encode(), dumps(point))
+
+    def test_dumps_falls_back_for_mismatched_annotations(self):
+        """Test values that do not match the field annotation still encode correctly"""
+        import json
+
+        from common.models.neighborhood import HeatmapPoint
+        from common.utils.json_util import dumps
+
+        point = HeatmapPoint(1234, "40.5", None, True, "v", 2.5, None, "X")
+        self.assertEqual(
+            json.loads(dumps(point)),
+            {
+                "bbl": 1234,
+                "latitude": "40.5",
+                "longitude": None,
+                "intensity": True,
+                "data_type": "v",
+                "count": 2.5,
+                "address": None,
+                "borough": "X",
+            },
+        )
+
+    def test_dumps_columnar_batch_matches_points(self):
+        """Test a HeatmapBatch encodes exactly like the list of its points"""
+        import json
+        from decimal import Decimal
+
+        from common.models.neighborhood import HeatmapBatch
+        from common.utils.json_util import dumps
+
+        batch = HeatmapBatch.from_rows(
+            "violations",
+            [
+                ("1", Decimal("40.75"), Decimal("-73.9"), 'A "1"', "MANHATTAN", 3, 0.4),
+                ("2", 40.5, -74.0, None, "BRONX", 0, Decimal("0.0")),
+            ],
+        )
+        self.assertEqual(dumps(batch), dumps(list(batch)))
+        self.assertEqual(json.loads(dumps(batch))[0]["latitude"], 40.75)
+        self.assertEqual(dumps({"data": HeatmapBatch("evictions")}), b'{"data":[]}')
+
+    def test_dumps_rejects_non_finite_floats(self):
+        """Test NaN/inf raise like STRICT_JSON"""
+        from common.utils.json_util import dumps
+
+        with self.assertRaises(ValueError):
+            dumps({"x": float("nan")})
+
+    def test_dumps_uses_drf_rules_for_other_types(self):
+        """Test types without a fast path go through DRF's encoder"""
+        import uuid
+
+        from common.utils.json_util import dumps
+
+        self.assertEqual(
+            dumps({1: uuid.UUID(int=1), "g": (i for i in range(2)), "s": " "}),
+            b'{"1":"00000000-0000-0000-0000-000000000001","g":[0,1],"s":"\\u2028"}',
+        )
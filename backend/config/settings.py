@@ -80,6 +80,7 @@ INSTALLED_APPS = [
     "apps.building",
     "apps.community",
     "apps.neighborhood",
+    "apps.owner",
 ]
 
 MIDDLEWARE = [
@@ -40,6 +40,7 @@ urlpatterns = [
     path("api/building/", include("apps.building.urls")),
     path("api/community/", include("apps.community.urls")),
     path("api/neighborhood/", include("apps.neighborhood.urls")),
+    path("api/owner/", include("apps.owner.urls")),
     path("api/dummy/", include("apps.dummy.urls")),
     re_path(
         r"^(?!(api(?:/|$)|admin(?:/|$))).*$",
@@ -5,11 +5,17 @@ import requests
 
 from common.exceptions.db_error import DatabaseError
 from common.interfaces.data_crawler import DataCrawler
+from infrastructures.postgres.building_repository import (
+    refresh_acris_documents,
+    refresh_profile_snapshots,
+)
+from infrastructures.postgres.owner_repository import refresh_owner_index
 from infrastructures.postgres.postgres_client import PostgresClient
 
 
 class AcrisLegalsCrawler(DataCrawler):
     TABLE_NAME = "building_acris_legals"
+    USE_COPY = True
     API_URL = "https://data.cityofnewyork.us/resource/8h5j-fqxa.json"
     CONFLICT_TARGET = ["document_id", "borough", "block", "lot"]
 
@@ -134,7 +140,14 @@ class AcrisLegalsCrawler(DataCrawler):
                     self.COLUMNS,
                     rows,
                     conflict_target=self.CONFLICT_TARGET,
+                    use_copy=self.USE_COPY,
                 )
+                keys = [r.get(self.SNAPSHOT_KEY) for r in rows]
+                # 문서 인덱스 먼저 - snapshot 프로필이 building_acris_documents 를 읽음
+                refresh_acris_documents(db, keys, key=self.SNAPSHOT_KEY)
+                refresh_owner_index(db, keys, key=self.SNAPSHOT_KEY)
+                # snapshot 갱신이 data_version 을 올리므로 (커밋까지 행 잠금) 마지막에
+                refresh_profile_snapshots(db, keys, key=self.SNAPSHOT_KEY)
                 print(f"[AcrisLegals] Inserted {c}")
             except DatabaseError as e:
                 print(f"[AcrisLegals] Insert failed: {e}")
@@ -6,13 +6,20 @@ import requests
 
 from common.exceptions.db_error import DatabaseError
 from common.interfaces.data_crawler import DataCrawler
+from infrastructures.postgres.building_repository import (
+    refresh_acris_documents,
+    refresh_profile_snapshots,
+)
+from infrastructures.postgres.owner_repository import refresh_owner_index
 from infrastructures.postgres.postgres_client import PostgresClient
 
 
 class AcrisMasterCrawler(DataCrawler):
     TABLE_NAME = "building_acris_master"
+    USE_COPY = True
     API_URL = "https://data.cityofnewyork.us/resource/bnx9-e6tj.json"
     CONFLICT_TARGET = ["document_id"]
+    SNAPSHOT_KEY = "document_id"
 
     COLUMNS = ["document_id", "borough", "doc_type", "doc_date", "doc_amount"]
 
@@ -144,7 +151,14 @@ class AcrisMasterCrawler(DataCrawler):
                     self.COLUMNS,
                     rows,
                     conflict_target=self.CONFLICT_TARGET,
+                    use_copy=self.USE_COPY,
                 )
+                keys = [r.get(self.SNAPSHOT_KEY) for r in rows]
+                # 문서 인덱스 먼저 - snapshot 프로필이 building_acris_documents 를 읽음
+                refresh_acris_documents(db, keys, key=self.SNAPSHOT_KEY)
+                # 소유자 인덱스는 문서 인덱스의 doc_type/doc_date 로 최신 deed 를 고름
+                refresh_owner_index(db, keys, key=self.SNAPSHOT_KEY)
+                refresh_profile_snapshots(db, keys, key=self.SNAPSHOT_KEY)
                 print(f"[AcrisMaster] Inserted {c}")
             except DatabaseError as e:
                 print(f"[AcrisMaster] Insert failed: {e}")
@@ -6,13 +6,17 @@ import requests
 
 from common.exceptions.db_error import DatabaseError
 from common.interfaces.data_crawler import DataCrawler
+from infrastructures.postgres.building_repository import refresh_profile_snapshots
+from infrastructures.postgres.owner_repository import refresh_owner_index
 from infrastructures.postgres.postgres_client import PostgresClient
 
 
 class AcrisPartiesCrawler(DataCrawler):
     TABLE_NAME = "building_acris_parties"
+    USE_COPY = True
     API_URL = "https://data.cityofnewyork.us/resource/636b-3b5g.json"
     CONFLICT_TARGET = ["document_id", "party_type", "name", "address1"]
+    SNAPSHOT_KEY = "document_id"
 
     COLUMNS = ["document_id", "party_type", "name", "address1", "city", "state", "zip"]
 
@@ -130,7 +134,12 @@ class AcrisPartiesCrawler(DataCrawler):
                     self.COLUMNS,
                     rows,
                     conflict_target=self.CONFLICT_TARGET,
+                    use_copy=self.USE_COPY,
                 )
+                keys = [r.get(self.SNAPSHOT_KEY) for r in rows]
+                refresh_owner_index(db, keys, key=self.SNAPSHOT_KEY)
+                # snapshot 갱신이 data_version 을 올리므로 (커밋까지 행 잠금) 마지막에
+                refresh_profile_snapshots(db, keys, key=self.SNAPSHOT_KEY)
                 print(f"[AcrisParties] Inserted {c}")
             except DatabaseError as e:
                 print(f"[AcrisParties] Insert failed: {e}")
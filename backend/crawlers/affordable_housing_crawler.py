@@ -5,6 +5,7 @@ import requests
 
 from common.exceptions.db_error import DatabaseError
 from common.interfaces.data_crawler import DataCrawler
+from infrastructures.postgres.building_repository import refresh_profile_snapshots
 from infrastructures.postgres.postgres_client import PostgresClient
 
 
@@ -306,6 +307,10 @@ class AffordableHousingCrawler(DataCrawler):
                     self.COLUMNS,
                     rows,
                     conflict_target=self.CONFLICT_TARGET,
+                    use_copy=self.USE_COPY,
+                )
+                refresh_profile_snapshots(
+                    db, [r.get(self.SNAPSHOT_KEY) for r in rows], key=self.SNAPSHOT_KEY
                 )
                 print(
                     f"[{self.__class__.__name__}] Inserted {count} rows into {self.TABLE_NAME}."
@@ -5,11 +5,13 @@ import requests
 
 from common.exceptions.db_error import DatabaseError
 from common.interfaces.data_crawler import DataCrawler
+from infrastructures.postgres.building_repository import refresh_profile_snapshots
 from infrastructures.postgres.postgres_client import PostgresClient
 
 
 class ComplaintCrawler(DataCrawler):
     TABLE_NAME = "building_complaints"
+    USE_COPY = True
 
     API_URL = "https://data.cityofnewyork.us/resource/ygpa-z7cr.json"
 
@@ -370,6 +372,10 @@ class ComplaintCrawler(DataCrawler):
                     self.COLUMNS,
                     rows,
                     conflict_target=["complaint_id"],
+                    use_copy=self.USE_COPY,
+                )
+                refresh_profile_snapshots(
+                    db, [r.get(self.SNAPSHOT_KEY) for r in rows], key=self.SNAPSHOT_KEY
                 )
                 print(
                     f"[ComplaintCrawler] Inserted {count} rows into {self.TABLE_NAME}."
@@ -6,6 +6,8 @@ import requests
 
 from common.exceptions.db_error import DatabaseError
 from common.interfaces.data_crawler import DataCrawler
+from infrastructures.postgres.building_repository import refresh_profile_snapshots
+from infrastructures.postgres.owner_repository import refresh_owner_index
 from infrastructures.postgres.postgres_client import PostgresClient
 
 
@@ -32,6 +34,8 @@ class RegistrationContactCrawler(DataCrawler):
 
     CONFLICT_TARGET = ["registration_contact_id"]
 
+    SNAPSHOT_KEY = "registration_id"
+
     FIELD_CANDIDATES: Dict[str, List[str]] = {
         "registration_contact_id": ["registration_contact_id", "registrationcontactid"],
         "registration_id": ["registration_id", "registrationid"],
@@ -310,7 +314,12 @@ class RegistrationContactCrawler(DataCrawler):
                     self.COLUMNS,
                     rows,
                     conflict_target=conflict_target,
+                    use_copy=self.USE_COPY,
                 )
+                keys = [r.get(self.SNAPSHOT_KEY) for r in rows]
+                refresh_owner_index(db, keys, key=self.SNAPSHOT_KEY)
+                # snapshot 갱신이 data_version 을 올리므로 (커밋까지 행 잠금) 마지막에
+                refresh_profile_snapshots(db, keys, key=self.SNAPSHOT_KEY)
                 print(
                     f"[{self.__class__.__name__}] Inserted {count} rows into {self.TABLE_NAME}."
                 )
@@ -5,6 +5,8 @@ import requests
 
 from common.exceptions.db_error import DatabaseError
 from common.interfaces.data_crawler import DataCrawler
+from infrastructures.postgres.building_repository import refresh_profile_snapshots
+from infrastructures.postgres.owner_repository import refresh_owner_index
 from infrastructures.postgres.postgres_client import PostgresClient
 
 
@@ -104,8 +106,16 @@ class RegistrationCrawler(DataCrawler):
         with PostgresClient() as db:
             try:
                 count = db.bulk_insert(
-                    self.TABLE_NAME, self.COLUMNS, rows, conflict_target=["bbl"]
+                    self.TABLE_NAME,
+                    self.COLUMNS,
+                    rows,
+                    conflict_target=["bbl"],
+                    use_copy=self.USE_COPY,
                 )
+                keys = [r.get(self.SNAPSHOT_KEY) for r in rows]
+                refresh_owner_index(db, keys, key=self.SNAPSHOT_KEY)
+                # snapshot 갱신이 data_version 을 올리므로 (커밋까지 행 잠금) 마지막에
+                refresh_profile_snapshots(db, keys, key=self.SNAPSHOT_KEY)
                 print(
                     f"[RegistrationCrawler] Inserted {count} rows into {self.TABLE_NAME}."
                 )
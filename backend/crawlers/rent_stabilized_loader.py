@@ -10,6 +10,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from common.exceptions.db_error import DatabaseError
 from common.interfaces.data_crawler import DataCrawler
+from infrastructures.postgres.building_repository import refresh_profile_snapshots
 from infrastructures.postgres.postgres_client import PostgresClient
 
 
@@ -223,6 +224,12 @@ class RentStabilizedLoader(DataCrawler):
                     deduplicated_rows,
                     conflict_target=conflict_target,
                     do_update=True,  # Update existing records
+                    use_copy=self.USE_COPY,
+                )
+                refresh_profile_snapshots(
+                    db,
+                    [r.get(self.SNAPSHOT_KEY) for r in deduplicated_rows],
+                    key=self.SNAPSHOT_KEY,
                 )
                 print(
                     f"[{self.__class__.__name__}] Inserted {count} rows into {self.TABLE_NAME}."
@@ -0,0 +1,766 @@
+# crawlers/synthetic_data.py
+"""
+Synthetic NYC-scale dataset for local benchmarking (no network).
+
+Fills every table the crawlers write to through COPY, with the skew real
+BBLs have: a small share of buildings carries most violations, complaints
+and evictions, and per-borough rates follow the open-data proportions.
+
+    python -m crawlers.synthetic_data --scale 0.1 --seed 42 --truncate [--snapshots]
+
+scale=1.0 is roughly 1M registrations, 10M violations, 5M complaints,
+250k evictions and 2M ACRIS documents. The same seed, scale and --as-of
+date always produce the same rows.
+"""
+
+import argparse
+import itertools
+import random
+import time
+from bisect import bisect
+from collections import namedtuple
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from crawlers.acris_legals_crawler import AcrisLegalsCrawler
+from crawlers.acris_master_crawler import AcrisMasterCrawler
+from crawlers.acris_parties_crawler import AcrisPartiesCrawler
+from crawlers.affordable_housing_crawler import AffordableHousingCrawler
+from crawlers.complaint_crawler import ComplaintCrawler
+from crawlers.eviction_crawler import EvictionCrawler
+from crawlers.registration_contact_crawler import RegistrationContactCrawler
+from crawlers.registration_crawler import RegistrationCrawler
+from crawlers.rent_stabilized_loader import RentStabilizedLoader
+from crawlers.violation_crawler import ViolationCrawler
+from infrastructures.postgres.building_repository import (
+    refresh_acris_documents,
+    refresh_profile_snapshots,
+)
+from infrastructures.postgres.owner_repository import refresh_owner_index
+from infrastructures.postgres.postgres_client import PostgresClient
+from infrastructures.postgres.profile_cache import bump_data_version
+
+# 규모 1.0 기준 행 수
+BASE_ROWS = {
+    "registrations": 1_000_000,
+    "violations": 10_000_000,
+    "complaints": 5_000_000,
+    "evictions": 250_000,
+    "affordable_housing": 30_000,
+    "acris_documents": 2_000_000,
+}
+
+
+@dataclass(frozen=True)
+class Borough:
+    boro_id: int
+    name: str
+    share: float
+    violation_rate: float
+    complaint_rate: float
+    eviction_rate: float
+    stabilized_share: float
+    lat: Tuple[float, float]
+    lng: Tuple[float, float]
+    zips: Tuple[int, int]
+    cities: Sequence[str]
+    community_boards: int
+
+
+# 건물 수 비중과 건물당 위반/민원/퇴거 비율 (HPD/DOI 공개 데이터의 대략적인 자치구별 비율)
+BOROUGHS = (
+    Borough(
+        1,
+        "MANHATTAN",
+        0.14,
+        1.0,
+        1.1,
+        0.6,
+        0.30,
+        (40.700, 40.878),
+        (-74.019, -73.910),
+        (10001, 10040),
+        ("NEW YORK",),
+        12,
+    ),
+    Borough(
+        2,
+        "BRONX",
+        0.13,
+        1.7,
+        1.8,
+        1.9,
+        0.32,
+        (40.800, 40.912),
+        (-73.933, -73.765),
+        (10451, 10475),
+        ("BRONX",),
+        12,
+    ),
+    Borough(
+        3,
+        "BROOKLYN",
+        0.33,
+        1.2,
+        1.1,
+        1.1,
+        0.22,
+        (40.571, 40.739),
+        (-74.042, -73.856),
+        (11201, 11239),
+        ("BROOKLYN",),
+        18,
+    ),
+    Borough(
+        4,
+        "QUEENS",
+        0.31,
+        0.6,
+        0.6,
+        0.7,
+        0.10,
+        (40.542, 40.800),
+        (-73.962, -73.700),
+        (11354, 11436),
+        ("JAMAICA", "FLUSHING", "ASTORIA", "ELMHURST", "FAR ROCKAWAY"),
+        14,
+    ),
+    Borough(
+        5,
+        "STATEN ISLAND",
+        0.09,
+        0.4,
+        0.4,
+        0.3,
+        0.03,
+        (40.496, 40.648),
+        (-74.255, -74.052),
+        (10301, 10314),
+        ("STATEN ISLAND",),
+        3,
+    ),
+)
+
+STREETS = (
+    "BROADWAY",
+    "AMSTERDAM AVENUE",
+    "GRAND CONCOURSE",
+    "FLATBUSH AVENUE",
+    "OCEAN AVENUE",
+    "EASTERN PARKWAY",
+    "JAMAICA AVENUE",
+    "QUEENS BOULEVARD",
+    "ROOSEVELT AVENUE",
+    "VICTORY BOULEVARD",
+    "RICHMOND TERRACE",
+    "WEST 145 STREET",
+    "EAST 180 STREET",
+    "NOSTRAND AVENUE",
+    "FULTON STREET",
+    "ATLANTIC AVENUE",
+    "SHERIDAN AVENUE",
+    "WALTON AVENUE",
+    "BEDFORD AVENUE",
+    "PARK AVENUE",
+    "LEXINGTON AVENUE",
+    "CROTONA PARKWAY",
+    "KINGS HIGHWAY",
+    "UNION TURNPIKE",
+)
+FIRST_NAMES = (
+    "JOSE",
+    "MARIA",
+    "DAVID",
+    "MICHAEL",
+    "SARAH",
+    "YAN",
+    "WEI",
+    "ABDUL",
+    "ANNA",
+    "JOSEPH",
+    "RACHEL",
+    "LUIS",
+    "FATIMA",
+    "MOSHE",
+    "LING",
+    "KEVIN",
+    "ROSA",
+    "SAMUEL",
+)
+LAST_NAMES = (
+    "RODRIGUEZ",
+    "COHEN",
+    "CHEN",
+    "SMITH",
+    "GARCIA",
+    "KIM",
+    "WILLIAMS",
+    "PATEL",
+    "FRIEDMAN",
+    "NGUYEN",
+    "JOHNSON",
+    "LEE",
+    "MARTINEZ",
+    "GOLDBERG",
+    "BROWN",
+    "KHAN",
+)
+CORPORATE_SUFFIXES = (
+    "LLC",
+    "REALTY LLC",
+    "HOLDINGS LLC",
+    "MANAGEMENT CORP",
+    "ASSOCIATES LP",
+)
+CONTACT_TYPES = (
+    ("HeadOfficer", "Head Officer"),
+    ("Agent", "Managing Agent"),
+    ("CorporateOwner", "Corporate Owner"),
+    ("IndividualOwner", "Individual Owner"),
+    ("SiteManager", "Site Manager"),
+    ("Officer", "Officer"),
+)
+
+VIOLATION_DESCRIPTIONS = (
+    "§ 27-2005 ADM CODE REPAIR THE BROKEN OR DEFECTIVE PLASTERED SURFACES",
+    "§ 27-2026 ADM CODE REPAIR THE LEAKY AND/OR DEFECTIVE FAUCET",
+    "§ 27-2031 ADM CODE PROVIDE HEAT AND HOT WATER",
+    "§ 27-2017.3 ADM CODE TRACE AND ERADICATE THE INFESTATION OF MICE",
+    "§ 27-2046.1 HMC ADM CODE REPAIR OR REPLACE THE SMOKE DETECTOR",
+    "§ 27-2056.6 ADM CODE CORRECT THE LEAD-BASED PAINT HAZARD",
+    "§ 27-2013 ADM CODE PAINT WITH LIGHT COLORED PAINT TO THE SATISFACTION",
+    "§ 27-2045 ADM CODE REPAIR THE SELF-CLOSING DOOR",
+)
+# (violation_status, current_status, current_status_id, weight)
+VIOLATION_STATUSES = (
+    ("Open", "NOV SENT OUT", 2, 35),
+    ("Close", "VIOLATION CLOSED", 19, 65),
+)
+COMPLAINT_CATEGORIES = (
+    ("HEAT/HOT WATER", "ENTIRE BUILDING", 30),
+    ("PLUMBING", "LEAKY FAUCET", 12),
+    ("PAINT/PLASTER", "CEILING", 12),
+    ("UNSANITARY CONDITION", "PESTS", 14),
+    ("DOOR/WINDOW", "DOOR", 8),
+    ("ELECTRIC", "OUTLET OR SWITCH", 6),
+    ("WATER LEAK", "HEAVY FLOW", 10),
+    ("GENERAL", "VENTILATION SYSTEM", 8),
+)
+COMPLAINT_TYPES = (
+    ("EMERGENCY", 40),
+    ("IMMEDIATE EMERGENCY", 10),
+    ("NON EMERGENCY", 45),
+    ("HAZARDOUS", 5),
+)
+ACRIS_DOC_TYPES = (
+    ("MTGE", 35),
+    ("SAT", 20),
+    ("DEED", 20),
+    ("AGMT", 10),
+    ("ASST", 10),
+    ("RPTT", 5),
+)
+MARSHALS = (
+    ("HENRY", "DAZA"),
+    ("JUSTIN", "GROSSMAN"),
+    ("DANNY", "WEINHEIM"),
+    ("ROBERT", "RENZULLI"),
+)
+
+Building = namedtuple(
+    "Building",
+    "bbl boro_id block lot bin house_number street_name zip community_board latitude longitude",
+)
+
+
+def _weighted(rng: random.Random, options) -> Callable[[], Any]:
+    """Sampler over (value..., weight) tuples; returns the value part."""
+    values = [o[0] if len(o) == 2 else o[:-1] for o in options]
+    cum = list(itertools.accumulate(o[-1] for o in options))
+    total = cum[-1]
+    return lambda: values[bisect(cum, rng.random() * total)]
+
+
+class SyntheticDataGenerator:
+    """
+    Builds a building universe first (BBL, address, coordinates and a
+    heavy-tailed "distress" weight per building), then streams child rows
+    for every crawler table, sampling parent buildings by weight.
+
+    Each table uses its own Random seeded from (seed, table), so loading a
+    subset of tables yields the same rows as a full load.
+    """
+
+    TABLES = (
+        RegistrationCrawler,
+        RegistrationContactCrawler,
+        AffordableHousingCrawler,
+        ComplaintCrawler,
+        ViolationCrawler,
+        EvictionCrawler,
+        RentStabilizedLoader,
+        AcrisMasterCrawler,
+        AcrisLegalsCrawler,
+        AcrisPartiesCrawler,
+    )
+
+    def __init__(
+        self, scale: float = 1.0, seed: int = 42, as_of: Optional[date] = None
+    ):
+        if scale <= 0:
+            raise ValueError("scale must be > 0")
+        self.scale = scale
+        self.seed = seed
+        self.as_of = datetime.combine(as_of or date.today(), datetime.min.time())
+        self._buildings: Optional[List[Building]] = None
+        self._distress: List[float] = []
+
+    # ---------- helpers ----------
+
+    def rows(self, key: str) -> int:
+        return max(1, int(BASE_ROWS[key] * self.scale))
+
+    def rng(self, table: str) -> random.Random:
+        return random.Random(f"{self.seed}:{table}")
+
+    def _days_ago(self, rng: random.Random, max_days: int) -> datetime:
+        # 최근 데이터가 더 많도록 치우친 분포
+        days = int(max_days * rng.random() ** 1.6)
+        return self.as_of - timedelta(days=days, seconds=rng.randrange(86400))
+
+    @property
+    def buildings(self) -> List[Building]:
+        """Every synthetic building, ordered by BBL."""
+        if self._buildings is None:
+            self._build_universe()
+        return self._buildings
+
+    def _build_universe(self) -> None:
+        rng = self.rng("buildings")
+        total = self.rows("registrations")
+        buildings, distress = [], []
+        for boro in BOROUGHS:
+            for j in range(max(1, int(total * boro.share))):
+                # 블록당 최대 30필지, 필지 번호는 블록 안에서 겹치지 않게 띄엄띄엄
+                block = 1 + j // 30
+                lot = 1 + (j % 30) * 3 + rng.randrange(3)
+                buildings.append(
+                    Building(
+                        f"{boro.boro_id}{block:05d}{lot:04d}",
+                        boro.boro_id,
+                        block,
+                        lot,
+                        boro.boro_id * 1_000_000 + j,
+                        str(rng.randrange(1, 2500)),
+                        STREETS[(block * 7 + boro.boro_id) % len(STREETS)],
+                        str(rng.randint(*boro.zips)),
+                        rng.randint(1, boro.community_boards),
+                        round(rng.uniform(*boro.lat), 6),
+                        round(rng.uniform(*boro.lng), 6),
+                    )
+                )
+                # Pareto 꼬리: 소수 건물에 위반/민원이 몰림
+                distress.append(min(rng.paretovariate(1.2), 300.0))
+        self._buildings = buildings
+        self._distress = distress
+
+    def _sampler(self, rng: random.Random, rate: str) -> Callable[[], Building]:
+        """Pick buildings proportionally to distress x per-borough `rate`."""
+        by_id = {b.boro_id: getattr(b, rate) for b in BOROUGHS}
+        buildings = self.buildings
+        cum = list(
+            itertools.accumulate(
+                d * by_id[b.boro_id] for b, d in zip(buildings, self._distress)
+            )
+        )
+        total = cum[-1]
+        return lambda: buildings[bisect(cum, rng.random() * total)]
+
+    @staticmethod
+    def _borough(boro_id: int) -> Borough:
+        return BOROUGHS[boro_id - 1]
+
+    def _person(self, rng: random.Random) -> Tuple[str, str]:
+        return rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+
+    def _corporation(self, rng: random.Random, owners: int) -> str:
+        # 대형 소유주가 여러 건물을 보유하도록 지프 분포로 선택
+        n = min(owners - 1, int(owners ** rng.random()) - 1)
+        return f"{LAST_NAMES[n % len(LAST_NAMES)]} {n} {CORPORATE_SUFFIXES[n % len(CORPORATE_SUFFIXES)]}"
+
+    # ---------- tables (tuples in each crawler's COLUMNS order) ----------
+
+    def building_registrations(self) -> Iterator[tuple]:
+        rng = self.rng("building_registrations")
+        for i, b in enumerate(self.buildings):
+            registered = self._days_ago(rng, 730)
+            yield (
+                b.bbl,
+                b.bin,
+                b.boro_id,
+                self._borough(b.boro_id).name,
+                b.block,
+                b.lot,
+                b.house_number,
+                b.street_name,
+                b.zip,
+                b.community_board,
+                registered,
+                registered + timedelta(days=365),
+                100_000 + i,
+                500_000 + i,
+            )
+
+    def building_registration_contacts(self) -> Iterator[tuple]:
+        rng = self.rng("building_registration_contacts")
+        owners = max(2, len(self.buildings) // 8)
+        contact_id = 1
+        for i, b in enumerate(self.buildings):
+            borough = self._borough(b.boro_id)
+            corporation = self._corporation(rng, owners)
+            for _ in range(rng.choice((1, 2, 2, 3, 3, 4, 5))):
+                contact_type, description = rng.choice(CONTACT_TYPES)
+                first, last = self._person(rng)
+                yield (
+                    contact_id,
+                    100_000 + i,
+                    contact_type,
+                    description,
+                    first,
+                    last,
+                    (
+                        corporation
+                        if contact_type in ("CorporateOwner", "HeadOfficer")
+                        else None
+                    ),
+                    str(rng.randrange(1, 900)),
+                    rng.choice(STREETS),
+                    rng.choice(borough.cities),
+                    "NY",
+                    str(rng.randint(*borough.zips)),
+                    None,
+                )
+                contact_id += 1
+
+    def building_affordable_housing(self) -> Iterator[tuple]:
+        rng = self.rng("building_affordable_housing")
+        pick = self._sampler(rng, "eviction_rate")
+        construction = _weighted(rng, (("Preservation", 70), ("New Construction", 30)))
+        for project_id in range(1, self.rows("affordable_housing") + 1):
+            b = pick()
+            total = rng.randint(4, 400)
+            extremely, very, low = (int(total * rng.uniform(0, 0.3)) for _ in range(3))
+            counted = min(total, extremely + very + low + rng.randint(0, total // 4))
+            yield (
+                project_id,
+                b.bbl,
+                f"{b.house_number} {b.street_name} PROJECT",
+                self._days_ago(rng, 3650),
+                construction(),
+                rng.choice(("Yes", "No")),
+                rng.choice(("Yes", "No", "Unknown")),
+                extremely,
+                very,
+                low,
+                counted,
+                counted,
+                total,
+            )
+
+    def building_complaints(self) -> Iterator[tuple]:
+        rng = self.rng("building_complaints")
+        pick = self._sampler(rng, "complaint_rate")
+        category = _weighted(rng, COMPLAINT_CATEGORIES)
+        complaint_type = _weighted(rng, COMPLAINT_TYPES)
+        for complaint_id in range(1, self.rows("complaints") + 1):
+            b = pick()
+            major, minor = category()
+            opened = self._days_ago(rng, 3650)
+            status = "Open" if rng.random() < 0.18 else "Close"
+            status_date = opened + timedelta(days=rng.randrange(0, 60))
+            yield (
+                complaint_id,
+                b.bbl,
+                self._borough(b.boro_id).name,
+                b.block,
+                b.lot,
+                complaint_id,
+                "APARTMENT",
+                rng.choice(("BATHROOM", "KITCHEN", "ENTIRE APARTMENT", "BEDROOM")),
+                complaint_type(),
+                major,
+                minor,
+                status,
+                status_date,
+                status,
+                status_date,
+                "The Department of Housing Preservation and Development inspected the condition.",
+                b.house_number,
+                b.street_name,
+                b.zip,
+                f"{rng.randint(1, 6)}{rng.choice('ABCDEF')}",
+            )
+
+    def building_violations(self) -> Iterator[tuple]:
+        rng = self.rng("building_violations")
+        pick = self._sampler(rng, "violation_rate")
+        violation_class = _weighted(rng, (("A", 30), ("B", 50), ("C", 20)))
+        status = _weighted(rng, VIOLATION_STATUSES)
+        for violation_id in range(1, self.rows("violations") + 1):
+            b = pick()
+            inspected = self._days_ago(rng, 5475)
+            issued = inspected + timedelta(days=rng.randrange(1, 15))
+            violation_status, current_status, current_status_id = status()
+            yield (
+                violation_id,
+                b.bbl,
+                b.bin,
+                b.block,
+                b.lot,
+                self._borough(b.boro_id).name,
+                rng.choice(VIOLATION_DESCRIPTIONS),
+                "Original",
+                violation_class(),
+                rng.random() < 0.08,
+                violation_status,
+                current_status,
+                current_status_id,
+                issued + timedelta(days=rng.randrange(0, 400)),
+                inspected,
+                issued,
+                issued,
+                b.house_number,
+                b.street_name,
+                f"{rng.randint(1, 6)}{rng.choice('ABCDEF')}",
+                str(rng.randint(1, 6)),
+            )
+
+    def building_evictions(self) -> Iterator[tuple]:
+        rng = self.rng("building_evictions")
+        pick = self._sampler(rng, "eviction_rate")
+        for seq in range(1, self.rows("evictions") + 1):
+            b = pick()
+            borough = self._borough(b.boro_id)
+            executed = self._days_ago(rng, 2920)
+            first, last = rng.choice(MARSHALS)
+            # 같은 건물이라도 호수별로 조금씩 다른 좌표가 찍힘
+            yield (
+                f"{seq:06d}",
+                f"LT-{seq:06d}-{executed.year % 100:02d}/{borough.name[:2]}",
+                b.bbl,
+                b.bin,
+                borough.name,
+                b.zip,
+                f"{b.house_number} {b.street_name}",
+                f"{rng.randint(1, 6)}{rng.choice('ABCDEF')}",
+                b.community_board,
+                rng.randint(1, 51),
+                str(rng.randint(1, 1500)),
+                f"{borough.name[:2]}{rng.randint(1, 99):02d}",
+                round(b.latitude + rng.uniform(-0.0003, 0.0003), 6),
+                round(b.longitude + rng.uniform(-0.0003, 0.0003), 6),
+                executed,
+                "Residential" if rng.random() < 0.94 else "Commercial",
+                "Not an Ejectment",
+                "Possession",
+                first,
+                last,
+            )
+
+    def building_rent_stabilized_list(self) -> Iterator[tuple]:
+        rng = self.rng("building_rent_stabilized_list")
+        years = (self.as_of.year - 2, self.as_of.year - 1)
+        for b in self.buildings:
+            borough = self._borough(b.boro_id)
+            if rng.random() >= borough.stabilized_share:
+                continue
+            for year in years:
+                # 일부 건물은 해마다 목록에서 빠짐
+                if year == years[-1] and rng.random() < 0.05:
+                    continue
+                yield (
+                    b.bbl,
+                    borough.name,
+                    b.block,
+                    b.lot,
+                    b.zip,
+                    borough.cities[0],
+                    "STABILIZED",
+                    year,
+                )
+
+    def _acris_documents(self) -> Iterator[tuple]:
+        """(document_id, doc_type, doc_date, buildings) shared by the three ACRIS tables."""
+        rng = self.rng("acris_documents")
+        doc_type = _weighted(rng, ACRIS_DOC_TYPES)
+        buildings = self.buildings
+        # 거래는 위반보다 훨씬 고르게 분포: 완만한 꼬리
+        cum = list(
+            itertools.accumulate(min(rng.paretovariate(3.0), 20.0) for _ in buildings)
+        )
+        total = cum[-1]
+        for seq in range(1, self.rows("acris_documents") + 1):
+            index = bisect(cum, rng.random() * total)
+            lots = [buildings[index]]
+            if rng.random() < 0.05:
+                # 여러 필지를 묶은 문서 (같은 블록의 이웃 필지)
+                lots += [
+                    b
+                    for b in buildings[index + 1 : index + rng.randint(2, 4)]
+                    if b.boro_id == lots[0].boro_id and b.block == lots[0].block
+                ]
+            doc_date = self._days_ago(rng, 7300)
+            yield f"{doc_date.year}{seq:012d}", doc_type(), doc_date, lots
+
+    def building_acris_master(self) -> Iterator[tuple]:
+        rng = self.rng("building_acris_master")
+        for document_id, doc_type, doc_date, lots in self._acris_documents():
+            amount = round(rng.lognormvariate(13.0, 1.1), 2) if doc_type != "SAT" else 0
+            yield (document_id, lots[0].boro_id, doc_type, doc_date, amount)
+
+    def building_acris_legals(self) -> Iterator[tuple]:
+        for document_id, _, _, lots in self._acris_documents():
+            for b in lots:
+                yield (document_id, b.boro_id, b.block, b.lot, b.bbl)
+
+    def building_acris_parties(self) -> Iterator[tuple]:
+        rng = self.rng("building_acris_parties")
+        owners = max(2, len(self.buildings) // 8)
+        for document_id, _, _, lots in self._acris_documents():
+            seen = set()
+            for party_type in ("1", "2", "2")[: rng.choice((2, 2, 2, 3))]:
+                if rng.random() < 0.5:
+                    name = self._corporation(rng, owners)
+                else:
+                    first, last = self._person(rng)
+                    name = f"{last}, {first}"
+                address = f"{rng.randrange(1, 900)} {rng.choice(STREETS)}"
+                if (party_type, name, address) in seen:
+                    continue
+                seen.add((party_type, name, address))
+                borough = self._borough(lots[0].boro_id)
+                yield (
+                    document_id,
+                    party_type,
+                    name,
+                    address,
+                    borough.cities[0],
+                    "NY",
+                    str(rng.randint(*borough.zips)),
+                )
+
+    # ---------- loading ----------
+
+    def table_rows(self, table: str) -> Iterator[tuple]:
+        return getattr(self, table)()
+
+    def load(
+        self,
+        tables: Optional[Sequence[str]] = None,
+        *,
+        truncate: bool = False,
+        snapshots: bool = False,
+        client_factory=PostgresClient,
+    ) -> Dict[str, int]:
+        """
+        COPY generated rows into each table; one transaction per table.
+
+        building_acris_documents is rebuilt from the ACRIS tables. Existing
+        building_profile_snapshot rows are dropped since they no longer
+        match; snapshots=True rebuilds them for every generated BBL.
+        """
+        names = [c.TABLE_NAME for c in self.TABLES]
+        selected = [t for t in names if tables is None or t in tables]
+        unknown = set(tables or ()) - set(names)
+        if unknown:
+            raise ValueError(f"Unknown tables: {sorted(unknown)}")
+
+        columns = {c.TABLE_NAME: c.COLUMNS for c in self.TABLES}
+        counts: Dict[str, int] = {}
+        for table in selected:
+            started = time.perf_counter()
+            with client_factory(pooled=False) as db:
+                if truncate:
+                    db.execute(f"TRUNCATE {table}")
+                elif db.exists(f"SELECT 1 FROM {table} LIMIT 1"):
+                    raise ValueError(
+                        f"{table} is not empty; pass truncate=True to replace it"
+                    )
+                counts[table] = db.copy_rows(
+                    table, columns[table], self.table_rows(table)
+                )
+            print(
+                f"[SyntheticData] {table}: {counts[table]} rows "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+
+        with client_factory(pooled=False) as db:
+            started = time.perf_counter()
+            written = refresh_acris_documents(db, None)
+            print(
+                f"[SyntheticData] building_acris_documents: {written} rows "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+            started = time.perf_counter()
+            written = refresh_owner_index(db, None)
+            print(
+                f"[SyntheticData] building_owner_index: {written} rows "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+            db.execute("TRUNCATE building_profile_snapshot")
+            bump_data_version(db)
+        if snapshots:
+            self.load_snapshots(client_factory=client_factory)
+
+        with client_factory(pooled=False) as db:
+            db.conn.autocommit = True
+            for table in selected + [
+                "building_acris_documents",
+                "building_owner_index",
+                "building_profile_snapshot",
+            ]:
+                db.execute(f"ANALYZE {table}")
+        return counts
+
+    def load_snapshots(
+        self, batch_size: int = 10_000, client_factory=PostgresClient
+    ) -> int:
+        """Build building_profile_snapshot for every BBL; one transaction per batch."""
+        started = time.perf_counter()
+        bbls = [b.bbl for b in self.buildings]
+        written = 0
+        for start in range(0, len(bbls), batch_size):
+            with client_factory(pooled=False) as db:
+                written += refresh_profile_snapshots(
+                    db, bbls[start : start + batch_size]
+                )
+        print(
+            f"[SyntheticData] building_profile_snapshot: {written} rows "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+        return written
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None)
+    parser.add_argument("--tables", type=lambda s: s.split(","), default=None)
+    parser.add_argument("--truncate", action="store_true", help="replace existing rows")
+    parser.add_argument(
+        "--snapshots", action="store_true", help="rebuild building profile snapshots"
+    )
+    args = parser.parse_args(argv)
+
+    print(f"=== [SyntheticData] scale={args.scale} seed={args.seed} ===")
+    generator = SyntheticDataGenerator(args.scale, args.seed, args.as_of)
+    counts = generator.load(
+        args.tables, truncate=args.truncate, snapshots=args.snapshots
+    )
+    print(f"=== [SyntheticData] Loaded {sum(counts.values())} rows ===")
+
+
+if __name__ == "__main__":
+    main()
@@ -300,6 +300,77 @@ class CrawlerErrorHandlingTests(TestCase):
         except Exception as e:
             self.skipTest(f"crawler load test failed: {e}")
 
+    def test_crawler_load_refreshes_profile_snapshots(self):
+        """Test load() rebuilds snapshots for the batch keys on the loading connection"""
+        for crawler, rows, key, keys in (
+            (
+                ViolationCrawler(),
+                [{"violation_id": 1, "bbl": "1"}, {"violation_id": 2, "bbl": "2"}],
+                "bbl",
+                ["1", "2"],
+            ),
+            (
+                RegistrationContactCrawler(),
+                [{"registration_contact_id": 1, "registration_id": 7}],
+                "registration_id",
+                [7],
+            ),
+            (AcrisPartiesCrawler(), [{"document_id": "D1"}], "document_id", ["D1"]),
+        ):
+            module = crawler.__class__.__module__
+            with patch(f"{module}.PostgresClient") as client, patch(
+                f"{module}.refresh_profile_snapshots"
+            ) as refresh:
+                db = client.return_value.__enter__.return_value
+                crawler.load(rows)
+            refresh.assert_called_once_with(db, keys, key=key)
+
+    def test_acris_crawlers_refresh_document_index_before_snapshots(self):
+        """Test ACRIS legals/master loads rebuild building_acris_documents, then the owner index"""
+        for crawler, rows, key, keys in (
+            (AcrisLegalsCrawler(), [{"document_id": "D1", "bbl": "1"}], "bbl", ["1"]),
+            (AcrisMasterCrawler(), [{"document_id": "D1"}], "document_id", ["D1"]),
+        ):
+            module = crawler.__class__.__module__
+            calls = Mock()
+            with patch(f"{module}.PostgresClient") as client, patch(
+                f"{module}.refresh_acris_documents", calls.documents
+            ), patch(f"{module}.refresh_owner_index", calls.owners), patch(
+                f"{module}.refresh_profile_snapshots", calls.snapshots
+            ):
+                db = client.return_value.__enter__.return_value
+                crawler.load(rows)
+            self.assertEqual(
+                [c[0] for c in calls.mock_calls], ["documents", "owners", "snapshots"]
+            )
+            calls.documents.assert_called_once_with(db, keys, key=key)
+            calls.owners.assert_called_once_with(db, keys, key=key)
+
+    def test_owner_crawlers_refresh_owner_index(self):
+        """Test owner-source loads rebuild building_owner_index before the snapshot refresh"""
+        for crawler, rows, key, keys in (
+            (RegistrationCrawler(), [{"bbl": "1"}], "bbl", ["1"]),
+            (
+                RegistrationContactCrawler(),
+                [{"registration_id": 7}],
+                "registration_id",
+                [7],
+            ),
+            (AcrisMasterCrawler(), [{"document_id": "D1"}], "document_id", ["D1"]),
+            (AcrisLegalsCrawler(), [{"document_id": "D1", "bbl": "1"}], "bbl", ["1"]),
+            (AcrisPartiesCrawler(), [{"document_id": "D1"}], "document_id", ["D1"]),
+        ):
+            module = crawler.__class__.__module__
+            calls = Mock()
+            with patch(f"{module}.PostgresClient") as client, patch(
+                f"{module}.refresh_profile_snapshots", calls.snapshots
+            ), patch(f"{module}.refresh_owner_index", calls.owners):
+                db = client.return_value.__enter__.return_value
+                crawler.load(rows)
+            # snapshot 갱신(data_version bump)이 마지막
+            self.assertEqual([c[0] for c in calls.mock_calls], ["owners", "snapshots"])
+            calls.owners.assert_called_once_with(db, keys, key=key)
+
     def test_crawler_normalize_row_error_handling(self):
         """Test crawler normalize_row error handling"""
         crawler = ViolationCrawler()
@@ -387,3 +458,90 @@ class CrawlerIntegrationTests(TestCase):
 
         # Test that field candidates is not empty
         self.assertGreater(len(crawler.FIELD_CANDIDATES), 0)
+
+
+class SyntheticDataTests(TestCase):
+    def _generator(self, seed=7):
+        from datetime import date
+
+        from crawlers.synthetic_data import SyntheticDataGenerator
+
+        return SyntheticDataGenerator(scale=0.0005, seed=seed, as_of=date(2025, 1, 1))
+
+    def test_rows_match_crawler_columns(self):
+        """Every table is generated in its crawler's COLUMNS order"""
+        generator = self._generator()
+        for crawler in generator.TABLES:
+            rows = list(generator.table_rows(crawler.TABLE_NAME))
+            self.assertTrue(rows, crawler.TABLE_NAME)
+            for row in rows[:50]:
+                self.assertEqual(len(row), len(crawler.COLUMNS), crawler.TABLE_NAME)
+
+    def test_same_seed_is_reproducible(self):
+        """Same seed gives identical rows; another seed does not"""
+        first = list(self._generator().table_rows("building_violations"))
+        self.assertEqual(
+            first, list(self._generator().table_rows("building_violations"))
+        )
+        self.assertNotEqual(
+            first, list(self._generator(seed=8).table_rows("building_violations"))
+        )
+
+    def test_keys_are_unique_and_reference_buildings(self):
+        """Primary keys are unique and child rows point at generated BBLs"""
+        generator = self._generator()
+        bbls = {b.bbl for b in generator.buildings}
+        self.assertEqual(len(bbls), len(generator.buildings))
+
+        for crawler, key in (
+            (ViolationCrawler, ["violation_id"]),
+            (ComplaintCrawler, ["complaint_id"]),
+            (EvictionCrawler, ["docket_number", "court_index_number"]),
+            (AcrisLegalsCrawler, ["document_id", "borough", "block", "lot"]),
+        ):
+            columns = crawler.COLUMNS
+            rows = list(generator.table_rows(crawler.TABLE_NAME))
+            keys = {tuple(r[columns.index(k)] for k in key) for r in rows}
+            self.assertEqual(len(keys), len(rows), crawler.TABLE_NAME)
+            self.assertTrue(
+                {r[columns.index("bbl")] for r in rows} <= bbls, crawler.TABLE_NAME
+            )
+
+        masters = {r[0] for r in generator.table_rows("building_acris_master")}
+        legals = {r[0] for r in generator.table_rows("building_acris_legals")}
+        parties = {r[0] for r in generator.table_rows("building_acris_parties")}
+        self.assertEqual(masters, legals)
+        self.assertEqual(masters, parties)
+
+    def test_violations_are_skewed_toward_few_buildings(self):
+        """A small share of buildings carries a large share of violations"""
+        from collections import Counter
+
+        generator = self._generator()
+        counts = Counter(r[1] for r in generator.table_rows("building_violations"))
+        top = sum(c for _, c in counts.most_common(len(generator.buildings) // 10))
+        self.assertGreater(top / sum(counts.values()), 0.3)
+
+    def test_load_copies_each_table(self):
+        """load() refuses non-empty tables unless truncate is set"""
+        generator = self._generator()
+        db = Mock()
+        db.exists.return_value = False
+        db.copy_rows.side_effect = lambda table, columns, rows: sum(1 for _ in rows)
+        factory = Mock()
+        factory.return_value.__enter__ = Mock(return_value=db)
+        factory.return_value.__exit__ = Mock(return_value=False)
+
+        counts = generator.load(["building_registrations"], client_factory=factory)
+        self.assertEqual(counts, {"building_registrations": len(generator.buildings)})
+        db.execute.assert_any_call("ANALYZE building_registrations")
+
+        db.exists.return_value = True
+        with self.assertRaises(ValueError):
+            generator.load(["building_violations"], client_factory=factory)
+        counts = generator.load(
+            ["building_violations"], truncate=True, client_factory=factory
+        )
+        db.execute.assert_any_call("TRUNCATE building_violations")
+        with self.assertRaises(ValueError):
+            generator.load(["not_a_table"], client_factory=factory)
@@ -6,11 +6,13 @@ import requests
 
 from common.exceptions.db_error import DatabaseError
 from common.interfaces.data_crawler import DataCrawler
+from infrastructures.postgres.building_repository import refresh_profile_snapshots
 from infrastructures.postgres.postgres_client import PostgresClient
 
 
 class ViolationCrawler(DataCrawler):
     TABLE_NAME = "building_violations"
+    USE_COPY = True
     API_URL = "https://data.cityofnewyork.us/resource/wvxf-dwi5.json"
     CONFLICT_TARGET = ["violation_id"]
 
@@ -267,7 +269,14 @@ class ViolationCrawler(DataCrawler):
             try:
                 conflict_target = getattr(self, "CONFLICT_TARGET", None)
                 count = db.bulk_insert(
-                    self.TABLE_NAME, self.COLUMNS, rows, conflict_target=conflict_target
+                    self.TABLE_NAME,
+                    self.COLUMNS,
+                    rows,
+                    conflict_target=conflict_target,
+                    use_copy=self.USE_COPY,
+                )
+                refresh_profile_snapshots(
+                    db, [r.get(self.SNAPSHOT_KEY) for r in rows], key=self.SNAPSHOT_KEY
                 )
                 print(
                     f"[{self.__class__.__name__}] Inserted {count} rows into {self.TABLE_NAME}."
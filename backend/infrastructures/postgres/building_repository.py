@@ -1,19 +1,870 @@
-from typing import Any, Dict, List, Sequence
+import base64
+import binascii
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from functools import partial
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
 
 from common.models.building import (
+    ROW_SECTIONS,
+    BuildingBatchResult,
+    CollectionPage,
+    build_building_from_profile_row,
     build_building_from_rows,
+    decode_profile_json,
 )
+from common.utils.env_util import get_env
 from infrastructures.postgres.postgres_client import PostgresClient
+from infrastructures.postgres.profile_cache import bump_data_version
+
+# 건물 프로필 전체를 한 번의 왕복으로 가져오는 쿼리 (섹션별 json_agg).
+# violations/complaints/evictions 는 최신순으로 %(page_limit)s 행까지 (NULL = 전부)
+BUILDING_PROFILE_SQL = """
+    WITH reg AS (
+        SELECT
+            bbl, bin, boro_id, boro, block, lot,
+            house_number, street_name, zip, community_board,
+            last_registration_date, registration_end_date,
+            registration_id, building_id
+        FROM building_registrations
+        WHERE bbl = %(bbl)s
+        LIMIT 1
+    ),
+    legals AS (
+        SELECT
+            document_id, bbl, borough, block, lot
+        FROM building_acris_legals
+        WHERE bbl = %(bbl)s
+    ),
+    docs AS (
+        SELECT DISTINCT document_id
+        FROM legals
+        WHERE document_id IS NOT NULL AND document_id <> ''
+    )
+    SELECT
+        (SELECT row_to_json(r)::text FROM reg r) AS registration,
+        (
+            SELECT COALESCE(json_agg(c), '[]')::text
+            FROM (
+                SELECT
+                    registration_contact_id, registration_id, type, contact_description,
+                    first_name, last_name, corporation_name,
+                    business_house_number, business_street_name,
+                    business_city, business_state, business_zip, business_apartment
+                FROM building_registration_contacts
+                WHERE registration_id = (SELECT registration_id FROM reg)
+            ) c
+        ) AS contacts,
+        (
+            SELECT COALESCE(json_agg(a), '[]')::text
+            FROM (
+                SELECT
+                    project_id,bbl,project_name,project_start_date,
+                    reporting_construction_type,extended_affordability_status,prevailing_wage_status,
+                    extremely_low_income_units,very_low_income_units,low_income_units,
+                    counted_rental_units,all_counted_units,total_units
+                FROM building_affordable_housing
+                WHERE bbl = %(bbl)s
+            ) a
+        ) AS affordable,
+        (
+            SELECT COALESCE(
+                json_agg(c ORDER BY COALESCE(c.complaint_status_date, '-infinity'::timestamp) DESC,
+                                    c.complaint_id DESC),
+                '[]'
+            )::text
+            FROM (
+                SELECT
+                    complaint_id, bbl, borough, block, lot, problem_id, unit_type, space_type,
+                    type, major_category, minor_category, complaint_status, complaint_status_date,
+                    problem_status, problem_status_date, status_description,
+                    house_number, street_name, post_code, apartment
+                FROM building_complaints
+                WHERE bbl = %(bbl)s
+                ORDER BY COALESCE(complaint_status_date, '-infinity'::timestamp) DESC, complaint_id DESC
+                LIMIT %(page_limit)s
+            ) c
+        ) AS complaints,
+        (
+            SELECT COALESCE(
+                json_agg(v ORDER BY COALESCE(v.inspection_date, '-infinity'::timestamp) DESC,
+                                    v.violation_id DESC),
+                '[]'
+            )::text
+            FROM (
+                SELECT
+                    violation_id,bbl,bin,block,lot,boro,
+                    nov_description,nov_type,class,rent_impairing,
+                    violation_status,current_status,current_status_id,current_status_date,
+                    inspection_date,nov_issued_date,approved_date,
+                    house_number,street_name,apartment,story
+                FROM building_violations
+                WHERE bbl = %(bbl)s
+                ORDER BY COALESCE(inspection_date, '-infinity'::timestamp) DESC, violation_id DESC
+                LIMIT %(page_limit)s
+            ) v
+        ) AS violations,
+        (
+            SELECT COALESCE(
+                json_agg(e ORDER BY COALESCE(e.executed_date, '-infinity'::timestamp) DESC,
+                                    e.docket_number DESC, e.court_index_number DESC),
+                '[]'
+            )::text
+            FROM (
+                SELECT
+                    docket_number, court_index_number, bbl, bin, borough,
+                    eviction_zip, eviction_address, eviction_apt_num,
+                    community_board, council_district, census_tract, nta,
+                    latitude, longitude, executed_date,
+                    residential_commercial_ind, ejectment, eviction_possession,
+                    marshal_first_name, marshal_last_name
+                FROM building_evictions
+                WHERE bbl = %(bbl)s
+                ORDER BY COALESCE(executed_date, '-infinity'::timestamp) DESC,
+                         docket_number DESC, court_index_number DESC
+                LIMIT %(page_limit)s
+            ) e
+        ) AS evictions,
+        (
+            SELECT row_to_json(t)::text
+            FROM (
+                SELECT
+                    bbl, borough, block, lot, zip, city, status, source_year
+                FROM building_rent_stabilized_list
+                WHERE bbl = %(bbl)s
+                LIMIT 1
+            ) t
+        ) AS rent_stabilized,
+        (SELECT COALESCE(json_agg(l), '[]')::text FROM legals l) AS acris_legals,
+        (
+            SELECT COALESCE(json_agg(m), '[]')::text
+            FROM (
+                SELECT
+                    document_id, borough, doc_type, doc_date, doc_amount
+                FROM building_acris_documents
+                WHERE bbl = %(bbl)s
+            ) m
+        ) AS acris_master,
+        (
+            SELECT COALESCE(json_agg(p), '[]')::text
+            FROM (
+                SELECT
+                    document_id, party_type, name, address1, city, state, zip
+                FROM building_acris_parties
+                WHERE document_id IN (SELECT document_id FROM docs)
+            ) p
+        ) AS acris_parties
+"""
+
+
+# 섹션별 행 수. Building 이 중복 제거하는 키가 모두 PK 라 len(섹션) 과 같은 값
+BUILDING_COUNTS_SQL = """
+    WITH docs AS (
+        SELECT DISTINCT document_id
+        FROM building_acris_legals
+        WHERE bbl = %(bbl)s AND document_id IS NOT NULL AND document_id <> ''
+    )
+    SELECT
+        (
+            SELECT COUNT(*)
+            FROM building_registration_contacts
+            WHERE registration_id = (
+                SELECT registration_id FROM building_registrations WHERE bbl = %(bbl)s
+            )
+        ) AS contacts,
+        (SELECT COUNT(*) FROM building_affordable_housing WHERE bbl = %(bbl)s) AS affordable,
+        (SELECT COUNT(*) FROM building_complaints WHERE bbl = %(bbl)s) AS complaints,
+        (SELECT COUNT(*) FROM building_violations WHERE bbl = %(bbl)s) AS violations,
+        (SELECT COUNT(*) FROM building_evictions WHERE bbl = %(bbl)s) AS evictions,
+        (SELECT COUNT(*) FROM building_acris_documents WHERE bbl = %(bbl)s) AS acris_docs,
+        (
+            SELECT COUNT(*) FROM building_acris_legals
+            WHERE bbl = %(bbl)s AND document_id IS NOT NULL AND document_id <> ''
+        ) AS acris_legals,
+        (
+            SELECT COUNT(*) FROM building_acris_parties
+            WHERE document_id IN (SELECT document_id FROM docs)
+        ) AS acris_parties
+"""
+
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+@dataclass(frozen=True)
+class PagedCollection:
+    """
+    Keyset pagination of one building collection, newest first.
+
+    Rows are ordered by (COALESCE(date_column, -infinity), *key_columns) DESC
+    - undated rows last - which 0003_building_collection_indexes indexes per
+    bbl, so every page is a bounded index range scan whatever the offset.
+    """
+
+    table: str
+    columns: str
+    date_column: str
+    key_columns: Tuple[str, ...]
+    key_types: Tuple[type, ...]
+    rows_kw: str
+
+    @property
+    def sort_columns(self) -> Tuple[str, ...]:
+        return (
+            f"COALESCE({self.date_column}, '-infinity'::timestamp)",
+        ) + self.key_columns
+
+    def page_sql(self, after: bool) -> str:
+        where = "bbl = %(bbl)s"
+        if after:
+            keys = ", ".join(f"%(after_{i})s" for i in range(len(self.key_columns)))
+            where += (
+                f" AND ({', '.join(self.sort_columns)}) <"
+                f" (COALESCE(%(after_date)s::timestamp, '-infinity'::timestamp), {keys})"
+            )
+        order = ", ".join(f"{c} DESC" for c in self.sort_columns)
+        return (
+            f"SELECT {self.columns} FROM {self.table} WHERE {where}"
+            f" ORDER BY {order} LIMIT %(limit)s"
+        )
+
+    def cursor_values(self, item) -> List[Any]:
+        """Sort key of a model instance (the last item of a page)."""
+        return [getattr(item, c) for c in (self.date_column,) + self.key_columns]
+
+    def encode_cursor(self, item) -> str:
+        values = [
+            v.isoformat() if isinstance(v, (date, datetime)) else v
+            for v in self.cursor_values(item)
+        ]
+        raw = json.dumps(values, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> Dict[str, Any]:
+        """Cursor -> page_sql(after=True) params; ValueError if it is not ours."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(raw)
+        except (ValueError, binascii.Error):
+            raise ValueError("Invalid cursor") from None
+        if not isinstance(values, list) or len(values) != 1 + len(self.key_columns):
+            raise ValueError("Invalid cursor")
+
+        after_date, keys = values[0], values[1:]
+        # type() 비교라 bool 은 int 키로 받지 않음
+        if not all(type(v) is t for v, t in zip(keys, self.key_types)):
+            raise ValueError("Invalid cursor")
+        if after_date is not None:
+            try:
+                after_date = datetime.fromisoformat(after_date)
+            except (TypeError, ValueError):
+                raise ValueError("Invalid cursor") from None
+
+        params = {"after_date": after_date}
+        params.update({f"after_{i}": v for i, v in enumerate(keys)})
+        return params
+
+
+# 페이지네이션되는 컬렉션 (Building 필드 이름 -> 정렬/조회 정의)
+PAGED_COLLECTIONS: Dict[str, PagedCollection] = {
+    "violations": PagedCollection(
+        table="building_violations",
+        columns="""
+            violation_id,bbl,bin,block,lot,boro,
+            nov_description,nov_type,class,rent_impairing,
+            violation_status,current_status,current_status_id,current_status_date,
+            inspection_date,nov_issued_date,approved_date,
+            house_number,street_name,apartment,story
+        """,
+        date_column="inspection_date",
+        key_columns=("violation_id",),
+        key_types=(int,),
+        rows_kw="violation_rows",
+    ),
+    "complaints": PagedCollection(
+        table="building_complaints",
+        columns="""
+            complaint_id, bbl, borough, block, lot, problem_id, unit_type, space_type,
+            type, major_category, minor_category, complaint_status, complaint_status_date,
+            problem_status, problem_status_date, status_description,
+            house_number, street_name, post_code, apartment
+        """,
+        date_column="complaint_status_date",
+        key_columns=("complaint_id",),
+        key_types=(int,),
+        rows_kw="complaint_rows",
+    ),
+    "evictions": PagedCollection(
+        table="building_evictions",
+        columns="""
+            docket_number, court_index_number, bbl, bin, borough,
+            eviction_zip, eviction_address, eviction_apt_num,
+            community_board, council_district, census_tract, nta,
+            latitude, longitude, executed_date,
+            residential_commercial_ind, ejectment, eviction_possession,
+            marshal_first_name, marshal_last_name
+        """,
+        date_column="executed_date",
+        key_columns=("docket_number", "court_index_number"),
+        key_types=(str, str),
+        rows_kw="eviction_rows",
+    ),
+}
+
+
+def split_page(collection: str, items: List[Any], limit: int):
+    """items fetched with LIMIT limit + 1 -> (first `limit` items, next cursor or None)."""
+    if len(items) <= limit:
+        return items, None
+    page = items[:limit]
+    return page, PAGED_COLLECTIONS[collection].encode_cursor(page[-1])
+
+
+# ---------- building_profile_snapshot (0004_building_profile_snapshot) ----------
+
+# BUILDING_PROFILE_SQL 의 섹션 컬럼 = snapshot profile 문서의 키
+PROFILE_SECTIONS = (
+    "registration",
+    "contacts",
+    "affordable",
+    "complaints",
+    "violations",
+    "evictions",
+    "rent_stabilized",
+    "acris_legals",
+    "acris_master",
+    "acris_parties",
+)
+# 페이지 컬렉션은 기본 첫 페이지 + 1 행(다음 페이지 유무)까지만 저장해 문서를 작게 유지.
+# 더 큰 limit 은 행 수가 이 안에 들 때만 snapshot 으로, 아니면 실시간 조립
+SNAPSHOT_ROWS = DEFAULT_PAGE_SIZE + 1
+# 한 문장에서 다시 만드는 BBL 수
+SNAPSHOT_REFRESH_BATCH = 500
+
+# 크롤러 행의 키 -> 그 행이 속한 BBL 들 (%(keys)s = 배치의 키 배열)
+SNAPSHOT_TOUCHED_BBLS_SQL = {
+    "bbl": "SELECT unnest(%(keys)s::text[])",
+    "registration_id": """
+        SELECT bbl FROM building_registrations
+        WHERE registration_id = ANY(%(keys)s::int[])
+    """,
+    "document_id": """
+        SELECT bbl FROM building_acris_legals
+        WHERE document_id = ANY(%(keys)s::text[])
+    """,
+}
+
+# 프로필/건수 쿼리를 BBL 배열에 대해 LATERAL 로 한 번에 실행해 upsert.
+# SQL 을 그대로 재사용해야 snapshot 과 실시간 조립 결과가 같음
+REFRESH_SNAPSHOTS_SQL = """
+    INSERT INTO building_profile_snapshot (bbl, profile, counts, refreshed_at)
+    SELECT
+        touched.bbl,
+        jsonb_build_object({profile_columns}),
+        to_jsonb(counts),
+        now()
+    FROM (
+        SELECT DISTINCT bbl FROM ({touched_bbls}) k(bbl) WHERE bbl IS NOT NULL AND bbl <> ''
+    ) touched
+    CROSS JOIN LATERAL ({profile_sql}) profile
+    CROSS JOIN LATERAL ({counts_sql}) counts
+    ON CONFLICT (bbl) DO UPDATE SET
+        profile = EXCLUDED.profile,
+        counts = EXCLUDED.counts,
+        refreshed_at = EXCLUDED.refreshed_at
+"""
+
+# building_acris_documents (BBL 별 문서 인덱스) 를 legals ⋈ master 로 다시 만듦.
+# {where} 가 비면 전체 재구성
+ACRIS_DOCUMENTS_DELETE_SQL = """
+    DELETE FROM building_acris_documents
+    WHERE bbl IN (SELECT bbl FROM ({touched_bbls}) k(bbl))
+"""
+
+ACRIS_DOCUMENTS_INSERT_SQL = """
+    INSERT INTO building_acris_documents (
+        bbl, document_id, borough, doc_type, doc_date, doc_amount
+    )
+    SELECT DISTINCT
+        l.bbl, m.document_id, m.borough, m.doc_type, m.doc_date, m.doc_amount
+    FROM building_acris_legals l
+    JOIN building_acris_master m ON m.document_id = l.document_id
+    WHERE l.bbl IS NOT NULL AND l.bbl <> ''{where}
+    ON CONFLICT DO NOTHING
+"""
+
+SNAPSHOT_SQL = """
+    SELECT profile::text AS profile, counts::text AS counts
+    FROM building_profile_snapshot
+    WHERE bbl = %s
+"""
+
+
+def _refresh_snapshots_sql(key: str) -> str:
+    def per_bbl(sql: str) -> str:
+        return sql.replace("%(bbl)s", "touched.bbl").replace(
+            "%(page_limit)s", str(SNAPSHOT_ROWS)
+        )
+
+    return REFRESH_SNAPSHOTS_SQL.format(
+        profile_columns=", ".join(
+            f"'{name}', profile.{name}::jsonb" for name in PROFILE_SECTIONS
+        ),
+        touched_bbls=SNAPSHOT_TOUCHED_BBLS_SQL[key],
+        profile_sql=per_bbl(BUILDING_PROFILE_SQL),
+        counts_sql=per_bbl(BUILDING_COUNTS_SQL),
+    )
+
+
+def refresh_profile_snapshots(
+    db: PostgresClient, keys: Iterable[Any], key: str = "bbl"
+) -> int:
+    """
+    Rebuild building_profile_snapshot rows for the BBLs a crawler batch touched.
+
+    keys are the batch's values of `key` (a bbl, registration_id or
+    document_id column); run it on the loading connection so the snapshots
+    commit together with the rows. It also bumps the data version, so every
+    worker's ProfileCache drops its entries after the commit. Returns the
+    number of snapshots written.
+    """
+    if key not in SNAPSHOT_TOUCHED_BBLS_SQL:
+        raise ValueError(f"Unknown snapshot key: {key!r}")
+    values = sorted({k for k in keys if k not in (None, "")})
+    sql = _refresh_snapshots_sql(key)
+    written = 0
+    for start in range(0, len(values), SNAPSHOT_REFRESH_BATCH):
+        chunk = values[start : start + SNAPSHOT_REFRESH_BATCH]
+        written += db.execute(sql, {"keys": chunk})
+    bump_data_version(db)
+    return written
+
+
+def refresh_acris_documents(
+    db: PostgresClient, keys: Optional[Iterable[Any]], key: str = "bbl"
+) -> int:
+    """
+    Rebuild building_acris_documents for the BBLs an ACRIS legals/master
+    batch touched (keys/key as in refresh_profile_snapshots), or for every
+    BBL when keys is None. Run it before refresh_profile_snapshots, which
+    reads the index. Returns the number of index rows written.
+    """
+    if key not in SNAPSHOT_TOUCHED_BBLS_SQL:
+        raise ValueError(f"Unknown snapshot key: {key!r}")
+    if keys is None:
+        db.execute("TRUNCATE building_acris_documents")
+        return db.execute(ACRIS_DOCUMENTS_INSERT_SQL.format(where=""))
+
+    touched = SNAPSHOT_TOUCHED_BBLS_SQL[key]
+    delete_sql = ACRIS_DOCUMENTS_DELETE_SQL.format(touched_bbls=touched)
+    insert_sql = ACRIS_DOCUMENTS_INSERT_SQL.format(
+        where=f" AND l.bbl IN (SELECT bbl FROM ({touched}) k(bbl))"
+    )
+    values = sorted({k for k in keys if k not in (None, "")})
+    written = 0
+    for start in range(0, len(values), SNAPSHOT_REFRESH_BATCH):
+        chunk = values[start : start + SNAPSHOT_REFRESH_BATCH]
+        db.execute(delete_sql, {"keys": chunk})
+        written += db.execute(insert_sql, {"keys": chunk})
+    return written
 
 
 class BuildingRepository:
+    # sections= 이름 -> 조회 메서드. 서로 독립적이라 concurrent 모드에서는 각각
+    # 별도 커넥션으로 동시에 실행 (acris master/parties 는 메서드 안에서 legals 다음에 순차)
+    SECTION_FETCHERS = {
+        "registration": "_fetch_registration",
+        "contacts": "_fetch_contacts",
+        "affordable": "_fetch_affordable",
+        "complaints": "_fetch_complaints",
+        "violations": "_fetch_violations",
+        "evictions": "_fetch_evictions",
+        "rent_stabilized": "_fetch_rent_tag",
+        "acris": "_fetch_acris",
+        "counts": "_fetch_counts",
+    }
 
-    def __init__(self):
+    def __init__(
+        self,
+        single_query: bool = False,
+        concurrent: bool = False,
+        snapshot: bool = False,
+    ):
         self.client_factory = PostgresClient
+        # True 면 get_by_bbl 이 BUILDING_PROFILE_SQL 한 번으로 전체 프로필을 조회
+        self.single_query = single_query
+        # True 면 섹션 쿼리를 스레드 풀에서 pooled 커넥션으로 동시에 실행
+        self.concurrent = concurrent
+        # True 면 전체 프로필을 building_profile_snapshot PK 조회로 먼저 시도 (없으면 위 경로)
+        self.snapshot = snapshot
+
+    def get_snapshot_by_bbl(
+        self, bbl: str, page_size: Optional[int] = None, with_counts: bool = False
+    ):
+        """
+        The crawler-maintained profile snapshot of `bbl` as a Building, or
+        None when there is no snapshot or it cannot serve `page_size`
+        (callers then assemble the profile live). Counts come from the
+        snapshot too, so this is a single primary-key lookup.
+        """
+        with self.client_factory(readonly=True) as db:
+            row = db.query_one(SNAPSHOT_SQL, (bbl,), prepare=True)
+        if row is None:
+            return None
+        counts = json.loads(row["counts"])
+        limit = _fetch_limit(page_size)
+        for name in PAGED_COLLECTIONS:
+            # 필요한 행(page_size + 1 또는 전부)이 저장된 최신 SNAPSHOT_ROWS 행 안에 있어야 함
+            total = counts.get(name, 0)
+            if (total if limit is None else min(total, limit)) > SNAPSHOT_ROWS:
+                return None
+
+        # 실시간 프로필과 같은 디코더 (Decimal 유지)
+        profile = decode_profile_json(row["profile"])
+        if limit is not None:
+            for name in PAGED_COLLECTIONS:
+                profile[name] = (profile.get(name) or [])[:limit]
+        building = build_building_from_profile_row(bbl, profile)
+        building.counts = counts if with_counts else None
+        if page_size is not None:
+            _paginate(building, PAGED_COLLECTIONS, page_size)
+        return building
+
+    def get_profile_by_bbl(
+        self, bbl: str, page_size: Optional[int] = None, with_counts: bool = False
+    ):
+        """
+        Fetch the whole building profile in one statement / one round-trip.
+
+        page_size: keep only the newest page of each PAGED_COLLECTIONS entry
+        (building.cursors holds the next-page cursors); with_counts also runs
+        BUILDING_COUNTS_SQL on the same connection.
+        """
+        params = {"bbl": bbl, "page_limit": _fetch_limit(page_size)}
+        with self.client_factory(readonly=True) as db:
+            row = db.query_one(BUILDING_PROFILE_SQL, params, prepare=True)
+            counts = self._fetch_counts(db, bbl)["counts"] if with_counts else None
+        building = build_building_from_profile_row(bbl, row)
+        building.counts = counts
+        if page_size is not None:
+            _paginate(building, PAGED_COLLECTIONS, page_size)
+        return building
+
+    def get_by_bbl(
+        self,
+        bbl: str,
+        single_query: Optional[bool] = None,
+        concurrent: Optional[bool] = None,
+        sections: Optional[Iterable[str]] = None,
+        page_size: Optional[int] = None,
+        snapshot: Optional[bool] = None,
+    ):
+        """
+        sections: subset of SECTION_FETCHERS to load (default: every row
+        section, no counts). Queries for other sections are skipped and the
+        returned Building loads them lazily on Building.load()/section().
+
+        page_size: load only the newest `page_size` violations/complaints/
+        evictions; building.cursors[name] continues with get_collection_page.
 
-    def get_by_bbl(self, bbl: str):
-        with self.client_factory() as db:
-            reg_row = db.query_one(
+        snapshot: serve full-profile requests from building_profile_snapshot
+        when it has the BBL, falling back to live assembly otherwise.
+        """
+        requested = ROW_SECTIONS if sections is None else frozenset(sections)
+        unknown = requested - set(self.SECTION_FETCHERS)
+        if unknown:
+            raise ValueError(f"Unknown building sections: {sorted(unknown)}")
+
+        if single_query is None:
+            single_query = self.single_query
+        if concurrent is None:
+            concurrent = self.concurrent
+        if snapshot is None:
+            snapshot = self.snapshot
+
+        if snapshot and requested >= ROW_SECTIONS:
+            building = self.get_snapshot_by_bbl(
+                bbl, page_size=page_size, with_counts="counts" in requested
+            )
+            if building is not None:
+                return building
+
+        if single_query and requested >= ROW_SECTIONS:
+            return self.get_profile_by_bbl(
+                bbl, page_size=page_size, with_counts="counts" in requested
+            )
+
+        names = [s for s in self.SECTION_FETCHERS if s in requested]
+        if concurrent and len(names) > 1:
+            rows = self._fetch_sections_concurrently(bbl, names, page_size)
+        else:
+            rows = {}
+            with self.client_factory(readonly=True) as db:
+                for name in names:
+                    rows.update(self._run_fetcher(db, name, bbl, page_size))
+
+        counts = rows.pop("counts", None)
+        building = build_building_from_rows(bbl=bbl, unique=True, **rows)
+        building.counts = counts
+        if page_size is not None:
+            _paginate(building, requested & set(PAGED_COLLECTIONS), page_size)
+        if not requested >= ROW_SECTIONS:
+            building.set_lazy(
+                requested, partial(self._load_sections, page_size=page_size)
+            )
+        return building
+
+    def get_collection_page(
+        self,
+        bbl: str,
+        collection: str,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> CollectionPage:
+        """
+        One page of violations/complaints/evictions, newest first.
+
+        cursor is the next_cursor of the previous page (or a Building's
+        cursors[collection]); ValueError for unknown collections or cursors.
+        """
+        spec = PAGED_COLLECTIONS.get(collection)
+        if spec is None:
+            raise ValueError(f"Unknown building collection: {collection!r}")
+        params = {"bbl": bbl, "limit": _fetch_limit(limit)}
+        if cursor:
+            params.update(spec.decode_cursor(cursor))
+
+        with self.client_factory(readonly=True) as db:
+            rows = db.query_all(spec.page_sql(after=bool(cursor)), params, prepare=True)
+
+        building = build_building_from_rows(
+            bbl=bbl, unique=True, **{spec.rows_kw: rows}
+        )
+        items, next_cursor = split_page(
+            collection, getattr(building, collection), limit
+        )
+        return CollectionPage(items=items, next_cursor=next_cursor, limit=limit)
+
+    def _load_sections(
+        self, building, sections: FrozenSet[str], page_size: Optional[int] = None
+    ) -> None:
+        """Building loader: fetch `sections` and copy them onto `building`."""
+        loaded = self.get_by_bbl(building.bbl, sections=sections, page_size=page_size)
+        building.copy_sections(loaded, sections)
+        if loaded.cursors:
+            building.cursors = {**(building.cursors or {}), **loaded.cursors}
+
+    def _run_fetcher(
+        self, db: PostgresClient, section: str, bbl: str, page_size: Optional[int]
+    ) -> Dict[str, Any]:
+        fetcher = getattr(self, self.SECTION_FETCHERS[section])
+        if section in PAGED_COLLECTIONS:
+            return fetcher(db, bbl, page_size=page_size)
+        return fetcher(db, bbl)
+
+    def _fetch_sections_concurrently(
+        self, bbl: str, sections: Sequence[str], page_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Run each section fetcher on its own pooled connection at once."""
+        futures = [
+            _section_executor().submit(self._fetch_section, section, bbl, page_size)
+            for section in sections
+        ]
+        rows: Dict[str, Any] = {}
+        for future in futures:
+            rows.update(future.result())
+        return rows
+
+    def _fetch_section(
+        self, section: str, bbl: str, page_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        with self.client_factory(readonly=True) as db:
+            return self._run_fetcher(db, section, bbl, page_size)
+
+    # ---------- sections (build_building_from_rows keyword -> rows) ----------
+
+    def _fetch_registration(self, db: PostgresClient, bbl: str) -> Dict[str, Any]:
+        reg_row = db.query_one(
+            """
+            SELECT
+                bbl, bin, boro_id, boro, block, lot,
+                house_number, street_name, zip, community_board,
+                last_registration_date, registration_end_date,
+                registration_id, building_id
+            FROM building_registrations
+            WHERE bbl = %s
+            """,
+            (bbl,),
+            prepare=True,
+        )
+        return {"reg_row": reg_row}
+
+    def _fetch_contacts(self, db: PostgresClient, bbl: str) -> Dict[str, Any]:
+        # registration_id 를 서브쿼리로 풀어 registration 조회와 독립적으로 실행
+        contact_rows = db.query_all(
+            """
+            SELECT
+                registration_contact_id, registration_id, type, contact_description,
+                first_name, last_name, corporation_name,
+                business_house_number, business_street_name,
+                business_city, business_state, business_zip, business_apartment
+            FROM building_registration_contacts
+            WHERE registration_id = (
+                SELECT registration_id FROM building_registrations WHERE bbl = %s
+            )
+            """,
+            (bbl,),
+            prepare=True,
+        )
+        return {"contact_rows": contact_rows}
+
+    def _fetch_affordable(self, db: PostgresClient, bbl: str) -> Dict[str, Any]:
+        affordable_rows = db.query_all(
+            """
+            SELECT
+                project_id,bbl,project_name,project_start_date,
+                reporting_construction_type,extended_affordability_status,prevailing_wage_status,
+                extremely_low_income_units,very_low_income_units,low_income_units,
+                counted_rental_units,all_counted_units,total_units
+            FROM building_affordable_housing
+            WHERE bbl = %s
+            """,
+            (bbl,),
+            prepare=True,
+        )
+        return {"affordable_rows": affordable_rows}
+
+    def _fetch_complaints(
+        self, db: PostgresClient, bbl: str, page_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        complaint_rows = db.query_all(
+            PAGED_COLLECTIONS["complaints"].page_sql(after=False),
+            {"bbl": bbl, "limit": _fetch_limit(page_size)},
+            prepare=True,
+        )
+        return {"complaint_rows": complaint_rows}
+
+    def _fetch_violations(
+        self, db: PostgresClient, bbl: str, page_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        violation_rows = db.query_all(
+            PAGED_COLLECTIONS["violations"].page_sql(after=False),
+            {"bbl": bbl, "limit": _fetch_limit(page_size)},
+            prepare=True,
+        )
+        return {"violation_rows": violation_rows}
+
+    def _fetch_evictions(
+        self, db: PostgresClient, bbl: str, page_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        eviction_rows = db.query_all(
+            PAGED_COLLECTIONS["evictions"].page_sql(after=False),
+            {"bbl": bbl, "limit": _fetch_limit(page_size)},
+            prepare=True,
+        )
+        return {"eviction_rows": eviction_rows}
+
+    def _fetch_rent_tag(self, db: PostgresClient, bbl: str) -> Dict[str, Any]:
+        rent_tag_row = db.query_one(
+            """
+            SELECT
+                bbl, borough, block, lot, zip, city, status, source_year
+            FROM building_rent_stabilized_list
+            WHERE bbl = %s
+            """,
+            (bbl,),
+            prepare=True,
+        )
+        return {"rent_tag_row": rent_tag_row}
+
+    def _fetch_acris(self, db: PostgresClient, bbl: str) -> Dict[str, Any]:
+        """Legals, master (building_acris_documents) and parties, each keyed on bbl."""
+        acris_legal_rows = db.query_all(
+            """
+            SELECT
+                document_id, bbl, borough, block, lot
+            FROM building_acris_legals
+            WHERE bbl = %s
+            """,
+            (bbl,),
+            prepare=True,
+        )
+
+        acris_master_rows: List[Dict[str, Any]] = []
+        acris_party_rows: List[Dict[str, Any]] = []
+        # 문서 인덱스/당사자는 legals 에서 파생 - legals 가 없는 (대부분의) 필지는 한 번으로 끝
+        if acris_legal_rows:
+            acris_master_rows = db.query_all(
+                """
+                SELECT
+                    document_id, borough, doc_type, doc_date, doc_amount
+                FROM building_acris_documents
+                WHERE bbl = %s
+                """,
+                (bbl,),
+                prepare=True,
+            )
+            acris_party_rows = db.query_all(
+                """
+                SELECT
+                    document_id, party_type, name, address1, city, state, zip
+                FROM building_acris_parties
+                WHERE document_id IN (
+                    SELECT document_id FROM building_acris_legals
+                    WHERE bbl = %s AND document_id IS NOT NULL AND document_id <> ''
+                )
+                """,
+                (bbl,),
+                prepare=True,
+            )
+        return {
+            "acris_legal_rows": acris_legal_rows,
+            "acris_master_rows": acris_master_rows,
+            "acris_party_rows": acris_party_rows,
+        }
+
+    def _fetch_counts(self, db: PostgresClient, bbl: str) -> Dict[str, Any]:
+        """Row counts per section, aggregated in SQL without fetching the rows."""
+        counts = db.query_one(BUILDING_COUNTS_SQL, {"bbl": bbl}, prepare=True)
+        return {"counts": dict(counts) if counts else None}
+
+    def get_many_by_bbl(
+        self, bbls: Sequence[str], chunk_size: int = 500
+    ) -> BuildingBatchResult:
+        """
+        Batched profile lookup: every section table is queried once per chunk
+        with `= ANY(%s)` and rows are grouped per BBL in Python.
+
+        Returns a BuildingBatchResult; BBLs whose chunk or assembly failed are
+        reported in `errors` instead of being dropped.
+        """
+        result = BuildingBatchResult()
+        unique = list(dict.fromkeys(b for b in bbls if b))
+        for start in range(0, len(unique), chunk_size):
+            chunk = unique[start : start + chunk_size]
+            try:
+                sections = self._fetch_sections_for_bbls(chunk)
+            except Exception as e:
+                for bbl in chunk:
+                    result.errors[bbl] = str(e)
+                continue
+
+            for bbl in chunk:
+                try:
+                    result.buildings[bbl] = self._assemble_from_sections(bbl, sections)
+                except Exception as e:
+                    result.errors[bbl] = str(e)
+        return result
+
+    def _fetch_sections_for_bbls(self, bbls: List[str]) -> Dict[str, Any]:
+        with self.client_factory(readonly=True, replica=True) as db:
+            reg_rows = db.query_all(
                 """
                 SELECT
                     bbl, bin, boro_id, boro, block, lot,
@@ -21,13 +872,23 @@ class BuildingRepository:
                     last_registration_date, registration_end_date,
                     registration_id, building_id
                 FROM building_registrations
-                WHERE bbl = %s
+                WHERE bbl = ANY(%s)
                 """,
-                (bbl,),
+                (bbls,),
             )
+            registrations: Dict[str, Dict[str, Any]] = {}
+            for r in reg_rows:
+                registrations.setdefault(r["bbl"], r)
 
+            registration_ids = sorted(
+                {
+                    r["registration_id"]
+                    for r in registrations.values()
+                    if r.get("registration_id") is not None
+                }
+            )
             contact_rows: List[Dict[str, Any]] = []
-            if reg_row and reg_row.get("registration_id") is not None:
+            if registration_ids:
                 contact_rows = db.query_all(
                     """
                     SELECT
@@ -36,9 +897,9 @@ class BuildingRepository:
                         business_house_number, business_street_name,
                         business_city, business_state, business_zip, business_apartment
                     FROM building_registration_contacts
-                    WHERE registration_id = %s
+                    WHERE registration_id = ANY(%s)
                     """,
-                    (reg_row["registration_id"],),
+                    (registration_ids,),
                 )
 
             affordable_rows = db.query_all(
@@ -49,9 +910,9 @@ class BuildingRepository:
                     extremely_low_income_units,very_low_income_units,low_income_units,
                     counted_rental_units,all_counted_units,total_units
                 FROM building_affordable_housing
-                WHERE bbl = %s
+                WHERE bbl = ANY(%s)
                 """,
-                (bbl,),
+                (bbls,),
             )
 
             complaint_rows = db.query_all(
@@ -62,9 +923,9 @@ class BuildingRepository:
                     problem_status, problem_status_date, status_description,
                     house_number, street_name, post_code, apartment
                 FROM building_complaints
-                WHERE bbl = %s
+                WHERE bbl = ANY(%s)
                 """,
-                (bbl,),
+                (bbls,),
             )
 
             violation_rows = db.query_all(
@@ -76,107 +937,161 @@ class BuildingRepository:
                     inspection_date,nov_issued_date,approved_date,
                     house_number,street_name,apartment,story
                 FROM building_violations
-                WHERE bbl = %s
+                WHERE bbl = ANY(%s)
                 """,
-                (bbl,),
+                (bbls,),
             )
 
             eviction_rows = db.query_all(
                 """
-                SELECT docket_number,
-                       court_index_number,
-                       bbl,
-                       bin,
-                       borough,
-                       eviction_zip,
-                       eviction_address,
-                       eviction_apt_num,
-                       community_board,
-                       council_district,
-                       census_tract,
-                       nta,
-                       latitude,
-                       longitude,
-                       executed_date,
-                       residential_commercial_ind,
-                       ejectment,
-                       eviction_possession,
-                       marshal_first_name,
-                       marshal_last_name
+                SELECT
+                    docket_number, court_index_number, bbl, bin, borough,
+                    eviction_zip, eviction_address, eviction_apt_num,
+                    community_board, council_district, census_tract, nta,
+                    latitude, longitude, executed_date,
+                    residential_commercial_ind, ejectment, eviction_possession,
+                    marshal_first_name, marshal_last_name
                 FROM building_evictions
-                WHERE bbl = %s
+                WHERE bbl = ANY(%s)
                 """,
-                (bbl,),
+                (bbls,),
             )
 
-            rent_tag_row = db.query_one(
+            rent_tag_rows = db.query_all(
                 """
                 SELECT
                     bbl, borough, block, lot, zip, city, status, source_year
                 FROM building_rent_stabilized_list
-                WHERE bbl = %s
+                WHERE bbl = ANY(%s)
                 """,
-                (bbl,),
+                (bbls,),
             )
+            rent_tags: Dict[str, Dict[str, Any]] = {}
+            for r in rent_tag_rows:
+                rent_tags.setdefault(r["bbl"], r)
 
             acris_legal_rows = db.query_all(
                 """
                 SELECT
                     document_id, bbl, borough, block, lot
                 FROM building_acris_legals
-                WHERE bbl = %s
+                WHERE bbl = ANY(%s)
                 """,
-                (bbl,),
+                (bbls,),
             )
-            doc_ids = sorted(
-                {r["document_id"] for r in acris_legal_rows if r.get("document_id")}
+            # 여러 BBL 에 걸친 문서는 한 번만 (조립 시 legals 의 document_id 로 배분)
+            acris_master_rows = db.query_all(
+                """
+                SELECT DISTINCT ON (document_id)
+                    document_id, borough, doc_type, doc_date, doc_amount
+                FROM building_acris_documents
+                WHERE bbl = ANY(%s)
+                """,
+                (bbls,),
+            )
+            acris_party_rows = db.query_all(
+                """
+                SELECT
+                    document_id, party_type, name, address1, city, state, zip
+                FROM building_acris_parties
+                WHERE document_id IN (
+                    SELECT document_id FROM building_acris_legals
+                    WHERE bbl = ANY(%s) AND document_id IS NOT NULL AND document_id <> ''
+                )
+                """,
+                (bbls,),
             )
 
-            acris_master_rows: List[Dict[str, Any]] = []
-            acris_party_rows: List[Dict[str, Any]] = []
-            if doc_ids:
-                placeholders = ", ".join(["%s"] * len(doc_ids))
+        return {
+            "registrations": registrations,
+            "rent_tags": rent_tags,
+            "contacts": _group_by(contact_rows, "registration_id"),
+            "affordable": _group_by(affordable_rows, "bbl"),
+            "complaints": _group_by(complaint_rows, "bbl"),
+            "violations": _group_by(violation_rows, "bbl"),
+            "evictions": _group_by(eviction_rows, "bbl"),
+            "acris_legals": _group_by(acris_legal_rows, "bbl"),
+            "acris_master": _group_by(acris_master_rows, "document_id"),
+            "acris_parties": _group_by(acris_party_rows, "document_id"),
+        }
 
-                acris_master_rows = db.query_all(
-                    f"""
-                    SELECT
-                        document_id, borough, doc_type, doc_date, doc_amount
-                    FROM building_acris_master
-                    WHERE document_id IN ({placeholders})
-                    """,
-                    tuple(doc_ids),
-                )
+    @staticmethod
+    def _assemble_from_sections(bbl: str, sections: Dict[str, Any]):
+        reg_row = sections["registrations"].get(bbl)
+        contact_rows: List[Dict[str, Any]] = []
+        if reg_row and reg_row.get("registration_id") is not None:
+            contact_rows = sections["contacts"].get(reg_row["registration_id"], [])
 
-                acris_party_rows = db.query_all(
-                    f"""
-                    SELECT
-                        document_id, party_type, name, address1, city, state, zip
-                    FROM building_acris_parties
-                    WHERE document_id IN ({placeholders})
-                    """,
-                    tuple(doc_ids),
-                )
+        acris_legal_rows = sections["acris_legals"].get(bbl, [])
+        doc_ids = sorted(
+            {r["document_id"] for r in acris_legal_rows if r.get("document_id")}
+        )
+        acris_master_rows = [
+            m for d in doc_ids for m in sections["acris_master"].get(d, [])
+        ]
+        acris_party_rows = [
+            p for d in doc_ids for p in sections["acris_parties"].get(d, [])
+        ]
 
-        building = build_building_from_rows(
+        return build_building_from_rows(
             bbl=bbl,
             reg_row=reg_row,
             contact_rows=contact_rows,
-            affordable_rows=affordable_rows,
-            complaint_rows=complaint_rows,
-            violation_rows=violation_rows,
+            affordable_rows=sections["affordable"].get(bbl, []),
+            complaint_rows=sections["complaints"].get(bbl, []),
+            violation_rows=sections["violations"].get(bbl, []),
             acris_master_rows=acris_master_rows,
             acris_legal_rows=acris_legal_rows,
             acris_party_rows=acris_party_rows,
-            rent_tag_row=rent_tag_row,
-            eviction_rows=eviction_rows,
+            rent_tag_row=sections["rent_tags"].get(bbl),
+            eviction_rows=sections["evictions"].get(bbl, []),
+            unique=True,
         )
-        return building
 
-    def get_many_by_bbl(self, bbls: Sequence[str]) -> Dict[str, Any]:
-        result = {}
-        for bbl in bbls:
-            try:
-                result[bbl] = self.get_by_bbl(bbl)
-            except Exception as e:
-                print(f"[BuildingRepository] get_by_bbl failed for {bbl}: {e}")
-        return result
+
+def _group_by(rows: List[Dict[str, Any]], key: str) -> Dict[Any, List[Dict[str, Any]]]:
+    grouped: Dict[Any, List[Dict[str, Any]]] = {}
+    for r in rows:
+        grouped.setdefault(r.get(key), []).append(r)
+    return grouped
+
+
+def _fetch_limit(page_size: Optional[int]) -> Optional[int]:
+    """LIMIT for a page: one extra row tells whether a next page exists (None = all rows)."""
+    return None if page_size is None else page_size + 1
+
+
+def _paginate(building, collections: Iterable[str], page_size: int) -> None:
+    """Trim collections fetched with _fetch_limit(page_size) and record next cursors."""
+    cursors = dict(building.cursors or {})
+    for name in collections:
+        items, cursors[name] = split_page(name, getattr(building, name), page_size)
+        setattr(building, name, items)
+    building.cursors = cursors
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_executor_lock = threading.Lock()
+
+
+def _section_executor() -> ThreadPoolExecutor:
+    """
+    Per-process pool shared by every concurrent get_by_bbl.
+
+    DB_SECTION_WORKERS bounds how many section queries (and pooled
+    connections) run at once across all requests; keep it at or below
+    DB_POOL_MAX_SIZE so sections never wait on the connection pool.
+    """
+    global _executor, _executor_pid
+    pid = os.getpid()
+    if _executor is not None and _executor_pid == pid:
+        return _executor
+    with _executor_lock:
+        if _executor is None or _executor_pid != pid:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_env().int("DB_SECTION_WORKERS", default=8),
+                thread_name_prefix="building-section",
+            )
+            _executor_pid = pid
+        return _executor
@@ -0,0 +1,197 @@
+# infrastructures/postgres/connection_pool.py
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import psycopg2
+from psycopg2 import extensions
+
+from common.exceptions.db_error import DatabaseError, DatabaseTimeoutError
+
+
+class PostgresConnectionPool:
+    """
+    Thread-safe pool of psycopg2 connections for a single set of connect params.
+
+    - min_size: connections kept open even when idle
+    - max_size: upper bound on open connections (idle + borrowed)
+    - max_idle: seconds an idle connection may sit before it is closed
+    - timeout: seconds getconn() waits for a free slot before failing
+    - check_after: idle seconds after which a borrowed connection is pinged
+    """
+
+    def __init__(
+        self,
+        params: Dict[str, Any],
+        *,
+        min_size: int = 1,
+        max_size: int = 10,
+        max_idle: float = 300.0,
+        timeout: float = 30.0,
+        check_after: float = 30.0,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self._params = dict(params)
+        self.min_size = max(0, min(min_size, max_size))
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.check_after = check_after
+
+        self._cond = threading.Condition()
+        # (connection, released_at) - LIFO so hot connections are reused first
+        self._idle: List[Tuple[Any, float]] = []
+        self._in_use = 0
+        self._closed = False
+        self._pid = os.getpid()
+
+    # ---------- Public ----------
+
+    @property
+    def size(self) -> int:
+        with self._cond:
+            return len(self._idle) + self._in_use
+
+    @property
+    def idle_count(self) -> int:
+        with self._cond:
+            return len(self._idle)
+
+    def getconn(self):
+        deadline = time.monotonic() + self.timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise DatabaseError("Connection pool is closed")
+                self._evict_idle_locked()
+
+                while self._idle:
+                    conn, released_at = self._idle.pop()
+                    self._in_use += 1
+                    self._cond.release()
+                    try:
+                        alive = self._is_alive(conn, time.monotonic() - released_at)
+                    finally:
+                        self._cond.acquire()
+                    if alive:
+                        return conn
+                    self._in_use -= 1
+                    self._close_quietly(conn)
+
+                if self._in_use < self.max_size:
+                    self._in_use += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DatabaseTimeoutError(
+                        f"Timed out after {self.timeout}s waiting for a DB connection",
+                        status=503,
+                    )
+                self._cond.wait(remaining)
+
+        try:
+            return psycopg2.connect(**self._params)
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+    def putconn(self, conn, *, discard: bool = False) -> None:
+        if not discard and not conn.closed:
+            try:
+                status = conn.get_transaction_status()
+                if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                    discard = True
+                elif status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Exception:
+                discard = True
+
+        with self._cond:
+            self._in_use -= 1
+            if discard or conn.closed or self._closed or os.getpid() != self._pid:
+                self._close_quietly(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def closeall(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    # ---------- Internals ----------
+
+    def _evict_idle_locked(self) -> None:
+        if not self._idle or self.max_idle is None:
+            return
+        now = time.monotonic()
+        keep: List[Tuple[Any, float]] = []
+        # 오래된 것부터 정리하되 min_size 만큼은 유지
+        surplus = len(self._idle) + self._in_use - self.min_size
+        for conn, released_at in self._idle:
+            if surplus > 0 and now - released_at > self.max_idle:
+                self._close_quietly(conn)
+                surplus -= 1
+            else:
+                keep.append((conn, released_at))
+        self._idle = keep
+
+    def _is_alive(self, conn, idle_for: float) -> bool:
+        if conn.closed:
+            return False
+        if idle_for < self.check_after:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            if not conn.autocommit:
+                conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+_pools: Dict[Tuple, PostgresConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(params: Dict[str, Any], **options) -> PostgresConnectionPool:
+    """
+    Return the pool for these connect params, creating it on first use.
+    Pools are per process: a forked worker never reuses its parent's sockets.
+    """
+    key = (os.getpid(), tuple(sorted((k, str(v)) for k, v in params.items())))
+    pool = _pools.get(key)
+    if pool is not None:
+        return pool
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = PostgresConnectionPool(params, **options)
+            _pools[key] = pool
+        return pool
+
+
+def close_all_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        if pool._pid == os.getpid():
+            pool.closeall()
@@ -1,20 +1,29 @@
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from common.models.neighborhood import (
+    HeatmapBatch,
     HeatmapPoint,
     NeighborhoodStats,
     NeighborhoodSummary,
-    as_heatmap_point,
     as_neighborhood_summary,
     calculate_risk_score,
 )
-from infrastructures.postgres.postgres_client import PostgresClient
+from infrastructures.postgres.postgres_client import (
+    ROW_TUPLE,
+    PostgresClient,
+    RowFactory,
+    dataclass_row,
+)
 
 
 class NeighborhoodRepository:
     """Repository for neighborhood-level data aggregation and analysis"""
 
+    # 뷰포트 쿼리별 statement_timeout 예산 (ms); 초과 시 DatabaseTimeoutError (504)
+    STATS_TIMEOUT_MS = 5000
+    HEATMAP_TIMEOUT_MS = 8000
+
     def __init__(self):
         self.client_factory = PostgresClient
 
@@ -36,7 +45,9 @@ class NeighborhoodRepository:
         Returns:
             List of NeighborhoodStats objects
         """
-        with self.client_factory() as db:
+        with self.client_factory(
+            readonly=True, replica=True, statement_timeout_ms=self.STATS_TIMEOUT_MS
+        ) as db:
             # Get buildings with coordinates in the bounds
             buildings_query = """
                 SELECT DISTINCT 
@@ -88,6 +99,7 @@ class NeighborhoodRepository:
                     min_lng,
                     max_lng,
                 ),
+                prepare=True,
             )
 
             if not buildings:
@@ -98,35 +110,33 @@ class NeighborhoodRepository:
             if not bbls:
                 return []
 
-            placeholders = ", ".join(["%s"] * len(bbls))
-
             # Get violation statistics
-            violations_query = f"""
+            violations_query = """
                 SELECT 
                     bbl,
                     COUNT(*) as total_violations,
                     SUM(CASE WHEN violation_status = 'Open' THEN 1 ELSE 0 END) as open_violations,
-                    SUM(CASE WHEN class_ = 'A' THEN 1 ELSE 0 END) as class_a_violations,
-                    SUM(CASE WHEN class_ = 'B' THEN 1 ELSE 0 END) as class_b_violations,
-                    SUM(CASE WHEN class_ = 'C' THEN 1 ELSE 0 END) as class_c_violations,
+                    SUM(CASE WHEN class = 'A' THEN 1 ELSE 0 END) as class_a_violations,
+                    SUM(CASE WHEN class = 'B' THEN 1 ELSE 0 END) as class_b_violations,
+                    SUM(CASE WHEN class = 'C' THEN 1 ELSE 0 END) as class_c_violations,
                     SUM(CASE WHEN rent_impairing = true THEN 1 ELSE 0 END) as rent_impairing_violations
                 FROM building_violations
-                WHERE bbl IN ({placeholders})
+                WHERE bbl = ANY(%s)
                 GROUP BY bbl
             """
 
-            violations = db.query_all(violations_query, tuple(bbls))
+            violations = db.query_all(violations_query, (bbls,), prepare=True)
             violations_dict = {v["bbl"]: v for v in violations}
 
             # Get eviction statistics
-            evictions_query = f"""
+            evictions_query = """
                 SELECT 
                     bbl,
                     COUNT(*) as total_evictions,
                     SUM(CASE WHEN executed_date >= %s THEN 1 ELSE 0 END) as evictions_3yr,
                     SUM(CASE WHEN executed_date >= %s THEN 1 ELSE 0 END) as evictions_1yr
                 FROM building_evictions
-                WHERE bbl IN ({placeholders})
+                WHERE bbl = ANY(%s)
                 GROUP BY bbl
             """
 
@@ -134,33 +144,33 @@ class NeighborhoodRepository:
             one_year_ago = datetime.now() - timedelta(days=365)
 
             evictions = db.query_all(
-                evictions_query, (three_years_ago, one_year_ago) + tuple(bbls)
+                evictions_query, (three_years_ago, one_year_ago, bbls), prepare=True
             )
             evictions_dict = {e["bbl"]: e for e in evictions}
 
             # Get complaint statistics
-            complaints_query = f"""
+            complaints_query = """
                 SELECT 
                     bbl,
                     COUNT(*) as total_complaints,
                     SUM(CASE WHEN complaint_status = 'Open' THEN 1 ELSE 0 END) as open_complaints,
                     SUM(CASE WHEN type IN ('EMERGENCY', 'IMMEDIATE EMERGENCY') THEN 1 ELSE 0 END) as emergency_complaints
                 FROM building_complaints
-                WHERE bbl IN ({placeholders})
+                WHERE bbl = ANY(%s)
                 GROUP BY bbl
             """
 
-            complaints = db.query_all(complaints_query, tuple(bbls))
+            complaints = db.query_all(complaints_query, (bbls,), prepare=True)
             complaints_dict = {c["bbl"]: c for c in complaints}
 
             # Get rent stabilization status
-            rent_stabilized_query = f"""
+            rent_stabilized_query = """
                 SELECT DISTINCT bbl
                 FROM building_rent_stabilized_list
-                WHERE bbl IN ({placeholders})
+                WHERE bbl = ANY(%s)
             """
 
-            rent_stabilized = db.query_all(rent_stabilized_query, tuple(bbls))
+            rent_stabilized = db.query_all(rent_stabilized_query, (bbls,), prepare=True)
             rent_stabilized_set = {r["bbl"] for r in rent_stabilized}
 
             # Combine all data
@@ -237,21 +247,88 @@ class NeighborhoodRepository:
         Returns:
             List of HeatmapPoint objects
         """
-        with self.client_factory() as db:
+        return list(
+            self.iter_heatmap_data(
+                min_lat, max_lat, min_lng, max_lng, data_type, borough, limit
+            )
+        )
+
+    def iter_heatmap_data(
+        self,
+        min_lat: float,
+        max_lat: float,
+        min_lng: float,
+        max_lng: float,
+        data_type: str = "violations",
+        borough: Optional[str] = None,
+        limit: int = 50000,
+    ) -> Iterator[HeatmapPoint]:
+        """
+        Lazily stream heatmap points through a server-side cursor.
+
+        Same arguments as get_heatmap_data; the connection stays checked out
+        until the iterator is exhausted or closed.
+        """
+        return self._iter_heatmap(
+            min_lat, max_lat, min_lng, max_lng, data_type, borough, limit
+        )
+
+    def get_heatmap_batch(
+        self,
+        min_lat: float,
+        max_lat: float,
+        min_lng: float,
+        max_lng: float,
+        data_type: str = "violations",
+        borough: Optional[str] = None,
+        limit: int = 50000,
+    ) -> HeatmapBatch:
+        """
+        Heatmap points as one columnar HeatmapBatch (no per-point objects).
+
+        Same arguments as get_heatmap_data; rows are streamed as plain tuples
+        straight into the batch's column arrays.
+        """
+        return HeatmapBatch.from_rows(
+            data_type,
+            self._iter_heatmap(
+                min_lat,
+                max_lat,
+                min_lng,
+                max_lng,
+                data_type,
+                borough,
+                limit,
+                row_factory=ROW_TUPLE,
+            ),
+        )
+
+    def _iter_heatmap(
+        self,
+        min_lat: float,
+        max_lat: float,
+        min_lng: float,
+        max_lng: float,
+        data_type: str,
+        borough: Optional[str],
+        limit: int,
+        row_factory: Optional[RowFactory] = None,
+    ) -> Iterator[Any]:
+        with self.client_factory(
+            readonly=True, replica=True, statement_timeout_ms=self.HEATMAP_TIMEOUT_MS
+        ) as db:
             if data_type == "violations":
-                return self._get_violations_heatmap(
-                    db, min_lat, max_lat, min_lng, max_lng, borough, limit
+                yield from self._get_violations_heatmap(
+                    db, min_lat, max_lat, min_lng, max_lng, borough, limit, row_factory
                 )
             elif data_type == "evictions":
-                return self._get_evictions_heatmap(
-                    db, min_lat, max_lat, min_lng, max_lng, borough, limit
+                yield from self._get_evictions_heatmap(
+                    db, min_lat, max_lat, min_lng, max_lng, borough, limit, row_factory
                 )
             elif data_type == "complaints":
-                return self._get_complaints_heatmap(
-                    db, min_lat, max_lat, min_lng, max_lng, borough, limit
+                yield from self._get_complaints_heatmap(
+                    db, min_lat, max_lat, min_lng, max_lng, borough, limit, row_factory
                 )
-            else:
-                return []
 
     def _get_violations_heatmap(
         self,
@@ -262,8 +339,12 @@ class NeighborhoodRepository:
         max_lng: float,
         borough: Optional[str] = None,
         limit: int = 50000,
-    ) -> List[HeatmapPoint]:
+        row_factory: Optional[RowFactory] = None,
+    ) -> Iterator[Any]:
         """Get violations heatmap data - optimized to use all data points"""
+        # 기본은 HeatmapPoint, 배치 경로는 ROW_TUPLE (SELECT 순서 그대로)
+        row_factory = row_factory or dataclass_row(HeatmapPoint, data_type="violations")
+
         # Build query with optional borough filter
         query = """
             SELECT 
@@ -301,13 +382,19 @@ class NeighborhoodRepository:
         if borough and borough != "All Boroughs":
             query += " AND e.borough = %s"
             query += " ORDER BY COALESCE(v.violation_count, 0) DESC LIMIT %s"
-            rows = db.query_all(
-                query, (min_lat, max_lat, min_lng, max_lng, borough, limit)
+            rows = db.query_iter(
+                query,
+                (min_lat, max_lat, min_lng, max_lng, borough, limit),
+                row_factory=row_factory,
             )
         else:
             query += " ORDER BY COALESCE(v.violation_count, 0) DESC LIMIT %s"
-            rows = db.query_all(query, (min_lat, max_lat, min_lng, max_lng, limit))
-        return [as_heatmap_point({**row, "data_type": "violations"}) for row in rows]
+            rows = db.query_iter(
+                query,
+                (min_lat, max_lat, min_lng, max_lng, limit),
+                row_factory=row_factory,
+            )
+        yield from rows
 
     def _get_evictions_heatmap(
         self,
@@ -318,10 +405,13 @@ class NeighborhoodRepository:
         max_lng: float,
         borough: Optional[str] = None,
         limit: int = 50000,
-    ) -> List[HeatmapPoint]:
+        row_factory: Optional[RowFactory] = None,
+    ) -> Iterator[Any]:
         """Get evictions heatmap data - optimized to use all data points"""
         three_years_ago = datetime.now() - timedelta(days=3 * 365)
 
+        row_factory = row_factory or dataclass_row(HeatmapPoint, data_type="evictions")
+
         # Build query with optional borough filter
         query = """
             SELECT 
@@ -352,16 +442,19 @@ class NeighborhoodRepository:
         if borough and borough != "All Boroughs":
             query += " AND borough = %s"
             query += " GROUP BY bbl, latitude, longitude, eviction_address, borough ORDER BY COUNT(*) DESC LIMIT %s"
-            rows = db.query_all(
+            rows = db.query_iter(
                 query,
                 (min_lat, max_lat, min_lng, max_lng, three_years_ago, borough, limit),
+                row_factory=row_factory,
             )
         else:
             query += " GROUP BY bbl, latitude, longitude, eviction_address, borough ORDER BY COUNT(*) DESC LIMIT %s"
-            rows = db.query_all(
-                query, (min_lat, max_lat, min_lng, max_lng, three_years_ago, limit)
+            rows = db.query_iter(
+                query,
+                (min_lat, max_lat, min_lng, max_lng, three_years_ago, limit),
+                row_factory=row_factory,
             )
-        return [as_heatmap_point({**row, "data_type": "evictions"}) for row in rows]
+        yield from rows
 
     def _get_complaints_heatmap(
         self,
@@ -372,8 +465,11 @@ class NeighborhoodRepository:
         max_lng: float,
         borough: Optional[str] = None,
         limit: int = 50000,
-    ) -> List[HeatmapPoint]:
+        row_factory: Optional[RowFactory] = None,
+    ) -> Iterator[Any]:
         """Get complaints heatmap data - optimized to use all data points"""
+        row_factory = row_factory or dataclass_row(HeatmapPoint, data_type="complaints")
+
         # Build query with optional borough filter
         query = """
             SELECT 
@@ -411,13 +507,19 @@ class NeighborhoodRepository:
         if borough and borough != "All Boroughs":
             query += " AND e.borough = %s"
             query += " ORDER BY COALESCE(c.complaint_count, 0) DESC LIMIT %s"
-            rows = db.query_all(
-                query, (min_lat, max_lat, min_lng, max_lng, borough, limit)
+            rows = db.query_iter(
+                query,
+                (min_lat, max_lat, min_lng, max_lng, borough, limit),
+                row_factory=row_factory,
             )
         else:
             query += " ORDER BY COALESCE(c.complaint_count, 0) DESC LIMIT %s"
-            rows = db.query_all(query, (min_lat, max_lat, min_lng, max_lng, limit))
-        return [as_heatmap_point({**row, "data_type": "complaints"}) for row in rows]
+            rows = db.query_iter(
+                query,
+                (min_lat, max_lat, min_lng, max_lng, limit),
+                row_factory=row_factory,
+            )
+        yield from rows
 
     def get_borough_summary(self, borough: str = None) -> List[NeighborhoodSummary]:
         """
@@ -429,7 +531,7 @@ class NeighborhoodRepository:
         Returns:
             List of NeighborhoodSummary objects
         """
-        with self.client_factory() as db:
+        with self.client_factory(readonly=True, replica=True) as db:
             where_clause = "WHERE e.borough = %s" if borough else ""
             params = (borough,) if borough else ()
 
@@ -491,7 +593,7 @@ class NeighborhoodRepository:
         Returns:
             Dictionary with trend data
         """
-        with self.client_factory() as db:
+        with self.client_factory(readonly=True, replica=True) as db:
             start_date = datetime.now() - timedelta(days=days_back)
 
             # Get violation trends
@@ -0,0 +1,186 @@
+from typing import Any, Iterable, Optional
+
+from common.models.owner import OwnerPortfolio, as_owner_building
+from infrastructures.postgres.building_repository import (
+    SNAPSHOT_REFRESH_BATCH,
+    SNAPSHOT_TOUCHED_BBLS_SQL,
+)
+from infrastructures.postgres.postgres_client import PostgresClient
+
+DEFAULT_PORTFOLIO_SIZE = 100
+MAX_PORTFOLIO_SIZE = 500
+
+# 소유자 이름 출처 -> building_owner_index 행.
+# registration: HPD 등록 연락처 중 소유자 유형(법인/개인/공동 소유자)의 법인명과 개인 이름
+# (관리인·대리인·임원 제외), acris: BBL 별 최신 양도증서(deed)의 양수인(party_type 2)
+# (모기지 등 다른 문서의 party 2 는 대출기관이라 제외).
+# {where_bbl} 가 비면 전체 재구성
+OWNER_INDEX_INSERT_SQL = """
+    INSERT INTO building_owner_index (owner_name, bbl, source, display_name)
+    SELECT owner_name, bbl, source, min(display_name)
+    FROM (
+        SELECT
+            normalize_owner_name(c.corporation_name) AS owner_name,
+            r.bbl,
+            'registration' AS source,
+            c.corporation_name AS display_name
+        FROM building_registrations r
+        JOIN building_registration_contacts c ON c.registration_id = r.registration_id
+        WHERE c.corporation_name IS NOT NULL
+            AND c.type IN ('CorporateOwner', 'IndividualOwner', 'JointOwner'){where_bbl}
+        UNION ALL
+        SELECT
+            normalize_owner_name(concat_ws(' ', c.first_name, c.last_name)),
+            r.bbl,
+            'registration',
+            concat_ws(' ', c.first_name, c.last_name)
+        FROM building_registrations r
+        JOIN building_registration_contacts c ON c.registration_id = r.registration_id
+        WHERE c.type IN ('IndividualOwner', 'JointOwner'){where_bbl}
+        UNION ALL
+        SELECT normalize_owner_name(p.name), deed.bbl, 'acris', p.name
+        FROM (
+            SELECT DISTINCT ON (r.bbl) r.bbl, r.document_id
+            FROM building_acris_documents r
+            WHERE r.doc_type IN ('DEED', 'DEEDO', 'DEED, RC', 'CORRD'){where_bbl}
+            ORDER BY r.bbl, r.doc_date DESC NULLS LAST, r.document_id DESC
+        ) deed
+        JOIN building_acris_parties p ON p.document_id = deed.document_id
+        WHERE p.party_type = '2'
+    ) names
+    WHERE owner_name IS NOT NULL AND bbl IS NOT NULL AND bbl <> ''
+    GROUP BY owner_name, bbl, source
+    ON CONFLICT DO NOTHING
+"""
+
+OWNER_INDEX_DELETE_SQL = """
+    DELETE FROM building_owner_index
+    WHERE bbl IN (SELECT bbl FROM ({touched_bbls}) k(bbl))
+"""
+
+# 소유 건물별 건수 + 포트폴리오 전체 합계 (LIMIT 전 window 집계) 를 한 문장으로.
+# 위반/미해결 민원 건수는 bbl 인덱스(미해결은 부분 인덱스)로 index-only 집계하고
+# MATERIALIZED 로 건물당 한 번만 계산 (인라인되면 정렬 키로 다시 평가됨)
+OWNER_PORTFOLIO_SQL = """
+    WITH owned AS (
+        SELECT bbl, array_agg(source ORDER BY source) AS sources
+        FROM building_owner_index
+        WHERE owner_name = normalize_owner_name(%(name)s)
+        GROUP BY bbl
+    ),
+    stats AS MATERIALIZED (
+        SELECT
+            o.bbl,
+            o.sources,
+            (SELECT COUNT(*) FROM building_violations v WHERE v.bbl = o.bbl)
+                AS total_violations,
+            (
+                SELECT COUNT(*) FROM building_violations v
+                WHERE v.bbl = o.bbl AND v.violation_status = 'Open'
+            ) AS open_violations,
+            (SELECT COUNT(*) FROM building_evictions e WHERE e.bbl = o.bbl)
+                AS total_evictions,
+            (
+                SELECT COUNT(*) FROM building_complaints c
+                WHERE c.bbl = o.bbl AND c.complaint_status = 'Open'
+            ) AS open_complaints
+        FROM owned o
+    ),
+    page AS (
+        SELECT
+            s.*,
+            COUNT(*) OVER () AS portfolio_buildings,
+            (SUM(s.total_violations) OVER ())::bigint AS portfolio_violations,
+            (SUM(s.open_violations) OVER ())::bigint AS portfolio_open_violations,
+            (SUM(s.total_evictions) OVER ())::bigint AS portfolio_evictions,
+            (SUM(s.open_complaints) OVER ())::bigint AS portfolio_open_complaints
+        FROM stats s
+        ORDER BY s.open_violations DESC, s.total_violations DESC, s.bbl
+        LIMIT %(limit)s
+    )
+    SELECT
+        p.*,
+        NULLIF(concat_ws(' ', r.house_number, r.street_name), '') AS address,
+        r.boro AS borough,
+        r.zip AS zip_code,
+        normalize_owner_name(%(name)s) AS portfolio_name,
+        (
+            SELECT array_agg(DISTINCT display_name ORDER BY display_name)
+            FROM building_owner_index
+            WHERE owner_name = normalize_owner_name(%(name)s)
+        ) AS portfolio_names
+    FROM page p
+    -- 주소는 잘린 페이지에만 붙임
+    LEFT JOIN building_registrations r ON r.bbl = p.bbl
+    ORDER BY p.open_violations DESC, p.total_violations DESC, p.bbl
+"""
+
+
+def refresh_owner_index(
+    db: PostgresClient, keys: Optional[Iterable[Any]], key: str = "bbl"
+) -> int:
+    """
+    Rebuild building_owner_index for the BBLs a registration / contact /
+    ACRIS master / legals / parties batch touched (keys/key as in
+    refresh_profile_snapshots), or for every BBL when keys is None.
+    Returns the number of index rows written.
+    """
+    if key not in SNAPSHOT_TOUCHED_BBLS_SQL:
+        raise ValueError(f"Unknown snapshot key: {key!r}")
+    if keys is None:
+        db.execute("TRUNCATE building_owner_index")
+        return db.execute(OWNER_INDEX_INSERT_SQL.format(where_bbl=""))
+
+    touched = SNAPSHOT_TOUCHED_BBLS_SQL[key]
+    delete_sql = OWNER_INDEX_DELETE_SQL.format(touched_bbls=touched)
+    insert_sql = OWNER_INDEX_INSERT_SQL.format(
+        where_bbl=f" AND r.bbl IN (SELECT bbl FROM ({touched}) k(bbl))"
+    )
+    values = sorted({k for k in keys if k not in (None, "")})
+    written = 0
+    for start in range(0, len(values), SNAPSHOT_REFRESH_BATCH):
+        chunk = values[start : start + SNAPSHOT_REFRESH_BATCH]
+        db.execute(delete_sql, {"keys": chunk})
+        written += db.execute(insert_sql, {"keys": chunk})
+    return written
+
+
+class OwnerRepository:
+    """Owner portfolios: every building linked to one (normalized) owner name"""
+
+    # 수천 채를 가진 소유자도 한 문장이지만 상한을 둠; 초과 시 DatabaseTimeoutError (504)
+    PORTFOLIO_TIMEOUT_MS = 5000
+
+    def __init__(self):
+        self.client_factory = PostgresClient
+
+    def get_portfolio(
+        self, name: str, limit: int = DEFAULT_PORTFOLIO_SIZE
+    ) -> Optional[OwnerPortfolio]:
+        """
+        The portfolio of `name` (matched after normalize_owner_name), or
+        None when no building is linked to it.
+
+        Totals cover every building; `buildings` holds at most `limit` of
+        them, most open violations first.
+        """
+        with self.client_factory(
+            readonly=True, replica=True, statement_timeout_ms=self.PORTFOLIO_TIMEOUT_MS
+        ) as db:
+            rows = db.query_all(
+                OWNER_PORTFOLIO_SQL, {"name": name, "limit": limit}, prepare=True
+            )
+        if not rows:
+            return None
+
+        first = rows[0]
+        return OwnerPortfolio(
+            name=first["portfolio_name"],
+            names=first["portfolio_names"] or [],
+            total_buildings=first["portfolio_buildings"],
+            total_violations=first["portfolio_violations"],
+            open_violations=first["portfolio_open_violations"],
+            total_evictions=first["portfolio_evictions"],
+            open_complaints=first["portfolio_open_complaints"],
+            buildings=[as_owner_building(r) for r in rows],
+        )
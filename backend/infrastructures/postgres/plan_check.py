@@ -0,0 +1,457 @@
+# infrastructures/postgres/plan_check.py
+"""
+EXPLAIN-plan regression gate for repository SQL.
+
+Runs every BuildingRepository / NeighborhoodRepository method against a
+seeded local Postgres, captures each statement they issue, and compares
+its EXPLAIN (FORMAT JSON) plan with a stored baseline.
+
+    python -m infrastructures.postgres.plan_check             # compare, exit 1 on regressions
+    python -m infrastructures.postgres.plan_check --update    # rewrite the baseline
+
+A statement fails when it starts sequentially scanning a table with at
+least --big-table-rows rows, or when its estimated cost grows past
+--cost-ratio times the baseline (or past --max-cost).
+"""
+
+import argparse
+import json
+import os
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from common.models.building import SECTION_FIELDS
+from infrastructures.postgres.building_repository import (
+    PAGED_COLLECTIONS,
+    BuildingRepository,
+)
+from infrastructures.postgres.neighborhood_repository import NeighborhoodRepository
+from infrastructures.postgres.owner_repository import OwnerRepository
+from infrastructures.postgres.postgres_client import PostgresClient
+from infrastructures.postgres.query_stats import (
+    calling_method,
+    fingerprint,
+    fingerprint_id,
+)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "plan_baselines.json")
+DEFAULT_COST_RATIO = 2.0
+DEFAULT_BIG_TABLE_ROWS = 100_000
+
+BUILDING_TABLES = (
+    "building_registrations",
+    "building_registration_contacts",
+    "building_affordable_housing",
+    "building_complaints",
+    "building_violations",
+    "building_evictions",
+    "building_rent_stabilized_list",
+    "building_acris_master",
+    "building_acris_legals",
+    "building_acris_parties",
+    "building_acris_documents",
+    "building_owner_index",
+    "building_profile_snapshot",
+)
+
+# NYC 전체를 덮는 뷰포트
+NYC_BOUNDS = dict(min_lat=40.49, max_lat=40.92, min_lng=-74.27, max_lng=-73.68)
+
+
+@dataclass
+class CapturedStatement:
+    caller: str
+    sql: str
+    params: Any
+
+    @property
+    def key(self) -> str:
+        return f"{self.caller}:{fingerprint_id(fingerprint(self.sql))}"
+
+
+@dataclass
+class PlanResult:
+    key: str
+    caller: str
+    fingerprint: str
+    shape: List[str] = field(default_factory=list)
+    total_cost: float = 0.0
+    seq_scans: List[str] = field(default_factory=list)
+    failures: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    def to_baseline(self) -> Dict[str, Any]:
+        return {
+            "caller": self.caller,
+            "fingerprint": self.fingerprint,
+            "shape": self.shape,
+            "total_cost": self.total_cost,
+            "seq_scans": self.seq_scans,
+        }
+
+
+class _CapturingClient(PostgresClient):
+    """PostgresClient that records every statement passing through instrumentation."""
+
+    def __init__(self, log: List[CapturedStatement], **kwargs):
+        super().__init__(**kwargs)
+        self._log = log
+
+    @contextmanager
+    def _instrumented(self, sql: str, params=None):
+        self._log.append(CapturedStatement(calling_method(), sql, params))
+        with super()._instrumented(sql, params) as probe:
+            yield probe
+
+
+# ---------- Plan parsing ----------
+
+
+def summarize_plan(plan_json) -> Tuple[List[str], float, List[str]]:
+    """(indented node shape, root total cost, relations read by Seq Scan)"""
+    if isinstance(plan_json, str):
+        plan_json = json.loads(plan_json)
+    root = plan_json[0]["Plan"]
+    shape: List[str] = []
+    seq_scans: List[str] = []
+
+    def walk(node: Dict[str, Any], depth: int) -> None:
+        label = node["Node Type"]
+        relation = node.get("Relation Name")
+        if relation:
+            label = f"{label} on {relation}"
+            if node["Node Type"] == "Seq Scan" and relation not in seq_scans:
+                seq_scans.append(relation)
+        if node.get("Index Name"):
+            label = f"{label} using {node['Index Name']}"
+        shape.append("  " * depth + label)
+        for child in node.get("Plans", []):
+            walk(child, depth + 1)
+
+    walk(root, 0)
+    return shape, float(root["Total Cost"]), sorted(seq_scans)
+
+
+def compare(
+    result: PlanResult,
+    baseline: Optional[Dict[str, Any]],
+    big_tables: Dict[str, float],
+    *,
+    cost_ratio: float = DEFAULT_COST_RATIO,
+    max_cost: Optional[float] = None,
+) -> PlanResult:
+    """Fill result.failures / result.warnings against its baseline entry."""
+    allowed = set(baseline["seq_scans"]) if baseline else set()
+    for relation in result.seq_scans:
+        if relation in big_tables and relation not in allowed:
+            result.failures.append(
+                f"Seq Scan on {relation} ({int(big_tables[relation])} rows)"
+            )
+
+    if max_cost is not None and result.total_cost > max_cost:
+        result.failures.append(
+            f"cost {result.total_cost:.0f} exceeds max {max_cost:.0f}"
+        )
+
+    if baseline is None:
+        result.warnings.append("no baseline")
+        return result
+
+    limit = baseline["total_cost"] * cost_ratio
+    if baseline["total_cost"] > 0 and result.total_cost > limit:
+        result.failures.append(
+            f"cost {result.total_cost:.0f} > {cost_ratio}x baseline "
+            f"{baseline['total_cost']:.0f}"
+        )
+    if result.shape != baseline["shape"]:
+        result.warnings.append("plan shape changed")
+    return result
+
+
+# ---------- Capture ----------
+
+
+def _sample_inputs(db: PostgresClient) -> Dict[str, Any]:
+    # 데이터가 가장 많은 BBL 로 최악에 가까운 플랜을 봄
+    bbl = db.scalar(
+        "SELECT bbl FROM building_violations GROUP BY bbl ORDER BY COUNT(*) DESC LIMIT 1"
+    ) or db.scalar("SELECT bbl FROM building_registrations LIMIT 1")
+    bbls = [
+        r["bbl"]
+        for r in db.query_all(
+            "SELECT bbl FROM building_registrations ORDER BY bbl LIMIT 100"
+        )
+    ]
+    borough = db.scalar(
+        "SELECT borough FROM building_evictions GROUP BY borough ORDER BY COUNT(*) DESC LIMIT 1"
+    )
+    # 건물이 가장 많은 소유자 - 포트폴리오 집계의 최악
+    owner = db.scalar(
+        "SELECT owner_name FROM building_owner_index GROUP BY owner_name "
+        "ORDER BY COUNT(*) DESC LIMIT 1"
+    )
+    return {
+        "bbl": bbl or "0000000000",
+        "bbls": bbls or [bbl],
+        "borough": borough,
+        "owner": owner or "",
+    }
+
+
+def scenarios(sample: Dict[str, Any]) -> List[Tuple[str, Callable]]:
+    """
+    One entry per repository method (and per SQL variant it can build).
+
+    Each callable receives (building_repo_factory, neighborhood_repo_factory,
+    owner_repo_factory).
+    """
+    bbl, bbls, borough = sample["bbl"], sample["bbls"], sample["borough"]
+
+    items: List[Tuple[str, Callable]] = [
+        ("get_by_bbl", lambda b, n, o: b().get_by_bbl(bbl)),
+        (
+            "get_by_bbl(concurrent)",
+            lambda b, n, o: b().get_by_bbl(bbl, concurrent=True),
+        ),
+        (
+            "get_by_bbl(single_query)",
+            lambda b, n, o: b().get_by_bbl(bbl, single_query=True),
+        ),
+        (
+            "get_by_bbl(sections=counts)",
+            lambda b, n, o: b().get_by_bbl(bbl, sections=["registration", "counts"]),
+        ),
+        (
+            "get_by_bbl(single_query, page_size)",
+            lambda b, n, o: b().get_by_bbl(
+                bbl, single_query=True, sections=SECTION_FIELDS, page_size=10
+            ),
+        ),
+        ("get_profile_by_bbl", lambda b, n, o: b().get_profile_by_bbl(bbl)),
+        ("get_snapshot_by_bbl", lambda b, n, o: b().get_snapshot_by_bbl(bbl)),
+        ("get_many_by_bbl", lambda b, n, o: b().get_many_by_bbl(bbls)),
+        (
+            "get_neighborhood_stats_by_bounds",
+            lambda b, n, o: n().get_neighborhood_stats_by_bounds(**NYC_BOUNDS),
+        ),
+        ("get_borough_summary", lambda b, n, o: n().get_borough_summary()),
+        (
+            "get_borough_summary(borough)",
+            lambda b, n, o: n().get_borough_summary(borough),
+        ),
+        ("get_neighborhood_trends", lambda b, n, o: n().get_neighborhood_trends(bbl)),
+        ("get_portfolio", lambda b, n, o: o().get_portfolio(sample["owner"])),
+    ]
+    for collection in PAGED_COLLECTIONS:
+        # 두 번째 페이지: 첫 페이지 조회 + cursor 이후 keyset 조회
+        items.append(
+            (
+                f"get_collection_page({collection}, cursor)",
+                lambda b, n, o, c=collection: b().get_collection_page(
+                    bbl, c, cursor=b().get_collection_page(bbl, c, limit=10).next_cursor
+                ),
+            )
+        )
+    for data_type in ("violations", "evictions", "complaints"):
+        items.append(
+            (
+                f"get_heatmap_data({data_type})",
+                lambda b, n, o, t=data_type: n().get_heatmap_data(
+                    **NYC_BOUNDS, data_type=t
+                ),
+            )
+        )
+        items.append(
+            (
+                f"get_heatmap_data({data_type}, borough)",
+                lambda b, n, o, t=data_type: n().get_heatmap_data(
+                    **NYC_BOUNDS, data_type=t, borough=borough
+                ),
+            )
+        )
+    return items
+
+
+def capture_statements(
+    sample: Dict[str, Any],
+) -> Tuple[List[CapturedStatement], List[str]]:
+    """Run every scenario with a capturing client; returns (statements, errors)."""
+    log: List[CapturedStatement] = []
+    errors: List[str] = []
+
+    def client_factory(**kwargs):
+        kwargs.pop("replica", None)  # 플랜은 항상 primary 기준
+        return _CapturingClient(log, **kwargs)
+
+    def building(**options):
+        repo = BuildingRepository(**options)
+        repo.client_factory = client_factory
+        return repo
+
+    def neighborhood():
+        repo = NeighborhoodRepository()
+        repo.client_factory = client_factory
+        return repo
+
+    def owner():
+        repo = OwnerRepository()
+        repo.client_factory = client_factory
+        return repo
+
+    for name, run in scenarios(sample):
+        try:
+            run(building, neighborhood, owner)
+        except Exception as e:
+            errors.append(f"{name}: {e}")
+    return log, errors
+
+
+def big_table_sizes(db: PostgresClient, min_rows: int) -> Dict[str, float]:
+    rows = db.query_all(
+        "SELECT relname, reltuples FROM pg_class WHERE relkind = 'r' AND relname = ANY(%s)",
+        (list(BUILDING_TABLES),),
+    )
+    return {r["relname"]: r["reltuples"] for r in rows if r["reltuples"] >= min_rows}
+
+
+def collect_plans(
+    *, analyze: bool = True
+) -> Tuple[List[PlanResult], List[str], Dict[str, Any]]:
+    """EXPLAIN every captured statement; returns (results, errors, sample inputs)."""
+    with PostgresClient(pooled=False) as db:
+        if analyze:
+            db.conn.autocommit = True
+            for table in BUILDING_TABLES:
+                db.execute(f"ANALYZE {table}")
+            db.conn.autocommit = False
+        sample = _sample_inputs(db)
+
+    statements, errors = capture_statements(sample)
+
+    results: Dict[str, PlanResult] = {}
+    with PostgresClient(pooled=False, readonly=True) as db:
+        for stmt in statements:
+            if stmt.key in results:
+                continue
+            try:
+                row = db.query_one(
+                    "EXPLAIN (FORMAT JSON) " + stmt.sql,
+                    stmt.params,
+                    row_factory="tuple",
+                )
+            except Exception as e:
+                errors.append(f"{stmt.caller}: EXPLAIN failed: {e}")
+                continue
+            shape, cost, seq_scans = summarize_plan(row[0])
+            results[stmt.key] = PlanResult(
+                key=stmt.key,
+                caller=stmt.caller,
+                fingerprint=fingerprint(stmt.sql),
+                shape=shape,
+                total_cost=cost,
+                seq_scans=seq_scans,
+            )
+    return list(results.values()), errors, sample
+
+
+# ---------- Baseline ----------
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Any]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("statements", {})
+
+
+def save_baseline(path: str, results: List[PlanResult], meta: Dict[str, Any]) -> None:
+    payload = {
+        "meta": meta,
+        "statements": {
+            r.key: r.to_baseline() for r in sorted(results, key=lambda r: r.key)
+        },
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True, default=str)
+        f.write("\n")
+
+
+def run_check(
+    *,
+    baseline_path: str = DEFAULT_BASELINE,
+    cost_ratio: float = DEFAULT_COST_RATIO,
+    big_table_rows: int = DEFAULT_BIG_TABLE_ROWS,
+    max_cost: Optional[float] = None,
+    analyze: bool = True,
+) -> Tuple[List[PlanResult], List[str]]:
+    results, errors, _ = collect_plans(analyze=analyze)
+    baseline = load_baseline(baseline_path)
+    with PostgresClient(pooled=False, readonly=True) as db:
+        big_tables = big_table_sizes(db, big_table_rows)
+    for result in results:
+        compare(
+            result,
+            baseline.get(result.key),
+            big_tables,
+            cost_ratio=cost_ratio,
+            max_cost=max_cost,
+        )
+    return results, errors
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update", action="store_true", help="rewrite the baseline")
+    parser.add_argument("--cost-ratio", type=float, default=DEFAULT_COST_RATIO)
+    parser.add_argument("--big-table-rows", type=int, default=DEFAULT_BIG_TABLE_ROWS)
+    parser.add_argument("--max-cost", type=float, default=None)
+    parser.add_argument("--no-analyze", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.update:
+        results, errors, sample = collect_plans(analyze=not args.no_analyze)
+        with PostgresClient(pooled=False, readonly=True) as db:
+            rows = {
+                r["relname"]: int(r["reltuples"])
+                for r in db.query_all(
+                    "SELECT relname, reltuples FROM pg_class WHERE relname = ANY(%s)",
+                    (list(BUILDING_TABLES),),
+                )
+            }
+        sample = {**sample, "bbls": len(sample["bbls"])}
+        save_baseline(args.baseline, results, {"table_rows": rows, "sample": sample})
+        print(f"[plan_check] Wrote {len(results)} plans to {args.baseline}")
+        for error in errors:
+            print(f"[plan_check] ERROR {error}")
+        return 1 if errors else 0
+
+    results, errors = run_check(
+        baseline_path=args.baseline,
+        cost_ratio=args.cost_ratio,
+        big_table_rows=args.big_table_rows,
+        max_cost=args.max_cost,
+        analyze=not args.no_analyze,
+    )
+    failed = 0
+    for result in sorted(results, key=lambda r: r.key):
+        status = "FAIL" if result.failures else "ok"
+        notes = "; ".join(result.failures + result.warnings)
+        print(
+            f"[plan_check] {status:4} {result.key} cost={result.total_cost:.0f} {notes}"
+        )
+        if result.failures:
+            failed += 1
+            print("\n".join("        " + line for line in result.shape))
+    for error in errors:
+        print(f"[plan_check] ERROR {error}")
+    print(
+        f"[plan_check] {len(results)} statements, {failed} regressions, {len(errors)} errors"
+    )
+    return 1 if failed or errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
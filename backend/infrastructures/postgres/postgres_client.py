@@ -1,13 +1,59 @@
 # infrastructures/db/postgres_client.py
 
+import io
+import json
+import logging
+import re
+import time
+import uuid
+import weakref
+from collections import namedtuple
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Sequence, Union
+from dataclasses import MISSING, fields
+from datetime import date, datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import psycopg2
+from psycopg2 import extensions
+from psycopg2.errors import QueryCanceled
+from psycopg2.extensions import parse_dsn
 from psycopg2.extras import RealDictCursor, execute_values
 
-from common.exceptions.db_error import DatabaseError
+from common.exceptions.db_error import DatabaseError, DatabaseTimeoutError
 from common.utils.env_util import get_env
+from infrastructures.postgres.connection_pool import get_pool
+from infrastructures.postgres.prepared_statements import (
+    INVALID_STATEMENT_NAME,
+    is_preparable,
+    statement_cache_for,
+)
+from infrastructures.postgres.replica_router import describe, get_router
+from infrastructures.postgres.query_stats import (
+    calling_method,
+    fingerprint,
+    query_stats,
+)
+
+logger = logging.getLogger(__name__)
+
+# query_one / query_all / query_iter 의 row_factory 값
+ROW_DICT = "dict"
+ROW_TUPLE = "tuple"
+ROW_NAMEDTUPLE = "namedtuple"
+
+# str 모드 또는 columns -> (values -> row) 형태의 팩토리
+RowFactory = Union[str, Callable[[Tuple[str, ...]], Callable[[tuple], Any]], None]
 
 
 class PostgresClient:
@@ -21,9 +67,45 @@ class PostgresClient:
                 returning="id",
             )
             rows = db.query_all("SELECT * FROM some_table")
+            points = db.query_all(sql, params, row_factory=dataclass_row(HeatmapPoint))
+
+    By default connections are borrowed from a per-process pool (DB_POOL_*
+    env vars) and returned on exit; pass pooled=False for a dedicated one.
+
+    Every statement is timed and aggregated per SQL fingerprint in
+    query_stats (DB_QUERY_STATS_ENABLED); statements slower than
+    DB_SLOW_QUERY_MS are logged with their params, plus an
+    EXPLAIN (ANALYZE, BUFFERS) plan when DB_SLOW_QUERY_EXPLAIN is set.
+
+    With prepare=True (per client, per call, or DB_PREPARED_STATEMENTS)
+    execute/query_one/query_all run through PREPARE/EXECUTE, using an LRU
+    of DB_PREPARED_CACHE_SIZE statements kept per connection.
+
+    readonly=True runs the session in autocommit with
+    default_transaction_read_only: no BEGIN/COMMIT round-trips per request,
+    and writes fail fast. query_iter opens a short read-only transaction
+    for its server-side cursor.
+
+    replica=True (implies readonly) routes the client to one of the
+    DB_READ_REPLICAS DSNs (DB_REPLICA_STRATEGY round_robin or
+    least_connections). Unreachable replicas are skipped for
+    DB_REPLICA_RETRY_AFTER seconds, replicas lagging more than
+    DB_REPLICA_MAX_LAG seconds are passed over, and the primary is used
+    when no replica qualifies.
+
+    statement_timeout_ms (per client, default DB_STATEMENT_TIMEOUT_MS) and
+    timeout_ms (per call) bound each statement via SET LOCAL
+    statement_timeout; a cancelled statement raises DatabaseTimeoutError.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        pooled: Optional[bool] = None,
+        prepare: Optional[bool] = None,
+        readonly: bool = False,
+        replica: bool = False,
+        statement_timeout_ms: Optional[int] = None,
+    ):
         env = get_env()
 
         dbname = env("DB_NAME")
@@ -36,57 +118,308 @@ class PostgresClient:
             dbname=dbname, user=user, password=password, host=host, port=port
         )
 
+        if pooled is None:
+            pooled = env.bool("DB_POOL_ENABLED", default=True)
+        self._pooled = pooled
+        self._pool_options = dict(
+            min_size=env.int("DB_POOL_MIN_SIZE", default=1),
+            max_size=env.int("DB_POOL_MAX_SIZE", default=10),
+            max_idle=env.float("DB_POOL_MAX_IDLE", default=300.0),
+            timeout=env.float("DB_POOL_TIMEOUT", default=30.0),
+            check_after=env.float("DB_POOL_CHECK_AFTER", default=30.0),
+        )
+
+        self._stats_enabled = env.bool("DB_QUERY_STATS_ENABLED", default=True)
+        self._slow_query_ms = env.float("DB_SLOW_QUERY_MS", default=500.0)
+        self._explain_slow = env.bool("DB_SLOW_QUERY_EXPLAIN", default=False)
+
+        if prepare is None:
+            prepare = env.bool("DB_PREPARED_STATEMENTS", default=False)
+        self._prepare = prepare
+        self._prepared_cache_size = env.int("DB_PREPARED_CACHE_SIZE", default=100)
+
+        self._readonly = readonly or replica
+        self._replica = replica
+        # 레플리카 DSN 에 없는 값(dbname/user/password 등)은 primary 설정을 따름
+        self._replica_params = [
+            {**self._params, **parse_dsn(dsn)}
+            for dsn in env.list("DB_READ_REPLICAS", default=[])
+        ]
+        self._replica_options = dict(
+            strategy=env("DB_REPLICA_STRATEGY", default="round_robin"),
+            max_lag=env.float("DB_REPLICA_MAX_LAG", default=0.0),
+            retry_after=env.float("DB_REPLICA_RETRY_AFTER", default=30.0),
+        )
+
+        if statement_timeout_ms is None:
+            statement_timeout_ms = env.int("DB_STATEMENT_TIMEOUT_MS", default=0)
+        self._statement_timeout_ms = statement_timeout_ms
+        # 현재 트랜잭션에 SET LOCAL 로 걸어 둔 statement_timeout (없으면 None)
+        self._tx_timeout_ms: Optional[int] = None
+        # 마지막 문장에 적용된 statement_timeout - 느린 쿼리 EXPLAIN 에도 같은 상한
+        self._last_timeout_ms: Optional[int] = None
+
         self.conn = None
+        self._pool = None
+        self._replica_slot = None
+        # 아직 끝나지 않은 query_iter 제너레이터 - 연결을 반납하기 전에 닫음
+        self._open_iters: "weakref.WeakSet[Iterator[Any]]" = weakref.WeakSet()
 
     def __enter__(self) -> "PostgresClient":
         try:
-            self.conn = psycopg2.connect(**self._params)
-            self.conn.autocommit = False
+            if self._replica and self._replica_params:
+                self._connect_replica()
+            if self.conn is None:
+                self._connect(self._params)
+                self._configure_session()
             return self
+        except DatabaseTimeoutError:
+            self._release(discard=True)
+            raise
         except Exception as e:
+            self._release(discard=True)
             raise DatabaseError(f"Failed to connect to DB: {e}") from e
 
     def __exit__(self, exc_type, exc, tb):
         if self.conn is None:
             return False
+        broken = False
         try:
+            self._close_iters()
             if exc_type is None:
                 self.conn.commit()
             else:
                 self.conn.rollback()
+        except Exception:
+            broken = True
+            raise
         finally:
-            try:
-                self.conn.close()
-            finally:
-                self.conn = None
+            self._release(discard=broken)
         return False
 
+    def _close_iters(self) -> None:
+        """Finish abandoned query_iter generators while this client still owns the connection."""
+        for rows in list(self._open_iters):
+            rows.close()
+        self._open_iters.clear()
+
+    def _connect(self, params: Dict[str, Any]) -> None:
+        if self._pooled:
+            self._pool = get_pool(params, **self._pool_options)
+            self.conn = self._pool.getconn()
+        else:
+            self.conn = psycopg2.connect(**params)
+
+    def _connect_replica(self) -> None:
+        """Borrow a healthy, caught-up replica connection; leaves conn None if none qualifies."""
+        router = get_router(self._replica_params, **self._replica_options)
+        for index in router.candidates():
+            params = router.params(index)
+            try:
+                self._connect(params)
+                self._configure_session()
+                caught_up = router.lag_ok(index, self.conn)
+            except psycopg2.Error as e:
+                logger.warning("Read replica %s unavailable: %s", describe(params), e)
+                router.mark_down(index)
+                self._release(discard=True)
+                continue
+            except DatabaseError as e:
+                # 풀 대기 시간 초과 등: 레플리카 자체는 정상이므로 다음 후보로
+                logger.warning("Read replica %s skipped: %s", describe(params), e)
+                self._release(discard=True)
+                continue
+            if caught_up:
+                router.acquire(index)
+                self._replica_slot = (router, index)
+                return
+            logger.warning(
+                "Read replica %s lags more than %ss; skipping",
+                describe(params),
+                router.max_lag,
+            )
+            self._release()
+        logger.warning("No read replica available; falling back to primary")
+
+    def _configure_session(self) -> None:
+        """
+        Put a (possibly pooled, previously used) connection into this client's
+        mode. psycopg2 re-sends SET on every set_session call, so no-op changes
+        are skipped.
+        """
+        conn = self.conn
+        if self._readonly:
+            if not (conn.autocommit and conn.readonly):
+                conn.set_session(readonly=True, autocommit=True)
+        elif conn.autocommit or conn.readonly is not None:
+            conn.set_session(readonly="default", autocommit=False)
+
+    def _release(self, *, discard: bool = False) -> None:
+        conn, pool, slot = self.conn, self._pool, self._replica_slot
+        self.conn = None
+        self._pool = None
+        self._replica_slot = None
+        if slot is not None:
+            router, index = slot
+            router.release(index)
+        if conn is None:
+            return
+        if pool is not None:
+            pool.putconn(conn, discard=discard)
+        else:
+            conn.close()
+
     @contextmanager
-    def _cursor(self):
+    def _cursor(self, cursor_factory=RealDictCursor):
         if self.conn is None:
             raise DatabaseError(
                 "Connection not initialized. Use 'with PostgresClient.from_env() as db:'"
             )
         cur = None
         try:
-            cur = self.conn.cursor(cursor_factory=RealDictCursor)
+            cur = self.conn.cursor(cursor_factory=cursor_factory)
             yield cur
+        except DatabaseError:
+            raise
         except Exception as e:
-            raise DatabaseError(str(e)) from e
+            raise _db_error(str(e), e) from e
         finally:
             if cur is not None:
                 cur.close()
 
+    # ---------- Instrumentation ----------
+
+    @contextmanager
+    def _instrumented(self, sql: str, params=None):
+        probe: Dict[str, Any] = {"rows": None}
+        start = time.perf_counter()
+        error = False
+        try:
+            yield probe
+        except Exception:
+            error = True
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._record(sql, params, elapsed_ms, probe["rows"], error)
+
+    def _record(self, sql: str, params, elapsed_ms: float, rows, error: bool) -> None:
+        if not self._stats_enabled:
+            return
+        caller = calling_method()
+        slow = elapsed_ms >= self._slow_query_ms
+        plan = None
+        if slow:
+            logger.warning(
+                "Slow query %.1fms rows=%s caller=%s sql=%s params=%r",
+                elapsed_ms,
+                rows,
+                caller,
+                fingerprint(sql),
+                params,
+            )
+            if self._explain_slow and not error:
+                plan = self._explain(sql, params)
+                if plan:
+                    logger.warning("Slow query plan (%s):\n%s", caller, plan)
+        query_stats.record(
+            sql, elapsed_ms, rows, caller, error=error, slow=slow, plan=plan
+        )
+
+    def _explain(self, sql: str, params=None) -> Optional[str]:
+        """
+        EXPLAIN (ANALYZE, BUFFERS) 는 쿼리를 재실행하므로 읽기 전용 문장만 대상이며,
+        원래 문장과 같은 statement_timeout 으로 제한 (초과하면 플랜 없이 None).
+        """
+        fp = fingerprint(sql)
+        if not fp.startswith(("select", "with")) or any(
+            kw in fp for kw in ("insert ", "update ", "delete ")
+        ):
+            return None
+        if self.conn is None or self.conn.closed:
+            return None
+        cur = self.conn.cursor()
+        in_tx = not self.conn.autocommit
+        try:
+            if in_tx:
+                cur.execute("SAVEPOINT _slow_query_explain")
+            # 트랜잭션 안에서는 원래 문장의 SET LOCAL 이 아직 유효; autocommit 이면 같은 값을 다시 보냄
+            timeout_ms = self._last_timeout_ms
+            prefix = (
+                f"SET LOCAL statement_timeout = {timeout_ms}; "
+                if timeout_ms and not in_tx
+                else ""
+            )
+            cur.execute(prefix + "EXPLAIN (ANALYZE, BUFFERS) " + sql, params or None)
+            plan = "\n".join(r[0] for r in cur.fetchall())
+            if in_tx:
+                cur.execute("RELEASE SAVEPOINT _slow_query_explain")
+            return plan
+        except Exception:
+            if in_tx:
+                try:
+                    cur.execute("ROLLBACK TO SAVEPOINT _slow_query_explain")
+                except Exception:
+                    pass
+            return None
+        finally:
+            cur.close()
+
+    # ---------- Statement timeout ----------
+
+    def _timeout_prefix(self, timeout_ms: Optional[int] = None) -> str:
+        """
+        SET LOCAL statement to send in the same round-trip as the query.
+        In autocommit each query string is its own implicit transaction, so
+        the setting never outlives the call; inside a transaction it is only
+        re-sent when the effective value changes.
+        """
+        effective = self._statement_timeout_ms if timeout_ms is None else timeout_ms
+        effective = int(effective) if effective and effective > 0 else None
+        self._last_timeout_ms = effective
+        if self.conn.autocommit:
+            return f"SET LOCAL statement_timeout = {effective}; " if effective else ""
+        if self.conn.get_transaction_status() == extensions.TRANSACTION_STATUS_IDLE:
+            self._tx_timeout_ms = None
+        if effective == self._tx_timeout_ms:
+            return ""
+        self._tx_timeout_ms = effective
+        return f"SET LOCAL statement_timeout = {effective or 'DEFAULT'}; "
+
+    # ---------- Prepared statements ----------
+
+    def _run(
+        self, cur, sql: str, params, prepare: Optional[bool], timeout_ms=None
+    ) -> None:
+        prefix = self._timeout_prefix(timeout_ms)
+        if prepare is None:
+            prepare = self._prepare
+        if not prepare or not is_preparable(sql):
+            cur.execute(prefix + sql, params or None)
+            return
+        cache = statement_cache_for(self.conn, self._prepared_cache_size)
+        statement, args = cache.statement(cur, sql, params)
+        try:
+            cur.execute(prefix + statement, args)
+        except psycopg2.Error as e:
+            if e.pgcode == INVALID_STATEMENT_NAME:
+                # 서버 쪽에서 사라진 statement 는 다음 호출 때 다시 PREPARE
+                cache.forget(sql)
+            raise
+
     def execute(
         self,
         sql: str,
         params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
         *,
         returning: Optional[str] = None,
+        prepare: Optional[bool] = None,
+        timeout_ms: Optional[int] = None,
     ) -> Union[int, Any]:
-        with self._cursor() as cur:
+        with self._instrumented(sql, params) as probe, self._cursor() as cur:
             try:
-                cur.execute(sql, params or None)
+                self._run(cur, sql, params, prepare, timeout_ms)
+                probe["rows"] = cur.rowcount
                 if returning:
                     row = cur.fetchone()
                     if row is None or returning not in row:
@@ -96,35 +429,126 @@ class PostgresClient:
                     return row[returning]
                 return cur.rowcount
             except Exception as e:
-                raise DatabaseError(f"Execute failed: {e}") from e
+                raise _db_error(f"Execute failed: {e}", e) from e
 
     def query_one(
         self,
         sql: str,
         params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
-    ) -> Optional[Dict[str, Any]]:
-        """단일 행(dict) 또는 None"""
-        with self._cursor() as cur:
+        *,
+        row_factory: RowFactory = ROW_DICT,
+        prepare: Optional[bool] = None,
+        timeout_ms: Optional[int] = None,
+    ) -> Optional[Any]:
+        """단일 행(기본 dict) 또는 None"""
+        with self._instrumented(sql, params) as probe, self._cursor(
+            cursor_factory=None
+        ) as cur:
             try:
-                cur.execute(sql, params or None)
+                self._run(cur, sql, params, prepare, timeout_ms)
                 row = cur.fetchone()
-                return dict(row) if row is not None else None
+                probe["rows"] = 0 if row is None else 1
+                if row is None:
+                    return None
+                convert = _row_converter(cur.description, row_factory)
+                return convert(row) if convert else row
             except Exception as e:
-                raise DatabaseError(f"Query one failed: {e}") from e
+                raise _db_error(f"Query one failed: {e}", e) from e
 
     def query_all(
         self,
         sql: str,
         params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
-    ) -> List[Dict[str, Any]]:
-        """여러 행(list[dict])"""
-        with self._cursor() as cur:
+        *,
+        row_factory: RowFactory = ROW_DICT,
+        prepare: Optional[bool] = None,
+        timeout_ms: Optional[int] = None,
+    ) -> List[Any]:
+        """여러 행(기본 list[dict]); row_factory 로 tuple/namedtuple/객체 직접 생성"""
+        with self._instrumented(sql, params) as probe, self._cursor(
+            cursor_factory=None
+        ) as cur:
             try:
-                cur.execute(sql, params or None)
+                self._run(cur, sql, params, prepare, timeout_ms)
                 rows = cur.fetchall()
-                return [dict(r) for r in rows]
+                probe["rows"] = len(rows)
+                if cur.description is None:
+                    return rows
+                convert = _row_converter(cur.description, row_factory)
+                return [convert(r) for r in rows] if convert else rows
             except Exception as e:
-                raise DatabaseError(f"Query all failed: {e}") from e
+                raise _db_error(f"Query all failed: {e}", e) from e
+
+    def query_iter(
+        self,
+        sql: str,
+        params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+        batch_size: int = 2000,
+        *,
+        row_factory: RowFactory = ROW_DICT,
+        timeout_ms: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        서버사이드(named) 커서로 행을 batch_size 단위로 스트리밍 (dict 제너레이터).
+        Must be consumed inside the `with` block that owns the connection;
+        an iterator still open when the block exits is closed there.
+        DECLARE cannot wrap EXECUTE, so prepared statements do not apply here.
+        """
+        if self.conn is None:
+            raise DatabaseError(
+                "Connection not initialized. Use 'with PostgresClient.from_env() as db:'"
+            )
+        rows = self._iter_rows(sql, params, batch_size, row_factory, timeout_ms)
+        self._open_iters.add(rows)
+        return rows
+
+    def _iter_rows(
+        self,
+        sql: str,
+        params: Optional[Union[Sequence[Any], Dict[str, Any]]],
+        batch_size: int,
+        row_factory: RowFactory,
+        timeout_ms: Optional[int],
+    ) -> Iterator[Any]:
+        conn = self.conn
+        # named 커서는 트랜잭션 안에서만 동작하므로 autocommit(readonly) 세션이면 잠시 해제
+        own_tx = self.conn.autocommit
+        if own_tx:
+            self.conn.autocommit = False
+        cur = self.conn.cursor(name=f"iter_{uuid.uuid4().hex}")
+        cur.itersize = batch_size
+        try:
+            with self._instrumented(sql, params) as probe:
+                # DECLARE 는 단독 문장이어야 하므로 SET LOCAL 을 먼저 보냄
+                prefix = self._timeout_prefix(timeout_ms)
+                if prefix:
+                    with self.conn.cursor() as setup:
+                        setup.execute(prefix)
+                cur.execute(sql, params or None)
+                convert = None
+                probe["rows"] = 0
+                for row in cur:
+                    if convert is None:
+                        convert = (
+                            _row_converter(cur.description, row_factory) or _identity
+                        )
+                    probe["rows"] += 1
+                    yield convert(row)
+        except Exception as e:
+            raise _db_error(f"Query iter failed: {e}", e) from e
+        finally:
+            # GC 가 뒤늦게 정리하는 경우: 연결이 이미 풀로 반납됐으면 (다른 클라이언트 소유) 건드리지 않음
+            if self.conn is conn:
+                try:
+                    cur.close()
+                except Exception:
+                    pass
+                if own_tx:
+                    try:
+                        conn.rollback()
+                        conn.autocommit = True
+                    except Exception:
+                        pass
 
     # ---------- Convenience ----------
 
@@ -154,32 +578,231 @@ class PostgresClient:
         rows: List[Dict[str, Any]],
         conflict_target: Optional[List[str]] = None,  # 🔹추가
         do_update: bool = False,  # 🔹필요하면 upsert도 지원
+        use_copy: bool = False,  # 🔹대용량은 COPY 로 적재
     ) -> int:
         if not rows:
             return 0
 
+        if use_copy:
+            return self._copy_insert(table, columns, rows, conflict_target, do_update)
+
         values = [tuple(r.get(col) for col in columns) for r in rows]
 
         cols_sql = ", ".join(columns)
-        "(" + ", ".join(["%s"] * len(columns)) + ")"
-
-        if conflict_target:
-            conflict_cols = ", ".join(conflict_target)
-            if do_update:
-                update_sql = ", ".join([f"{col}=EXCLUDED.{col}" for col in columns])
-                conflict_clause = (
-                    f"ON CONFLICT ({conflict_cols}) DO UPDATE SET {update_sql}"
-                )
-            else:
-                conflict_clause = f"ON CONFLICT ({conflict_cols}) DO NOTHING"
-        else:
-            conflict_clause = ""
+        conflict_clause = self._conflict_clause(columns, conflict_target, do_update)
 
         sql = f"INSERT INTO {table} ({cols_sql}) VALUES %s {conflict_clause}"
 
-        with self._cursor() as cur:
+        with self._instrumented(sql) as probe, self._cursor() as cur:
             try:
                 execute_values(cur, sql, values)
+                probe["rows"] = len(values)
                 return len(values)
             except Exception as e:
                 raise DatabaseError(f"Bulk insert failed: {e}") from e
+
+    def copy_rows(
+        self,
+        table: str,
+        columns: List[str],
+        rows: Iterable[Sequence[Any]],
+        batch_size: int = 50_000,
+    ) -> int:
+        """
+        Stream value tuples straight into `table` with COPY ... FROM STDIN.
+        No staging table and no ON CONFLICT: meant for loading empty tables.
+        """
+        cols_sql = ", ".join(columns)
+        sql = f"COPY {table} ({cols_sql}) FROM STDIN"
+        total = 0
+        batch = io.StringIO()
+        pending = 0
+        with self._instrumented(sql) as probe, self._cursor() as cur:
+            try:
+                for row in rows:
+                    batch.write("\t".join(_copy_text(v) for v in row))
+                    batch.write("\n")
+                    pending += 1
+                    if pending >= batch_size:
+                        batch.seek(0)
+                        cur.copy_expert(sql, batch)
+                        total += pending
+                        batch, pending = io.StringIO(), 0
+                if pending:
+                    batch.seek(0)
+                    cur.copy_expert(sql, batch)
+                    total += pending
+                probe["rows"] = total
+                return total
+            except Exception as e:
+                raise DatabaseError(f"Copy failed: {e}") from e
+
+    @staticmethod
+    def _conflict_clause(
+        columns: List[str], conflict_target: Optional[List[str]], do_update: bool
+    ) -> str:
+        if not conflict_target:
+            return ""
+        conflict_cols = ", ".join(conflict_target)
+        if do_update:
+            update_sql = ", ".join([f"{col}=EXCLUDED.{col}" for col in columns])
+            return f"ON CONFLICT ({conflict_cols}) DO UPDATE SET {update_sql}"
+        return f"ON CONFLICT ({conflict_cols}) DO NOTHING"
+
+    def _copy_insert(
+        self,
+        table: str,
+        columns: List[str],
+        rows: List[Dict[str, Any]],
+        conflict_target: Optional[List[str]],
+        do_update: bool,
+    ) -> int:
+        """
+        COPY rows into a temp staging table, then merge them with a single
+        INSERT ... SELECT ... ON CONFLICT.
+
+        Same result as the VALUES path except for duplicate conflict keys
+        inside one batch with do_update=True: VALUES fails ("ON CONFLICT DO
+        UPDATE command cannot affect row a second time"), while COPY keeps
+        the last of the duplicate rows. With DO NOTHING both keep the first.
+        """
+        stage = f"_bulk_stage_{uuid.uuid4().hex}"
+        cols_sql = ", ".join(columns)
+
+        buf = io.StringIO()
+        for r in rows:
+            buf.write("\t".join(_copy_text(r.get(col)) for col in columns))
+            buf.write("\n")
+        buf.seek(0)
+
+        source = f"SELECT {cols_sql} FROM {stage}"
+        if conflict_target and do_update:
+            # 같은 배치 안의 중복 키는 DO UPDATE 가 두 번 건드릴 수 없으므로 마지막 행만 사용
+            conflict_cols = ", ".join(conflict_target)
+            source = (
+                f"SELECT DISTINCT ON ({conflict_cols}) {cols_sql} FROM {stage} "
+                f"ORDER BY {conflict_cols}, _seq DESC"
+            )
+        conflict_clause = self._conflict_clause(columns, conflict_target, do_update)
+
+        merge_sql = f"INSERT INTO {table} ({cols_sql}) {source} {conflict_clause}"
+        # 스테이징 테이블 이름은 매번 달라지므로 고정된 문장으로 집계
+        label = f"COPY {table} ({cols_sql}) FROM STDIN {conflict_clause}"
+        with self._instrumented(label) as probe, self._cursor() as cur:
+            try:
+                cur.execute(
+                    f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS "
+                    f"SELECT {cols_sql} FROM {table} WITH NO DATA"
+                )
+                cur.execute(f"ALTER TABLE {stage} ADD COLUMN _seq bigserial")
+                cur.copy_expert(f"COPY {stage} ({cols_sql}) FROM STDIN", buf)
+                cur.execute(merge_sql)
+                cur.execute(f"DROP TABLE {stage}")
+                probe["rows"] = len(rows)
+                return len(rows)
+            except Exception as e:
+                raise DatabaseError(f"Bulk copy failed: {e}") from e
+
+
+def _db_error(message: str, error: Exception) -> DatabaseError:
+    """statement_timeout 으로 취소된 쿼리는 DatabaseTimeoutError 로 구분"""
+    if isinstance(error, DatabaseTimeoutError):
+        return DatabaseTimeoutError(message, status=error.status)
+    if isinstance(error, QueryCanceled):
+        return DatabaseTimeoutError(message, status=504)
+    return DatabaseError(message)
+
+
+def _identity(row):
+    return row
+
+
+def _row_converter(description, row_factory: RowFactory) -> Optional[Callable]:
+    """Return a tuple -> row callable for the given mode (None = keep tuples)."""
+    if row_factory == ROW_TUPLE:
+        return None
+    columns = tuple(d[0] for d in description)
+    if row_factory is None or row_factory == ROW_DICT:
+        return lambda values: dict(zip(columns, values))
+    if row_factory == ROW_NAMEDTUPLE:
+        return namedtuple("Row", columns, rename=True)._make
+    if callable(row_factory):
+        return row_factory(columns)
+    raise DatabaseError(f"Unknown row_factory: {row_factory!r}")
+
+
+def dataclass_row(
+    cls, *, rename: Optional[Dict[str, str]] = None, **constants
+) -> Callable[[Tuple[str, ...]], Callable[[tuple], Any]]:
+    """
+    Row factory that builds `cls` straight from result tuples.
+
+    rename maps column names to field names (e.g. {"class": "class_"});
+    constants fill fields that are not selected (e.g. data_type="violations").
+    """
+    rename = rename or {}
+    init_fields = [f for f in fields(cls) if f.init]
+
+    def factory(columns: Tuple[str, ...]) -> Callable[[tuple], Any]:
+        position = {rename.get(c, c): i for i, c in enumerate(columns)}
+        plan = []
+        for f in init_fields:
+            if f.name in constants:
+                plan.append((False, constants[f.name]))
+            elif f.name in position:
+                plan.append((True, position[f.name]))
+            elif f.default is MISSING and f.default_factory is MISSING:
+                raise DatabaseError(
+                    f"Column for required field '{f.name}' of {cls.__name__} not selected"
+                )
+            else:
+                break
+        covered = len(plan)
+        if any(
+            f.name in position or f.name in constants for f in init_fields[covered:]
+        ):
+            # 중간에 빠진 필드가 있으면 위치 인자 대신 키워드로 생성
+            keyword_plan = [
+                (f.name, position[f.name])
+                for f in init_fields
+                if f.name in position and f.name not in constants
+            ]
+            return lambda values: cls(
+                **{name: values[i] for name, i in keyword_plan}, **constants
+            )
+        return lambda values: cls(
+            *[values[ref] if from_row else ref for from_row, ref in plan]
+        )
+
+    return factory
+
+
+# COPY text 형식에서 이스케이프가 필요한 문자
+_COPY_SPECIAL_RE = re.compile(r"[\\\t\n\r]")
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_text(value: Any) -> str:
+    """Encode one value for COPY ... FROM STDIN (text format)."""
+    if value is None:
+        return "\\N"
+    cls = type(value)
+    # 대량 적재 시 대부분을 차지하는 str/int/float 는 바로 처리
+    if cls is str:
+        if _COPY_SPECIAL_RE.search(value) is None:
+            return value
+        return value.translate(_COPY_ESCAPES)
+    if cls is int or cls is float:
+        return str(value)
+    if cls is bool:
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        # jsonb 컬럼용 - psycopg2 Json 어댑터처럼 JSON 으로 (str() 은 파이썬 repr)
+        text = json.dumps(value)
+    else:
+        text = str(value)
+    if _COPY_SPECIAL_RE.search(text) is None:
+        return text
+    return text.translate(_COPY_ESCAPES)
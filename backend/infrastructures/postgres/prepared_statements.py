@@ -0,0 +1,141 @@
+# infrastructures/postgres/prepared_statements.py
+
+import hashlib
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+from common.exceptions.db_error import DatabaseError
+
+_PLACEHOLDER_RE = re.compile(r"%\((\w+)\)s|%s|%%")
+_LEADING_WORD_RE = re.compile(r"^\s*(?:--[^\n]*\n\s*)*\(?\s*(\w+)")
+
+# PREPARE 로 감쌀 수 있는 문장 종류 (DDL/유틸리티 문장은 그대로 실행)
+PREPARABLE_STATEMENTS = frozenset(
+    {"select", "insert", "update", "delete", "values", "with"}
+)
+
+# 서버에서 prepared statement 를 찾지 못할 때 (DISCARD ALL, 외부 DEALLOCATE 등)
+INVALID_STATEMENT_NAME = "26000"
+
+
+@lru_cache(maxsize=1024)
+def is_preparable(sql: str) -> bool:
+    match = _LEADING_WORD_RE.match(sql)
+    return bool(match) and match.group(1).lower() in PREPARABLE_STATEMENTS
+
+
+@lru_cache(maxsize=1024)
+def to_positional(sql: str) -> Tuple[str, Union[int, Tuple[str, ...]]]:
+    """
+    Rewrite psycopg2 placeholders to PostgreSQL's $n form.
+
+    Returns (sql, keys): keys is the number of %s placeholders, or the
+    ordered tuple of names for %(name)s placeholders (a repeated name
+    reuses its $n).
+    """
+    names: Dict[str, int] = {}
+    positional = 0
+
+    def replace(match) -> str:
+        nonlocal positional
+        token = match.group(0)
+        if token == "%%":
+            return "%"
+        name = match.group(1)
+        if name is None:
+            positional += 1
+            return f"${positional}"
+        if name not in names:
+            names[name] = len(names) + 1
+        return f"${names[name]}"
+
+    text = _PLACEHOLDER_RE.sub(replace, sql)
+    if positional and names:
+        raise DatabaseError("Cannot mix %s and %(name)s placeholders in one statement")
+    return text, tuple(names) if names else positional
+
+
+def statement_name(sql: str) -> str:
+    return "ps_" + hashlib.md5(sql.encode("utf-8")).hexdigest()[:16]
+
+
+class PreparedStatementCache:
+    """
+    LRU of statements PREPAREd on one connection, keyed by SQL text.
+
+    The backend pid is checked on every lookup: a reconnected session
+    starts with an empty cache, so statements are simply prepared again.
+    """
+
+    def __init__(self, max_size: int = 100):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self.max_size = max_size
+        self._statements: "OrderedDict[str, str]" = OrderedDict()
+        self._backend_pid: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def __contains__(self, sql: str) -> bool:
+        return sql in self._statements
+
+    def statement(
+        self,
+        cur,
+        sql: str,
+        params: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+    ) -> Tuple[str, Optional[Tuple[Any, ...]]]:
+        """PREPARE `sql` if needed and return the (EXECUTE sql, args) pair to run."""
+        pid = cur.connection.get_backend_pid()
+        if pid != self._backend_pid:
+            self._statements.clear()
+            self._backend_pid = pid
+
+        pg_sql, keys = to_positional(sql)
+        name = self._statements.get(sql)
+        if name is None:
+            name = statement_name(sql)
+            cur.execute(f"PREPARE {name} AS {pg_sql}")
+            self._statements[sql] = name
+            while len(self._statements) > self.max_size:
+                _, evicted = self._statements.popitem(last=False)
+                cur.execute(f"DEALLOCATE {evicted}")
+        else:
+            self._statements.move_to_end(sql)
+
+        if isinstance(keys, tuple):
+            args = tuple(params[k] for k in keys)
+        else:
+            args = tuple(params or ())
+            if len(args) != keys:
+                raise DatabaseError(
+                    f"Statement expects {keys} parameters, got {len(args)}"
+                )
+        if not args:
+            return f"EXECUTE {name}", None
+        return f"EXECUTE {name} ({', '.join(['%s'] * len(args))})", args
+
+    def forget(self, sql: str) -> None:
+        self._statements.pop(sql, None)
+
+    def clear(self) -> None:
+        self._statements.clear()
+        self._backend_pid = None
+
+
+_caches: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def statement_cache_for(conn, max_size: int = 100) -> PreparedStatementCache:
+    """Cache bound to this connection object; lives as long as the (pooled) connection."""
+    with _caches_lock:
+        cache = _caches.get(conn)
+        if cache is None:
+            cache = _caches[conn] = PreparedStatementCache(max_size)
+        return cache
@@ -0,0 +1,212 @@
+# infrastructures/postgres/profile_cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Tuple
+
+from common.utils.env_util import get_env
+from infrastructures.postgres.postgres_client import PostgresClient
+
+# 크롤러 load() 가 커밋할 때마다 올리는 데이터 버전 (워커 간 캐시 무효화용, 0005 마이그레이션)
+DATA_VERSION_NAME = "building"
+
+DATA_VERSION_SQL = "SELECT version, updated_at FROM data_version WHERE name = %s"
+
+BUMP_DATA_VERSION_SQL = """
+INSERT INTO data_version (name, version) VALUES (%s, 1)
+ON CONFLICT (name) DO UPDATE
+SET version = data_version.version + 1, updated_at = clock_timestamp()
+"""
+
+
+class DataVersion(NamedTuple):
+    version: int
+    updated_at: Optional[datetime]
+
+
+def read_data_version(db: PostgresClient, name: str = DATA_VERSION_NAME) -> DataVersion:
+    row = db.query_one(DATA_VERSION_SQL, (name,), prepare=True)
+    if row is None:
+        return DataVersion(0, None)
+    return DataVersion(row["version"], row["updated_at"])
+
+
+def bump_data_version(db: PostgresClient, name: str = DATA_VERSION_NAME) -> None:
+    """
+    Invalidate every worker's ProfileCache once this transaction commits.
+
+    Run it last in a loading transaction: the row lock is held until commit.
+    """
+    db.execute(BUMP_DATA_VERSION_SQL, (name,))
+
+
+def _read_data_version_from_env() -> DataVersion:
+    with PostgresClient(readonly=True) as db:
+        return read_data_version(db)
+
+
+class ProfileCache:
+    """
+    Process-local LRU of assembled building profiles with a TTL.
+
+    Negative results (BBLs the API answers with 404) are kept too, for
+    negative_ttl seconds. At most once every version_check_interval seconds
+    a lookup reads the data version that crawler loads bump
+    (bump_data_version). When it has changed, the whole cache is dropped,
+    so every worker stops serving stale profiles within that interval.
+    max_size=0 disables caching (every lookup loads).
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 60.0,
+        negative_ttl: float = 30.0,
+        version_check_interval: float = 1.0,
+        version_loader: Optional[Callable[[], Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_size < 0:
+            raise ValueError("max_size must be >= 0")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.version_check_interval = version_check_interval
+        self._version_loader = version_loader or _read_data_version_from_env
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (expires_at, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._version: Any = None
+        self._version_checked_at: Optional[float] = None
+        self._stats = {
+            "hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+        }
+
+    @classmethod
+    def from_env(cls) -> "ProfileCache":
+        env = get_env()
+        return cls(
+            max_size=env.int("BUILDING_CACHE_SIZE", default=1024),
+            ttl=env.float("BUILDING_CACHE_TTL", default=60.0),
+            negative_ttl=env.float("BUILDING_CACHE_NEGATIVE_TTL", default=30.0),
+            version_check_interval=env.float(
+                "BUILDING_CACHE_VERSION_CHECK", default=1.0
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        load: Callable[[], Any],
+        is_negative: Callable[[Any], bool] = lambda value: value is None,
+    ) -> Any:
+        """
+        Cached value of `key`, or load() it and cache the result.
+
+        Results for which is_negative() is true are cached with negative_ttl.
+        A result is not cached if the data version changed while it loaded.
+        Cached values are shared between requests and must not be mutated.
+        """
+        if self.max_size == 0:
+            return load()
+
+        version = self._current_version()
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._stats["negative_hits" if is_negative(value) else "hits"] += 1
+                    return value
+                del self._entries[key]
+                self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+
+        value = load()
+        ttl = self.negative_ttl if is_negative(value) else self.ttl
+        if ttl <= 0:
+            return value
+        with self._lock:
+            if version != self._version:
+                return value
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+        return value
+
+    def data_version(self) -> Any:
+        """
+        The data version as of the last check, re-read (dropping the cache
+        if it changed) once version_check_interval has passed.
+        """
+        return self._current_version()
+
+    def _current_version(self) -> Any:
+        now = self._clock()
+        checked_at = self._version_checked_at
+        if checked_at is not None and now - checked_at < self.version_check_interval:
+            return self._version
+        version = self._version_loader()
+        with self._lock:
+            if version != self._version:
+                if self._entries:
+                    self._stats["invalidations"] += 1
+                self._entries.clear()
+                self._version = version
+            self._version_checked_at = now
+        return version
+
+    def invalidate(self) -> None:
+        """Drop every entry and re-read the data version on the next lookup."""
+        with self._lock:
+            self._entries.clear()
+            self._version_checked_at = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters plus the current size and data version."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["negative_hits"]
+            lookups += self._stats["misses"]
+            return {
+                **self._stats,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hit_rate": (
+                    (lookups - self._stats["misses"]) / lookups if lookups else 0.0
+                ),
+                "data_version": self._version,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = 0
+
+
+_profile_cache: Optional[ProfileCache] = None
+_profile_cache_lock = threading.Lock()
+
+
+def get_profile_cache() -> ProfileCache:
+    """Per-process ProfileCache configured from BUILDING_CACHE_* env vars."""
+    global _profile_cache
+    if _profile_cache is None:
+        with _profile_cache_lock:
+            if _profile_cache is None:
+                _profile_cache = ProfileCache.from_env()
+    return _profile_cache
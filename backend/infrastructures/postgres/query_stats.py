@@ -0,0 +1,137 @@
+# infrastructures/postgres/query_stats.py
+
+import hashlib
+import os
+import re
+import sys
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_PLACEHOLDER_RE = re.compile(r"%\(\w+\)s|%s")
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE_RE = re.compile(r"\s+")
+
+# 호출자(repository 메서드) 탐색 시 건너뛸 모듈
+_SKIP_MODULES = (
+    "infrastructures.postgres.postgres_client",
+    "infrastructures.postgres.query_stats",
+    "infrastructures.postgres.plan_check",
+    "contextlib",
+)
+# python -m 으로 실행된 모듈은 이름이 __main__ 이므로 파일 경로로 판별
+_SKIP_MAIN_FILES = (os.path.join("infrastructures", "postgres", "plan_check.py"),)
+
+
+def _skipped(frame) -> bool:
+    module = frame.f_globals.get("__name__", "")
+    if module == "__main__":
+        return frame.f_code.co_filename.endswith(_SKIP_MAIN_FILES)
+    return module.startswith(_SKIP_MODULES)
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(sql: str) -> str:
+    """
+    Normalize SQL so that statements differing only in literals, placeholders
+    or IN-list length share one fingerprint.
+    """
+    text = _COMMENT_RE.sub(" ", sql)
+    text = _PLACEHOLDER_RE.sub("?", text)
+    text = _STRING_RE.sub("?", text)
+    text = _NUMBER_RE.sub("?", text)
+    text = _IN_LIST_RE.sub("(?+)", text)
+    return _SPACE_RE.sub(" ", text).strip().lower()
+
+
+def fingerprint_id(fp: str) -> str:
+    return hashlib.md5(fp.encode("utf-8")).hexdigest()[:12]
+
+
+def calling_method(depth: int = 2) -> str:
+    """Return 'Class.method' (or 'module.function') of the first frame outside the DB client."""
+    try:
+        frame = sys._getframe(depth)
+    except ValueError:
+        return "unknown"
+    while frame is not None:
+        if not _skipped(frame):
+            module = frame.f_globals.get("__name__", "")
+            owner = frame.f_locals.get("self")
+            name = frame.f_code.co_name
+            if owner is not None:
+                return f"{type(owner).__name__}.{name}"
+            return f"{module}.{name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+class QueryStats:
+    """Process-wide, per-fingerprint aggregation of query timings."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def record(
+        self,
+        sql: str,
+        elapsed_ms: float,
+        rows: Optional[int],
+        caller: str,
+        *,
+        error: bool = False,
+        slow: bool = False,
+        plan: Optional[str] = None,
+    ) -> str:
+        fp = fingerprint(sql)
+        with self._lock:
+            entry = self._stats.get(fp)
+            if entry is None:
+                entry = self._stats[fp] = {
+                    "id": fingerprint_id(fp),
+                    "fingerprint": fp,
+                    "calls": 0,
+                    "errors": 0,
+                    "slow_calls": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "rows": 0,
+                    "callers": {},
+                    "last_plan": None,
+                }
+            entry["calls"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            entry["rows"] += rows or 0
+            entry["callers"][caller] = entry["callers"].get(caller, 0) + 1
+            if error:
+                entry["errors"] += 1
+            if slow:
+                entry["slow_calls"] += 1
+            if plan is not None:
+                entry["last_plan"] = plan
+        return fp
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """JSON-ready copy of the aggregates, most expensive fingerprint first."""
+        with self._lock:
+            items = [
+                {
+                    **entry,
+                    "mean_ms": entry["total_ms"] / entry["calls"],
+                    "callers": dict(entry["callers"]),
+                }
+                for entry in self._stats.values()
+            ]
+        return sorted(items, key=lambda e: e["total_ms"], reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+query_stats = QueryStats()
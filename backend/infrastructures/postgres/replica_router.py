@@ -0,0 +1,146 @@
+# infrastructures/postgres/replica_router.py
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+ROUND_ROBIN = "round_robin"
+LEAST_CONNECTIONS = "least_connections"
+
+# 복제 지연(초): WAL 을 모두 재생했다면 0, primary 에 연결된 경우도 0.
+# 재생이 밀렸는데 재생된 트랜잭션이 아직 없으면 지연을 알 수 없으므로 Infinity
+LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())::float8,
+            'Infinity'::float8
+        )
+    END
+"""
+
+
+class ReplicaRouter:
+    """
+    Chooses a read replica for read-only clients.
+
+    - strategy: ROUND_ROBIN or LEAST_CONNECTIONS (fewest clients checked out)
+    - max_lag: seconds of replication lag tolerated (0 disables the guard)
+    - retry_after: seconds a failed replica is skipped before it is retried
+    - lag_check_interval: seconds a lag measurement is reused
+    """
+
+    def __init__(
+        self,
+        replicas: List[Dict[str, Any]],
+        *,
+        strategy: str = ROUND_ROBIN,
+        max_lag: float = 0.0,
+        retry_after: float = 30.0,
+        lag_check_interval: float = 5.0,
+    ):
+        if strategy not in (ROUND_ROBIN, LEAST_CONNECTIONS):
+            raise ValueError(f"Unknown replica strategy: {strategy!r}")
+        self._replicas = [dict(p) for p in replicas]
+        self.strategy = strategy
+        self.max_lag = max_lag
+        self.retry_after = retry_after
+        self.lag_check_interval = lag_check_interval
+
+        self._lock = threading.Lock()
+        self._next = 0
+        self._in_use = [0] * len(self._replicas)
+        self._down_until = [0.0] * len(self._replicas)
+        # (measured lag, measured_at)
+        self._lag: List[Tuple[Optional[float], float]] = [(None, 0.0)] * len(
+            self._replicas
+        )
+
+    def __len__(self) -> int:
+        return len(self._replicas)
+
+    def params(self, index: int) -> Dict[str, Any]:
+        return self._replicas[index]
+
+    def in_use(self, index: int) -> int:
+        with self._lock:
+            return self._in_use[index]
+
+    def candidates(self) -> List[int]:
+        """Healthy replica indexes, most preferred first."""
+        now = time.monotonic()
+        with self._lock:
+            count = len(self._replicas)
+            if not count:
+                return []
+            start = self._next % count
+            self._next += 1
+            order = [(start + i) % count for i in range(count)]
+            if self.strategy == LEAST_CONNECTIONS:
+                # 동률이면 라운드로빈 순서 유지 (sorted 는 stable)
+                order.sort(key=lambda i: self._in_use[i])
+            return [i for i in order if self._down_until[i] <= now]
+
+    def acquire(self, index: int) -> None:
+        with self._lock:
+            self._in_use[index] += 1
+
+    def release(self, index: int) -> None:
+        with self._lock:
+            self._in_use[index] = max(0, self._in_use[index] - 1)
+
+    def mark_down(self, index: int) -> None:
+        with self._lock:
+            self._down_until[index] = time.monotonic() + self.retry_after
+            self._lag[index] = (None, 0.0)
+
+    def lag_ok(self, index: int, conn) -> bool:
+        """Lag guard; re-measures on `conn` at most every lag_check_interval."""
+        if not self.max_lag:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            lag, measured_at = self._lag[index]
+        if lag is None or now - measured_at >= self.lag_check_interval:
+            lag = measure_lag(conn)
+            with self._lock:
+                self._lag[index] = (lag, now)
+        return lag <= self.max_lag
+
+
+def measure_lag(conn) -> float:
+    with conn.cursor() as cur:
+        cur.execute(LAG_SQL)
+        return float(cur.fetchone()[0])
+
+
+def describe(params: Dict[str, Any]) -> str:
+    """host:port/dbname for logs (never the password)."""
+    return (
+        f"{params.get('host', 'localhost')}:{params.get('port', 5432)}"
+        f"/{params.get('dbname', '')}"
+    )
+
+
+_routers: Dict[Tuple, ReplicaRouter] = {}
+_routers_lock = threading.Lock()
+
+
+def get_router(replicas: List[Dict[str, Any]], **options) -> ReplicaRouter:
+    """Per-process router shared by every client configured with these replicas."""
+    key = (
+        os.getpid(),
+        tuple(tuple(sorted((k, str(v)) for k, v in p.items())) for p in replicas),
+        tuple(sorted(options.items())),
+    )
+    router = _routers.get(key)
+    if router is not None:
+        return router
+    with _routers_lock:
+        router = _routers.get(key)
+        if router is None:
+            router = ReplicaRouter(replicas, **options)
+            _routers[key] = router
+        return router
@@ -1,6 +1,7 @@
 # python
 import importlib
 import inspect
+import json
 from unittest.mock import Mock, patch
 
 from django.test import TestCase
@@ -178,12 +179,626 @@ class BuildingRepositoryTests(TestCase):
         except Exception as e:
             self.skipTest(f"Database query failed: {e}")
 
+    def test_get_by_bbl_single_query_matches_multi_query(self):
+        """Test the single round-trip profile returns the same sections"""
+        try:
+            multi = self.repository.get_by_bbl("1013510030")
+            single = self.repository.get_by_bbl("1013510030", single_query=True)
+        except Exception as e:
+            self.skipTest(f"Database query failed: {e}")
+        self.assertEqual(single.registration, multi.registration)
+        self.assertEqual(len(single.violations), len(multi.violations))
+        self.assertEqual(len(single.complaints), len(multi.complaints))
+        self.assertEqual(len(single.evictions), len(multi.evictions))
+        self.assertEqual(single.acris_master, multi.acris_master)
+
+    def test_single_query_keeps_whole_doc_amount_decimal(self):
+        """Test a whole-number NUMERIC doc_amount decodes to Decimal like the multi-query path"""
+        from decimal import Decimal
+
+        from common.exceptions.db_error import DatabaseError
+        from common.utils.json_util import to_primitive
+
+        try:
+            with PostgresClient() as db:
+                bbl = db.scalar(
+                    "SELECT l.bbl FROM building_acris_legals l "
+                    "JOIN building_acris_master m ON m.document_id = l.document_id "
+                    "WHERE m.doc_amount = trunc(m.doc_amount) LIMIT 1"
+                )
+            if bbl is None:
+                self.skipTest("No whole-number ACRIS amounts loaded")
+            multi = self.repository.get_by_bbl(bbl)
+            # 모든 섹션을 요청해야 한 문장 프로필(BUILDING_PROFILE_SQL)을 씀
+            single = self.repository.get_by_bbl(bbl, single_query=True)
+        except DatabaseError as e:
+            self.skipTest(f"Database query failed: {e}")
+
+        amounts = [m.doc_amount for m in single.acris_master.values()]
+        self.assertTrue(amounts)
+        self.assertTrue(all(isinstance(a, Decimal) for a in amounts if a is not None))
+        self.assertEqual(single.acris_master, multi.acris_master)
+        self.assertEqual(
+            to_primitive(single.acris_master), to_primitive(multi.acris_master)
+        )
+
+    def test_get_by_bbl_concurrent_matches_sequential(self):
+        """Test concurrent section fetching assembles the same building"""
+        try:
+            sequential = self.repository.get_by_bbl("1013510030")
+            concurrent = self.repository.get_by_bbl("1013510030", concurrent=True)
+        except Exception as e:
+            self.skipTest(f"Database query failed: {e}")
+        self.assertEqual(concurrent, sequential)
+
+    def test_get_by_bbl_concurrent_runs_sections_in_parallel(self):
+        """Test each section gets its own client and the sections overlap"""
+        import threading
+
+        from common.models.building import ROW_SECTIONS
+
+        barrier = threading.Barrier(len(ROW_SECTIONS))
+        clients = []
+
+        def query(sql, params=None, **kwargs):
+            # 모든 섹션이 동시에 진행 중이어야 통과
+            barrier.wait(timeout=5)
+            return None
+
+        def factory(**kwargs):
+            db = Mock()
+            db.query_one.side_effect = query
+            db.query_all.side_effect = lambda *a, **k: query(*a, **k) or []
+            client = Mock()
+            client.__enter__ = Mock(return_value=db)
+            client.__exit__ = Mock(return_value=False)
+            clients.append(kwargs)
+            return client
+
+        repository = BuildingRepository(concurrent=True)
+        repository.client_factory = factory
+        building = repository.get_by_bbl("1013510030")
+
+        self.assertEqual(building.bbl, "1013510030")
+        self.assertEqual(building.violations, [])
+        self.assertEqual(len(clients), len(ROW_SECTIONS))
+        self.assertTrue(all(c == {"readonly": True} for c in clients))
+
+    def test_get_by_bbl_sections_skips_unrequested_queries(self):
+        """Test only requested sections are queried and the rest load lazily"""
+        db = Mock()
+        db.query_one.return_value = None
+        db.query_all.return_value = []
+        factory = Mock()
+        factory.return_value.__enter__ = Mock(return_value=db)
+        factory.return_value.__exit__ = Mock(return_value=False)
+        repository = BuildingRepository(single_query=True)
+        repository.client_factory = factory
+
+        building = repository.get_by_bbl("1013510030", sections=["registration"])
+        self.assertEqual(db.query_one.call_count, 1)
+        self.assertEqual(db.query_all.call_count, 0)
+        self.assertEqual(building.loaded_sections, {"registration"})
+
+        self.assertEqual(building.section("violations"), [])
+        self.assertEqual(db.query_all.call_count, 1)
+        self.assertIn("building_violations", db.query_all.call_args[0][0])
+        self.assertTrue(building.is_loaded("violations"))
+        building.load("violations")
+        self.assertEqual(db.query_all.call_count, 1)
+
+        with self.assertRaises(ValueError):
+            repository.get_by_bbl("1013510030", sections=["nope"])
+
+    def test_get_by_bbl_counts_match_loaded_rows(self):
+        """Test SQL counts equal the lengths of the fully loaded sections"""
+        from common.exceptions.db_error import DatabaseError
+
+        try:
+            with PostgresClient() as db:
+                bbl = db.scalar(
+                    "SELECT bbl FROM building_violations GROUP BY bbl "
+                    "ORDER BY COUNT(*) DESC LIMIT 1"
+                )
+            if bbl is None:
+                self.skipTest("No violations loaded")
+            full = self.repository.get_by_bbl(bbl)
+            counts = self.repository.get_by_bbl(bbl, sections=["counts"]).counts
+        except DatabaseError as e:
+            self.skipTest(f"Database query failed: {e}")
+
+        self.assertEqual(
+            counts,
+            {
+                "contacts": len(full.contacts),
+                "affordable": len(full.affordable),
+                "complaints": len(full.complaints),
+                "violations": len(full.violations),
+                "evictions": len(full.evictions),
+                "acris_docs": len(full.acris_master),
+                "acris_legals": sum(len(v) for v in full.acris_legals.values()),
+                "acris_parties": sum(len(v) for v in full.acris_parties.values()),
+            },
+        )
+
+    def test_collection_cursor_round_trip(self):
+        """Test cursors decode to keyset params and reject foreign input"""
+        from datetime import datetime
+
+        from common.models.eviction import Eviction
+        from infrastructures.postgres.building_repository import PAGED_COLLECTIONS
+
+        spec = PAGED_COLLECTIONS["evictions"]
+        eviction = Mock(spec=Eviction)
+        eviction.executed_date = datetime(2024, 5, 1, 9, 30)
+        eviction.docket_number = "D1"
+        eviction.court_index_number = "LT-1"
+        self.assertEqual(
+            spec.decode_cursor(spec.encode_cursor(eviction)),
+            {
+                "after_date": datetime(2024, 5, 1, 9, 30),
+                "after_0": "D1",
+                "after_1": "LT-1",
+            },
+        )
+
+        eviction.executed_date = None
+        self.assertIsNone(
+            spec.decode_cursor(spec.encode_cursor(eviction))["after_date"]
+        )
+
+        violations = PAGED_COLLECTIONS["violations"]
+        for bad in ("", "not base64!", "WzFd", spec.encode_cursor(eviction)):
+            with self.assertRaises(ValueError):
+                violations.decode_cursor(bad)
+
+    def test_get_collection_page_keyset_query(self):
+        """Test a page fetches limit + 1 rows and continues after the cursor"""
+        from dataclasses import fields
+
+        from common.models.violation import Violation
+
+        blank = {f.name: None for f in fields(Violation)}
+        rows = [{**blank, "violation_id": i, "bbl": "1013510030"} for i in (30, 20, 10)]
+        db = Mock()
+        db.query_all.return_value = rows
+        factory = Mock()
+        factory.return_value.__enter__ = Mock(return_value=db)
+        factory.return_value.__exit__ = Mock(return_value=False)
+        self.repository.client_factory = factory
+
+        page = self.repository.get_collection_page("1013510030", "violations", limit=2)
+        sql, params = db.query_all.call_args[0]
+        self.assertIn("ORDER BY", sql)
+        self.assertNotIn("after_0", sql)
+        self.assertEqual(params, {"bbl": "1013510030", "limit": 3})
+        self.assertEqual([v.violation_id for v in page.items], [30, 20])
+        self.assertIsNotNone(page.next_cursor)
+
+        db.query_all.return_value = rows[2:]
+        last = self.repository.get_collection_page(
+            "1013510030", "violations", cursor=page.next_cursor, limit=2
+        )
+        sql, params = db.query_all.call_args[0]
+        self.assertIn("%(after_0)s", sql)
+        self.assertEqual(params["after_0"], 20)
+        self.assertIsNone(params["after_date"])
+        self.assertEqual([v.violation_id for v in last.items], [10])
+        self.assertIsNone(last.next_cursor)
+
+        with self.assertRaises(ValueError):
+            self.repository.get_collection_page("1013510030", "contacts")
+
+    def test_collection_pages_cover_every_row_once(self):
+        """Test paging through the busiest building returns each violation once, newest first"""
+        from datetime import datetime
+
+        from common.exceptions.db_error import DatabaseError
+
+        try:
+            with PostgresClient() as db:
+                bbl = db.scalar(
+                    "SELECT bbl FROM building_violations GROUP BY bbl "
+                    "ORDER BY COUNT(*) DESC LIMIT 1"
+                )
+            if bbl is None:
+                self.skipTest("No violations loaded")
+            total = self.repository.get_by_bbl(bbl, sections=["counts"]).counts
+            first = self.repository.get_by_bbl(
+                bbl,
+                single_query=True,
+                sections=["violations", "registration"],
+                page_size=7,
+            )
+            seen, cursor = [], None
+            while True:
+                page = self.repository.get_collection_page(
+                    bbl, "violations", cursor=cursor, limit=50
+                )
+                seen.extend(page.items)
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+        except DatabaseError as e:
+            self.skipTest(f"Database query failed: {e}")
+
+        ids = [v.violation_id for v in seen]
+        self.assertEqual(len(ids), total["violations"])
+        self.assertEqual(len(set(ids)), len(ids))
+        keys = [(v.inspection_date or datetime.min, v.violation_id) for v in seen]
+        self.assertEqual(keys, sorted(keys, reverse=True))
+        self.assertEqual([v.violation_id for v in first.violations], ids[:7])
+        self.assertEqual(first.cursors["violations"] is None, total["violations"] <= 7)
+
+    def test_get_by_bbl_reads_snapshot_first(self):
+        """Test a snapshot hit is one lookup and a miss falls back to live assembly"""
+        from dataclasses import fields
+
+        from common.models.building import SECTION_FIELDS
+        from common.models.violation import Violation
+        from infrastructures.postgres.building_repository import (
+            BUILDING_PROFILE_SQL,
+            SNAPSHOT_SQL,
+        )
+
+        # 프로필 JSON 의 컬럼 이름 그대로 ("class")
+        blank = {f.name: None for f in fields(Violation) if f.name != "class_"}
+        violations = [{**blank, "violation_id": i, "class": "B"} for i in (3, 2, 1)]
+        counts = {"violations": 3, "complaints": 0, "evictions": 0}
+        db = Mock()
+        db.query_one.return_value = {
+            "profile": json.dumps({"registration": None, "violations": violations}),
+            "counts": json.dumps(counts),
+        }
+        factory = Mock()
+        factory.return_value.__enter__ = Mock(return_value=db)
+        factory.return_value.__exit__ = Mock(return_value=False)
+        repository = BuildingRepository(single_query=True, snapshot=True)
+        repository.client_factory = factory
+
+        building = repository.get_by_bbl(
+            "1013510030", sections=SECTION_FIELDS, page_size=2
+        )
+        db.query_one.assert_called_once_with(
+            SNAPSHOT_SQL, ("1013510030",), prepare=True
+        )
+        self.assertEqual([v.violation_id for v in building.violations], [3, 2])
+        self.assertEqual(building.violations[0].class_, "B")
+        self.assertIsNotNone(building.cursors["violations"])
+        self.assertEqual(building.counts, counts)
+
+        # page_size 없이 전체를 원하면 저장된 행 수가 모자랄 때 실시간 조립
+        counts["violations"] = 1000
+        db.query_one.return_value = {
+            "profile": json.dumps({"violations": violations}),
+            "counts": json.dumps(counts),
+        }
+        self.assertIsNone(repository.get_snapshot_by_bbl("1013510030"))
+
+        db.query_one.reset_mock()
+        db.query_one.return_value = None
+        repository.get_by_bbl("1013510030")
+        self.assertEqual(
+            [c.args[0] for c in db.query_one.call_args_list],
+            [SNAPSHOT_SQL, BUILDING_PROFILE_SQL],
+        )
+
+    def test_profile_snapshot_matches_live_profile(self):
+        """Test a refreshed snapshot serves the same building as live assembly"""
+        from common.exceptions.db_error import DatabaseError
+        from common.models.building import SECTION_FIELDS
+        from common.utils.json_util import to_primitive
+        from infrastructures.postgres.building_repository import (
+            refresh_profile_snapshots,
+        )
+        from infrastructures.postgres.profile_cache import read_data_version
+
+        try:
+            with PostgresClient() as db:
+                bbl = db.scalar(
+                    "SELECT bbl FROM building_violations GROUP BY bbl "
+                    "ORDER BY COUNT(*) DESC LIMIT 1"
+                )
+                if bbl is None:
+                    self.skipTest("No violations loaded")
+                document_ids = [
+                    r["document_id"]
+                    for r in db.query_all(
+                        "SELECT document_id FROM building_acris_legals WHERE bbl = %s",
+                        (bbl,),
+                    )
+                ]
+                version = read_data_version(db)
+                written = refresh_profile_snapshots(db, [bbl, bbl, None])
+                if document_ids:
+                    refresh_profile_snapshots(db, document_ids, key="document_id")
+                bumped = read_data_version(db)
+            live = self.repository.get_by_bbl(
+                bbl, single_query=True, sections=SECTION_FIELDS, page_size=10
+            )
+            snapshot = self.repository.get_snapshot_by_bbl(
+                bbl, page_size=10, with_counts=True
+            )
+            full = self.repository.get_snapshot_by_bbl(bbl)
+        except DatabaseError as e:
+            self.skipTest(f"Database query failed: {e}")
+
+        self.assertEqual(written, 1)
+        self.assertEqual(bumped.version, version.version + (2 if document_ids else 1))
+        self.assertGreaterEqual(bumped.updated_at, version.updated_at)
+        self.assertEqual(to_primitive(snapshot), to_primitive(live))
+        # 가장 많은 건물은 저장된 최신 행보다 위반이 많으므로 전체 요청은 실시간으로
+        self.assertIsNone(full)
+        with self.assertRaises(ValueError):
+            refresh_profile_snapshots(Mock(), [bbl], key="violation_id")
+
+    def test_profile_snapshot_keeps_whole_doc_amount_decimal(self):
+        """Test a snapshot with a whole-number doc_amount matches the live profile"""
+        from decimal import Decimal
+
+        from common.exceptions.db_error import DatabaseError
+        from common.models.building import SECTION_FIELDS
+        from common.utils.json_util import to_primitive
+        from infrastructures.postgres.building_repository import (
+            refresh_profile_snapshots,
+        )
+
+        try:
+            with PostgresClient() as db:
+                bbl = db.scalar(
+                    "SELECT bbl FROM building_acris_documents "
+                    "WHERE doc_amount = trunc(doc_amount) LIMIT 1"
+                )
+                if bbl is None:
+                    self.skipTest("No whole-number ACRIS amounts loaded")
+                refresh_profile_snapshots(db, [bbl])
+            live = self.repository.get_by_bbl(
+                bbl, single_query=True, sections=SECTION_FIELDS, page_size=10
+            )
+            snapshot = self.repository.get_snapshot_by_bbl(
+                bbl, page_size=10, with_counts=True
+            )
+        except DatabaseError as e:
+            self.skipTest(f"Database query failed: {e}")
+
+        self.assertIsNotNone(snapshot)
+        amounts = [m.doc_amount for m in snapshot.acris_master.values()]
+        self.assertTrue(all(isinstance(a, Decimal) for a in amounts if a is not None))
+        self.assertTrue(
+            any(a == a.to_integral_value() for a in amounts if a is not None)
+        )
+        self.assertEqual(snapshot.acris_master, live.acris_master)
+        self.assertEqual(to_primitive(snapshot), to_primitive(live))
+
+    def test_acris_document_index_matches_legals_join(self):
+        """Test building_acris_documents serves the same master rows as legals ⋈ master"""
+        from common.exceptions.db_error import DatabaseError
+        from infrastructures.postgres.building_repository import (
+            refresh_acris_documents,
+        )
+
+        joined_sql = """
+            SELECT document_id, borough, doc_type, doc_date, doc_amount
+            FROM building_acris_master
+            WHERE document_id IN (
+                SELECT document_id FROM building_acris_legals WHERE bbl = %s
+            )
+            ORDER BY document_id
+        """
+        try:
+            with PostgresClient() as db:
+                bbl = db.scalar(
+                    "SELECT bbl FROM building_acris_legals GROUP BY bbl "
+                    "ORDER BY COUNT(*) DESC LIMIT 1"
+                )
+                if bbl is None:
+                    self.skipTest("No ACRIS legals loaded")
+                expected = db.query_all(joined_sql, (bbl,))
+                # 인덱스를 지운 뒤 BBL 기준으로 다시 만들어도 같은 문서
+                db.execute(
+                    "DELETE FROM building_acris_documents WHERE bbl = %s", (bbl,)
+                )
+                written = refresh_acris_documents(db, [bbl, None])
+            building = self.repository.get_by_bbl(bbl, sections=["acris"])
+        except DatabaseError as e:
+            self.skipTest(f"Database query failed: {e}")
+
+        self.assertEqual(written, len(expected))
+        self.assertEqual(
+            [building.acris_master[r["document_id"]].doc_date for r in expected],
+            [r["doc_date"] for r in expected],
+        )
+        self.assertEqual(
+            sorted(building.acris_master), [r["document_id"] for r in expected]
+        )
+        self.assertLessEqual(set(building.acris_parties), set(building.acris_legals))
+        with self.assertRaises(ValueError):
+            refresh_acris_documents(Mock(), [bbl], key="violation_id")
+
+    def test_get_many_by_bbl_batched(self):
+        """Test batched lookup returns one Building per unique BBL"""
+        try:
+            result = self.repository.get_many_by_bbl(
+                ["1013510030", "9999999999", "1013510030"]
+            )
+        except Exception as e:
+            self.skipTest(f"Database query failed: {e}")
+        if result.errors:
+            self.skipTest(f"Database query failed: {result.errors}")
+        self.assertEqual(set(result.buildings), {"1013510030", "9999999999"})
+        self.assertEqual(result["9999999999"].violations, [])
+
+    def test_get_many_by_bbl_reports_failures(self):
+        """Test a failing section query is reported per BBL instead of raised"""
+        from common.exceptions.db_error import DatabaseError
+
+        db = Mock()
+        db.query_all.side_effect = DatabaseError("boom")
+        factory = Mock()
+        factory.return_value.__enter__ = Mock(return_value=db)
+        factory.return_value.__exit__ = Mock(return_value=False)
+        self.repository.client_factory = factory
+
+        result = self.repository.get_many_by_bbl(["1000010001", "1000010002"])
+        self.assertEqual(result.buildings, {})
+        self.assertEqual(result.errors, {"1000010001": "boom", "1000010002": "boom"})
+
+    def test_get_many_by_bbl_groups_rows(self):
+        """Test rows from the batched queries are grouped per BBL"""
+        db = Mock()
+
+        def query_all(sql, params=None):
+            if "FROM building_violations" in sql:
+                return [
+                    {"violation_id": 1, "bbl": "1000010001", "class": "A"},
+                    {"violation_id": 2, "bbl": "1000010002", "class": "B"},
+                ]
+            return []
+
+        db.query_all.side_effect = query_all
+        factory = Mock()
+        factory.return_value.__enter__ = Mock(return_value=db)
+        factory.return_value.__exit__ = Mock(return_value=False)
+        self.repository.client_factory = factory
+
+        with patch(
+            "infrastructures.postgres.building_repository.build_building_from_rows"
+        ) as mock_build:
+            mock_build.side_effect = lambda **kw: kw
+            result = self.repository.get_many_by_bbl(["1000010001", "1000010002"])
+        self.assertEqual(factory.call_count, 1)
+        self.assertEqual(
+            [v["violation_id"] for v in result["1000010001"]["violation_rows"]], [1]
+        )
+        self.assertEqual(
+            [v["violation_id"] for v in result["1000010002"]["violation_rows"]], [2]
+        )
+
     def test_building_repository_methods_exist(self):
         """Test that BuildingRepository has expected methods"""
         self.assertTrue(hasattr(self.repository, "get_by_bbl"))
         self.assertTrue(callable(getattr(self.repository, "get_by_bbl")))
 
 
+class OwnerRepositoryTests(TestCase):
+    def setUp(self):
+        from infrastructures.postgres.owner_repository import OwnerRepository
+
+        self.repository = OwnerRepository()
+
+    def test_portfolio_totals_match_buildings(self):
+        """Test portfolio totals are the sums over every owned building"""
+        from common.exceptions.db_error import DatabaseError
+        from infrastructures.postgres.owner_repository import refresh_owner_index
+
+        try:
+            with PostgresClient() as db:
+                # limit 안에 전부 들어오는 작은 포트폴리오
+                row = db.query_one(
+                    "SELECT owner_name, min(bbl) AS bbl FROM building_owner_index "
+                    "GROUP BY owner_name HAVING COUNT(DISTINCT bbl) BETWEEN 2 AND 100 "
+                    "LIMIT 1"
+                )
+                if row is None:
+                    self.skipTest("Owner index is empty")
+                # 인덱스를 지운 뒤 BBL 기준으로 다시 만들어도 같은 소유자에 연결
+                db.execute(
+                    "DELETE FROM building_owner_index WHERE bbl = %s", (row["bbl"],)
+                )
+                self.assertGreater(refresh_owner_index(db, [row["bbl"], None]), 0)
+            # 대소문자/구두점이 달라도 같은 포트폴리오
+            portfolio = self.repository.get_portfolio(
+                row["owner_name"].lower() + ".", limit=500
+            )
+        except DatabaseError as e:
+            self.skipTest(f"Database query failed: {e}")
+
+        self.assertEqual(portfolio.name, row["owner_name"])
+        self.assertIn(row["bbl"], {b.bbl for b in portfolio.buildings})
+        self.assertEqual(portfolio.total_buildings, len(portfolio.buildings))
+        for total in (
+            "total_violations",
+            "open_violations",
+            "total_evictions",
+            "open_complaints",
+        ):
+            self.assertEqual(
+                getattr(portfolio, total),
+                sum(getattr(b, total) for b in portfolio.buildings),
+            )
+        opens = [b.open_violations for b in portfolio.buildings]
+        self.assertEqual(opens, sorted(opens, reverse=True))
+        self.assertIsNone(self.repository.get_portfolio("no such owner at all"))
+        with self.assertRaises(ValueError):
+            refresh_owner_index(Mock(), [row["bbl"]], key="violation_id")
+
+    def test_owner_index_excludes_agents_and_lenders(self):
+        """Test managing agents and mortgagees are not indexed as owners"""
+        from common.exceptions.db_error import DatabaseError
+        from infrastructures.postgres.building_repository import (
+            refresh_acris_documents,
+        )
+        from infrastructures.postgres.owner_repository import refresh_owner_index
+
+        class Rollback(Exception):
+            pass
+
+        bbl = "5999999999"
+        try:
+            with PostgresClient() as db:
+                db.execute(
+                    "INSERT INTO building_registrations (bbl, registration_id) "
+                    "VALUES (%s, -1)",
+                    (bbl,),
+                )
+                db.execute(
+                    "INSERT INTO building_registration_contacts "
+                    "(registration_contact_id, registration_id, type, corporation_name) "
+                    "VALUES (-1, -1, 'CorporateOwner', 'OWNER TEST LLC'), "
+                    "(-2, -1, 'Agent', 'AGENT TEST MGMT'), "
+                    "(-3, -1, 'SiteManager', 'SITE TEST CORP')"
+                )
+                # 예전 deed -> 최신 deed -> 그 뒤의 모기지
+                db.execute(
+                    "INSERT INTO building_acris_master (document_id, doc_type, doc_date) "
+                    "VALUES ('TEST-D1', 'DEED', '2010-01-01'), "
+                    "('TEST-D2', 'DEED', '2020-01-01'), "
+                    "('TEST-M1', 'MTGE', '2021-01-01')"
+                )
+                db.execute(
+                    "INSERT INTO building_acris_legals (document_id, borough, block, lot, bbl) "
+                    "SELECT d, 5, 99999, 9999, %s "
+                    "FROM unnest(ARRAY['TEST-D1', 'TEST-D2', 'TEST-M1']) d",
+                    (bbl,),
+                )
+                db.execute(
+                    "INSERT INTO building_acris_parties (document_id, party_type, name) "
+                    "VALUES ('TEST-D1', '2', 'FORMER TEST LLC'), "
+                    "('TEST-D2', '1', 'FORMER TEST LLC'), "
+                    "('TEST-D2', '2', 'OWNER TEST LLC'), "
+                    "('TEST-M1', '1', 'OWNER TEST LLC'), "
+                    "('TEST-M1', '2', 'LENDER TEST BANK')"
+                )
+                refresh_acris_documents(db, [bbl])
+                refresh_owner_index(db, [bbl])
+                rows = db.query_all(
+                    "SELECT owner_name, source FROM building_owner_index "
+                    "WHERE bbl = %s ORDER BY source",
+                    (bbl,),
+                )
+                # 테스트 행은 남기지 않음
+                raise Rollback
+        except Rollback:
+            pass
+        except DatabaseError as e:
+            self.skipTest(f"Database query failed: {e}")
+
+        self.assertEqual(
+            [(r["owner_name"], r["source"]) for r in rows],
+            [("OWNER TEST LLC", "acris"), ("OWNER TEST LLC", "registration")],
+        )
+
+
 class NeighborhoodRepositoryTests(TestCase):
     def setUp(self):
         from infrastructures.postgres.neighborhood_repository import (
@@ -1016,3 +1631,906 @@ class NeighborhoodRepositoryAdvancedTests(TestCase):
 
         except Exception as e:
             self.skipTest(f"Neighborhood repository error handling test failed: {e}")
+
+
+class PostgresConnectionPoolTests(TestCase):
+    def _fake_conn(self):
+        conn = Mock()
+        conn.closed = 0
+        conn.autocommit = False
+        conn.get_transaction_status.return_value = 0  # TRANSACTION_STATUS_IDLE
+        return conn
+
+    def test_pool_reuses_returned_connection(self):
+        """A returned connection is handed out again instead of reconnecting"""
+        from infrastructures.postgres.connection_pool import PostgresConnectionPool
+
+        with patch(
+            "infrastructures.postgres.connection_pool.psycopg2.connect"
+        ) as mock_connect:
+            mock_connect.side_effect = lambda **kw: self._fake_conn()
+            pool = PostgresConnectionPool({"dbname": "x"}, max_size=2)
+            first = pool.getconn()
+            pool.putconn(first)
+            second = pool.getconn()
+            self.assertIs(first, second)
+            self.assertEqual(mock_connect.call_count, 1)
+
+    def test_pool_checkout_timeout(self):
+        """getconn raises DatabaseError when the pool is exhausted"""
+        from common.exceptions.db_error import DatabaseError
+        from infrastructures.postgres.connection_pool import PostgresConnectionPool
+
+        with patch(
+            "infrastructures.postgres.connection_pool.psycopg2.connect"
+        ) as mock_connect:
+            mock_connect.side_effect = lambda **kw: self._fake_conn()
+            pool = PostgresConnectionPool({"dbname": "x"}, max_size=1, timeout=0.01)
+            pool.getconn()
+            with self.assertRaises(DatabaseError):
+                pool.getconn()
+
+    def test_pool_discards_dead_connection_on_borrow(self):
+        """A connection failing the liveness check is replaced"""
+        from infrastructures.postgres.connection_pool import PostgresConnectionPool
+
+        with patch(
+            "infrastructures.postgres.connection_pool.psycopg2.connect"
+        ) as mock_connect:
+            mock_connect.side_effect = lambda **kw: self._fake_conn()
+            pool = PostgresConnectionPool({"dbname": "x"}, check_after=0)
+            dead = pool.getconn()
+            pool.putconn(dead)
+            dead.cursor.side_effect = Exception("server closed the connection")
+            fresh = pool.getconn()
+            self.assertIsNot(dead, fresh)
+            dead.close.assert_called()
+            self.assertEqual(pool.size, 1)
+
+    def test_pool_evicts_idle_connections_above_min_size(self):
+        """Idle connections older than max_idle are closed down to min_size"""
+        from infrastructures.postgres.connection_pool import PostgresConnectionPool
+
+        with patch(
+            "infrastructures.postgres.connection_pool.psycopg2.connect"
+        ) as mock_connect:
+            mock_connect.side_effect = lambda **kw: self._fake_conn()
+            pool = PostgresConnectionPool(
+                {"dbname": "x"}, min_size=1, max_idle=0, check_after=60
+            )
+            a, b = pool.getconn(), pool.getconn()
+            pool.putconn(a)
+            pool.putconn(b)
+            pool.getconn()
+            self.assertEqual(pool.size, 1)
+
+    def test_pool_rolls_back_open_transaction_on_return(self):
+        """Connections returned mid-transaction are rolled back before reuse"""
+        from infrastructures.postgres.connection_pool import PostgresConnectionPool
+
+        with patch(
+            "infrastructures.postgres.connection_pool.psycopg2.connect"
+        ) as mock_connect:
+            mock_connect.side_effect = lambda **kw: self._fake_conn()
+            pool = PostgresConnectionPool({"dbname": "x"})
+            conn = pool.getconn()
+            conn.get_transaction_status.return_value = 2  # INTRANS
+            pool.putconn(conn)
+            conn.rollback.assert_called_once()
+            self.assertEqual(pool.idle_count, 1)
+
+    def test_postgres_client_returns_connection_to_pool(self):
+        """PostgresClient exit returns its connection to the shared pool"""
+        try:
+            with PostgresClient() as db:
+                pool = db._pool
+                conn = db.conn
+            self.assertIsNone(db.conn)
+            self.assertIsNotNone(pool)
+            with PostgresClient() as db:
+                self.assertIs(db.conn, conn)
+        except Exception as e:
+            self.skipTest(f"Database connection failed: {e}")
+
+    def test_postgres_client_unpooled_mode(self):
+        """pooled=False opens and closes a dedicated connection"""
+        try:
+            client = PostgresClient(pooled=False)
+            with client as db:
+                conn = db.conn
+                self.assertIsNone(db._pool)
+            self.assertTrue(conn.closed)
+        except Exception as e:
+            self.skipTest(f"Database connection failed: {e}")
+
+    def test_readonly_client_uses_autocommit_read_only_session(self):
+        """readonly=True runs in autocommit and rejects writes"""
+        from common.exceptions.db_error import DatabaseError
+
+        try:
+            with PostgresClient(readonly=True) as db:
+                self.assertTrue(db.conn.autocommit)
+                self.assertEqual(db.scalar("SHOW default_transaction_read_only"), "on")
+                rows = list(db.query_iter("SELECT generate_series(1, 3) AS n"))
+                self.assertTrue(db.conn.autocommit)
+                with self.assertRaises(DatabaseError):
+                    db.execute("CREATE TABLE readonly_probe (a int)")
+        except DatabaseError as e:
+            self.skipTest(f"Database query failed: {e}")
+        self.assertEqual([r["n"] for r in rows], [1, 2, 3])
+
+    def test_pooled_connection_session_is_reset_between_modes(self):
+        """A pooled connection used read-only is returned to read-write for writers"""
+        from common.exceptions.db_error import DatabaseError
+        from infrastructures.postgres.connection_pool import close_all_pools
+
+        close_all_pools()
+        try:
+            with PostgresClient(readonly=True) as db:
+                readonly_conn = db.conn
+            with PostgresClient() as db:
+                self.assertIs(db.conn, readonly_conn)
+                self.assertFalse(db.conn.autocommit)
+                self.assertEqual(db.scalar("SHOW default_transaction_read_only"), "off")
+        except DatabaseError as e:
+            self.skipTest(f"Database query failed: {e}")
+        finally:
+            close_all_pools()
+
+    def test_configure_session_skips_noop_changes(self):
+        """set_session is only called when the borrowed connection is in another mode"""
+        client = PostgresClient(readonly=True)
+        client.conn = Mock(autocommit=True, readonly=True)
+        client._configure_session()
+        client.conn.set_session.assert_not_called()
+
+        client = PostgresClient()
+        client.conn = Mock(autocommit=False, readonly=None)
+        client._configure_session()
+        client.conn.set_session.assert_not_called()
+        client.conn = Mock(autocommit=True, readonly=True)
+        client._configure_session()
+        client.conn.set_session.assert_called_once_with(
+            readonly="default", autocommit=False
+        )
+        client.conn = None
+
+
+class PostgresClientCopyTests(TestCase):
+    def test_copy_text_encoding(self):
+        """Test values are escaped for COPY text format"""
+        from datetime import datetime
+        from decimal import Decimal
+
+        from infrastructures.postgres.postgres_client import _copy_text
+
+        self.assertEqual(_copy_text(None), "\\N")
+        self.assertEqual(_copy_text(True), "t")
+        self.assertEqual(_copy_text(False), "f")
+        self.assertEqual(_copy_text(3), "3")
+        self.assertEqual(_copy_text(datetime(2020, 1, 2)), "2020-01-02T00:00:00")
+        self.assertEqual(_copy_text("a\tb\nc\\d"), "a\\tb\\nc\\\\d")
+        self.assertEqual(_copy_text("plain"), "plain")
+        self.assertEqual(_copy_text(1.5), "1.5")
+        self.assertEqual(_copy_text(Decimal("2.50")), "2.50")
+        self.assertEqual(
+            _copy_text({"a": 1, "b": [True, None]}), '{"a": 1, "b": [true, null]}'
+        )
+        self.assertEqual(_copy_text(["x\ty"]), '["x\\\\ty"]')
+        with self.assertRaises(TypeError):
+            _copy_text({"amount": Decimal("1")})
+
+    def test_copy_path_loads_jsonb(self):
+        """Test dict values are written as JSON, not Python repr"""
+        try:
+            with PostgresClient() as db:
+                db.execute(
+                    "CREATE TEMP TABLE copy_json_test (id int PRIMARY KEY, doc jsonb)"
+                )
+                db.bulk_insert(
+                    "copy_json_test",
+                    ["id", "doc"],
+                    [{"id": 1, "doc": {"name": "a'b", "tags": ["x"]}}],
+                    ["id"],
+                    use_copy=True,
+                )
+                self.assertEqual(
+                    db.scalar("SELECT doc FROM copy_json_test WHERE id = 1"),
+                    {"name": "a'b", "tags": ["x"]},
+                )
+        except Exception as e:
+            if isinstance(e, (AssertionError, TypeError)):
+                raise
+            self.skipTest(f"Database connection failed: {e}")
+
+    def test_bulk_insert_copy_path(self):
+        """Test use_copy honours conflict_target and do_update"""
+        from common.exceptions.db_error import DatabaseError
+
+        try:
+            with PostgresClient() as db:
+                db.execute(
+                    "CREATE TEMP TABLE copy_test (id int PRIMARY KEY, name text)"
+                )
+                rows = [{"id": 1, "name": "a\tb"}, {"id": 2, "name": None}]
+                count = db.bulk_insert(
+                    "copy_test", ["id", "name"], rows, ["id"], use_copy=True
+                )
+                self.assertEqual(count, 2)
+
+                db.bulk_insert(
+                    "copy_test",
+                    ["id", "name"],
+                    [{"id": 1, "name": "ignored"}],
+                    ["id"],
+                    use_copy=True,
+                )
+                self.assertEqual(
+                    db.scalar("SELECT name FROM copy_test WHERE id = 1"), "a\tb"
+                )
+
+                db.bulk_insert(
+                    "copy_test",
+                    ["id", "name"],
+                    [{"id": 2, "name": "first"}, {"id": 2, "name": "last"}],
+                    ["id"],
+                    do_update=True,
+                    use_copy=True,
+                )
+                self.assertEqual(
+                    db.scalar("SELECT name FROM copy_test WHERE id = 2"), "last"
+                )
+                self.assertEqual(db.scalar("SELECT count(*) FROM copy_test"), 2)
+
+                # VALUES 경로는 같은 배치의 중복 키를 DO UPDATE 할 수 없어 실패 (COPY 는 마지막 행)
+                with self.assertRaisesRegex(DatabaseError, "a second time"):
+                    db.bulk_insert(
+                        "copy_test",
+                        ["id", "name"],
+                        [{"id": 2, "name": "first"}, {"id": 2, "name": "last"}],
+                        ["id"],
+                        do_update=True,
+                    )
+        except Exception as e:
+            if isinstance(e, AssertionError):
+                raise
+            self.skipTest(f"Database connection failed: {e}")
+
+    def test_copy_rows_streams_in_batches(self):
+        """copy_rows loads an iterator of tuples over several COPY batches"""
+        try:
+            with PostgresClient() as db:
+                db.execute("CREATE TEMP TABLE copy_rows_test (id int, name text)")
+                rows = ((i, f"n\t{i}" if i % 2 else None) for i in range(25))
+                count = db.copy_rows(
+                    "copy_rows_test", ["id", "name"], rows, batch_size=10
+                )
+                self.assertEqual(count, 25)
+                self.assertEqual(db.scalar("SELECT count(*) FROM copy_rows_test"), 25)
+                self.assertEqual(
+                    db.scalar("SELECT name FROM copy_rows_test WHERE id = 3"), "n\t3"
+                )
+                self.assertIsNone(
+                    db.scalar("SELECT name FROM copy_rows_test WHERE id = 4")
+                )
+        except Exception as e:
+            if isinstance(e, AssertionError):
+                raise
+            self.skipTest(f"Database connection failed: {e}")
+
+
+class PostgresClientQueryIterTests(TestCase):
+    def test_query_iter_streams_rows(self):
+        """Test query_iter yields dict rows across several fetch batches"""
+        try:
+            with PostgresClient() as db:
+                rows = list(
+                    db.query_iter(
+                        "SELECT generate_series(1, %s) AS num", (25,), batch_size=10
+                    )
+                )
+        except Exception as e:
+            self.skipTest(f"Database query failed: {e}")
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(rows[0], {"num": 1})
+        self.assertEqual(rows[-1], {"num": 25})
+
+    def test_query_iter_without_connection(self):
+        """Test query_iter outside a with-block raises DatabaseError"""
+        from common.exceptions.db_error import DatabaseError
+
+        with self.assertRaises(DatabaseError):
+            next(PostgresClient().query_iter("SELECT 1"))
+
+    def test_query_iter_abandoned_is_closed_before_release(self):
+        """Test an unfinished iterator is cleaned up at __exit__, never after release"""
+        from psycopg2 import extensions
+
+        sql = "SELECT generate_series(1, 100) AS num"
+        try:
+            with PostgresClient(readonly=True) as db:
+                abandoned = db.query_iter(sql, batch_size=10)
+                next(abandoned)
+                conn = db.conn
+                # 추적되지 않은 채 연결이 넘어간 경우: 뒤늦은 정리가 새 소유자를 건드리면 안 됨
+                stray = db.query_iter(sql, batch_size=10)
+                next(stray)
+                db._open_iters.discard(stray)
+                db.conn = other = Mock()
+                stray.close()
+                db.conn = conn
+        except Exception as e:
+            if isinstance(e, AssertionError):
+                raise
+            self.skipTest(f"Database query failed: {e}")
+        other.rollback.assert_not_called()
+        self.assertEqual(other.mock_calls, [])
+        # __exit__ 이 열린 iterator 를 닫아 readonly 세션(autocommit)으로 되돌린 뒤 반납
+        self.assertTrue(conn.autocommit)
+        self.assertEqual(
+            conn.info.transaction_status, extensions.TRANSACTION_STATUS_IDLE
+        )
+
+    def test_iter_heatmap_data_is_lazy(self):
+        """Test iter_heatmap_data does not touch the DB until iterated"""
+        repo = NeighborhoodRepository()
+        repo.client_factory = Mock()
+        points = repo.iter_heatmap_data(40.7, 40.8, -74.0, -73.9)
+        repo.client_factory.assert_not_called()
+        self.assertTrue(hasattr(points, "__next__"))
+
+
+class PostgresClientRowFactoryTests(TestCase):
+    def test_row_converter_modes(self):
+        """Test dict/tuple/namedtuple converters built from a cursor description"""
+        from infrastructures.postgres.postgres_client import (
+            ROW_NAMEDTUPLE,
+            ROW_TUPLE,
+            _row_converter,
+        )
+
+        description = [("a",), ("b",)]
+        self.assertEqual(_row_converter(description, None)((1, 2)), {"a": 1, "b": 2})
+        self.assertIsNone(_row_converter(description, ROW_TUPLE))
+        row = _row_converter(description, ROW_NAMEDTUPLE)((1, 2))
+        self.assertEqual((row.a, row.b), (1, 2))
+
+    def test_row_converter_unknown_mode(self):
+        """Test an unknown row mode raises DatabaseError"""
+        from common.exceptions.db_error import DatabaseError
+        from infrastructures.postgres.postgres_client import _row_converter
+
+        with self.assertRaises(DatabaseError):
+            _row_converter([("a",)], "bogus")
+
+    def test_dataclass_row_builds_heatmap_point(self):
+        """Test dataclass_row maps columns positionally and fills constants"""
+        from common.models.neighborhood import HeatmapPoint
+        from infrastructures.postgres.postgres_client import dataclass_row
+
+        columns = (
+            "bbl",
+            "latitude",
+            "longitude",
+            "address",
+            "borough",
+            "count",
+            "intensity",
+        )
+        make = dataclass_row(HeatmapPoint, data_type="violations")(columns)
+        point = make(("1013510030", 40.7, -73.9, "1 Main St", "MANHATTAN", 3, 0.4))
+        self.assertEqual(point.data_type, "violations")
+        self.assertEqual(point.count, 3)
+        self.assertEqual(point.intensity, 0.4)
+        self.assertEqual(point.address, "1 Main St")
+
+    def test_dataclass_row_rename_and_missing_required(self):
+        """Test rename mapping and the error for unselected required fields"""
+        from common.exceptions.db_error import DatabaseError
+        from common.models.registration import Registration
+        from common.models.violation import Violation
+        from infrastructures.postgres.postgres_client import dataclass_row
+
+        make = dataclass_row(Registration)(("bbl", "zip"))
+        reg = make(("1013510030", "10001"))
+        self.assertEqual(reg.zip, "10001")
+        self.assertIsNone(reg.boro)
+
+        with self.assertRaises(DatabaseError):
+            dataclass_row(Violation, rename={"class": "class_"})(("bbl", "class"))
+
+    def test_query_all_row_modes(self):
+        """Test query_all honours row_factory against the database"""
+        try:
+            with PostgresClient() as db:
+                tuples = db.query_all("SELECT 1 AS a, 2 AS b", row_factory="tuple")
+                named = db.query_one("SELECT 1 AS a, 2 AS b", row_factory="namedtuple")
+                dicts = db.query_all("SELECT 1 AS a, 2 AS b")
+        except Exception as e:
+            self.skipTest(f"Database query failed: {e}")
+        self.assertEqual(tuples, [(1, 2)])
+        self.assertEqual(named.b, 2)
+        self.assertEqual(dicts, [{"a": 1, "b": 2}])
+
+
+class QueryStatsTests(TestCase):
+    def test_fingerprint_normalizes_literals_and_in_lists(self):
+        """Test statements differing only in literals share a fingerprint"""
+        from infrastructures.postgres.query_stats import fingerprint
+
+        a = fingerprint("SELECT * FROM t WHERE bbl = %s AND x IN (%s, %s)")
+        b = fingerprint("select *\n  from t where bbl = '123' and x in (1, 2, 3)")
+        self.assertEqual(a, b)
+        self.assertEqual(a, "select * from t where bbl = ? and x in (?+)")
+
+    def test_query_stats_aggregates_per_fingerprint(self):
+        """Test record/snapshot aggregate calls, rows, callers and slow calls"""
+        from infrastructures.postgres.query_stats import QueryStats
+
+        stats = QueryStats()
+        stats.record("SELECT 1 FROM t WHERE a = %s", 10.0, 1, "Repo.a")
+        stats.record("SELECT 1 FROM t WHERE a = 5", 30.0, 2, "Repo.b", slow=True)
+        stats.record("SELECT 2", 1.0, 0, "Repo.a", error=True)
+        snapshot = stats.snapshot()
+        self.assertEqual(len(snapshot), 2)
+        top = snapshot[0]
+        self.assertEqual(top["calls"], 2)
+        self.assertEqual(top["rows"], 3)
+        self.assertEqual(top["slow_calls"], 1)
+        self.assertEqual(top["max_ms"], 30.0)
+        self.assertEqual(top["mean_ms"], 20.0)
+        self.assertEqual(top["callers"], {"Repo.a": 1, "Repo.b": 1})
+        self.assertEqual(snapshot[1]["errors"], 1)
+        stats.reset()
+        self.assertEqual(stats.snapshot(), [])
+
+    def test_calling_method_reports_owner_class(self):
+        """Test calling_method resolves 'Class.method' of the caller"""
+        from infrastructures.postgres.query_stats import calling_method
+
+        self.assertEqual(
+            calling_method(1),
+            "QueryStatsTests.test_calling_method_reports_owner_class",
+        )
+
+    def test_calling_method_skips_plan_check_run_as_main(self):
+        """Test frames of `python -m ...plan_check` (module __main__) are skipped"""
+        import os
+
+        from infrastructures.postgres.query_stats import calling_method
+
+        source = "class _CapturingClient:\n    def run(self):\n        return calling_method(1)\n"
+        path = os.path.join("/srv", "infrastructures", "postgres", "plan_check.py")
+        namespace = {"__name__": "__main__", "calling_method": calling_method}
+        exec(compile(source, path, "exec"), namespace)
+
+        self.assertEqual(
+            namespace["_CapturingClient"]().run(),
+            "QueryStatsTests.test_calling_method_skips_plan_check_run_as_main",
+        )
+
+    def test_client_records_query_stats(self):
+        """Test PostgresClient queries are recorded with their caller"""
+        from infrastructures.postgres.query_stats import fingerprint, query_stats
+
+        sql = "SELECT generate_series(1, %s) AS query_stats_probe"
+        try:
+            with PostgresClient() as db:
+                db.query_all(sql, (3,))
+        except Exception as e:
+            self.skipTest(f"Database query failed: {e}")
+        entry = next(
+            e for e in query_stats.snapshot() if e["fingerprint"] == fingerprint(sql)
+        )
+        self.assertGreaterEqual(entry["calls"], 1)
+        self.assertGreaterEqual(entry["rows"], 3)
+        self.assertIn(
+            "QueryStatsTests.test_client_records_query_stats", entry["callers"]
+        )
+
+
+class PreparedStatementTests(TestCase):
+    def test_to_positional_rewrites_placeholders(self):
+        """Test %s / %(name)s placeholders become $n and %% becomes %"""
+        from common.exceptions.db_error import DatabaseError
+        from infrastructures.postgres.prepared_statements import to_positional
+
+        self.assertEqual(
+            to_positional("SELECT * FROM t WHERE a = %s AND b LIKE 'x%%' AND c = %s"),
+            ("SELECT * FROM t WHERE a = $1 AND b LIKE 'x%' AND c = $2", 2),
+        )
+        self.assertEqual(
+            to_positional("SELECT %(bbl)s, %(n)s WHERE bbl = %(bbl)s"),
+            ("SELECT $1, $2 WHERE bbl = $1", ("bbl", "n")),
+        )
+        with self.assertRaises(DatabaseError):
+            to_positional("SELECT %s, %(bbl)s")
+
+    def test_is_preparable(self):
+        """Test only DML/query statements are routed through PREPARE"""
+        from infrastructures.postgres.prepared_statements import is_preparable
+
+        self.assertTrue(is_preparable("\n  SELECT 1"))
+        self.assertTrue(
+            is_preparable("-- profile\nWITH x AS (SELECT 1) SELECT * FROM x")
+        )
+        self.assertTrue(is_preparable("(SELECT 1) UNION (SELECT 2)"))
+        self.assertFalse(is_preparable("DEALLOCATE ALL"))
+        self.assertFalse(is_preparable("SET LOCAL statement_timeout = 100"))
+
+    def test_cache_prepares_once_and_evicts_lru(self):
+        """Test statements are prepared once, evicted LRU and reset on a new backend"""
+        from infrastructures.postgres.prepared_statements import (
+            PreparedStatementCache,
+            statement_name,
+        )
+
+        cur = Mock()
+        cur.connection.get_backend_pid.return_value = 100
+        cache = PreparedStatementCache(max_size=2)
+
+        sql_a = "SELECT 1 WHERE a = %s"
+        statement, args = cache.statement(cur, sql_a, ("x",))
+        self.assertEqual(statement, f"EXECUTE {statement_name(sql_a)} (%s)")
+        self.assertEqual(args, ("x",))
+        cache.statement(cur, sql_a, ("y",))
+        self.assertEqual(cur.execute.call_count, 1)
+
+        cache.statement(cur, "SELECT 2", None)
+        cache.statement(cur, sql_a, ("z",))
+        cache.statement(cur, "SELECT 3", None)
+        self.assertIn(sql_a, cache)
+        self.assertNotIn("SELECT 2", cache)
+        cur.execute.assert_any_call(f"DEALLOCATE {statement_name('SELECT 2')}")
+
+        cur.connection.get_backend_pid.return_value = 200
+        cur.execute.reset_mock()
+        cache.statement(cur, sql_a, ("x",))
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cur.execute.call_count, 1)
+
+    def test_query_with_prepare_matches_plain_query(self):
+        """Test prepared queries return the same rows and reuse the statement"""
+        from common.exceptions.db_error import DatabaseError
+        from infrastructures.postgres.prepared_statements import statement_cache_for
+
+        sql = "SELECT g AS n FROM generate_series(1, %s) g WHERE g = ANY(%s)"
+        try:
+            with PostgresClient(prepare=True) as db:
+                plain = db.query_all(sql, (5, [2, 4]), prepare=False)
+                first = db.query_all(sql, (5, [2, 4]))
+                second = db.query_one(sql, (5, [3]))
+                cache = statement_cache_for(db.conn)
+                self.assertIn(sql, cache)
+                # 서버에서 사라진 statement 는 한 번 실패한 뒤 다시 PREPARE 되어야 함
+                db.execute("DEALLOCATE ALL")
+                with self.assertRaises(DatabaseError):
+                    db.query_one(sql, (5, [3]))
+                db.conn.rollback()
+                again = db.query_one(sql, (5, [3]))
+        except DatabaseError as e:
+            self.skipTest(f"Database query failed: {e}")
+        self.assertEqual(first, plain)
+        self.assertEqual(first, [{"n": 2}, {"n": 4}])
+        self.assertEqual(second, {"n": 3})
+        self.assertEqual(again, {"n": 3})
+
+
+class ProfileCacheTests(TestCase):
+    def _cache(self, **options):
+        from infrastructures.postgres.profile_cache import ProfileCache
+
+        self.now = 0.0
+        self.version = 1
+        return ProfileCache(
+            version_loader=lambda: self.version, clock=lambda: self.now, **options
+        )
+
+    def test_lru_eviction_and_ttl(self):
+        """Test entries are served until their TTL and evicted least recently used"""
+        cache = self._cache(max_size=2, ttl=10.0)
+        load = Mock(side_effect=lambda: object())
+
+        first = cache.get_or_load("a", load)
+        self.assertIs(cache.get_or_load("a", load), first)
+        cache.get_or_load("b", load)
+        cache.get_or_load("a", load)
+        cache.get_or_load("c", load)  # b 가 가장 오래 안 쓰였으므로 축출
+        self.assertEqual(load.call_count, 3)
+        self.assertIs(cache.get_or_load("a", load), first)
+        cache.get_or_load("b", load)
+        self.assertEqual(load.call_count, 4)
+
+        self.now = 11.0
+        self.assertIsNot(cache.get_or_load("a", load), first)
+        stats = cache.stats()
+        self.assertEqual(
+            (stats["hits"], stats["misses"], stats["evictions"], stats["expirations"]),
+            (3, 5, 2, 1),
+        )
+        self.assertEqual(stats["size"], 2)
+
+    def test_negative_entries_use_negative_ttl(self):
+        """Test not-found results are cached for negative_ttl only"""
+        cache = self._cache(ttl=60.0, negative_ttl=5.0)
+        load = Mock(return_value=None)
+
+        self.assertIsNone(cache.get_or_load("missing", load))
+        self.assertIsNone(cache.get_or_load("missing", load))
+        self.assertEqual(load.call_count, 1)
+        self.now = 6.0
+        cache.get_or_load("missing", load)
+        self.assertEqual(load.call_count, 2)
+        self.assertEqual(cache.stats()["negative_hits"], 1)
+
+        disabled = self._cache(max_size=0)
+        disabled.get_or_load("missing", load)
+        disabled.get_or_load("missing", load)
+        self.assertEqual(load.call_count, 4)
+
+    def test_data_version_change_invalidates(self):
+        """Test a bumped data version drops entries after the check interval"""
+        cache = self._cache(version_check_interval=1.0)
+        load = Mock(side_effect=lambda: object())
+
+        first = cache.get_or_load("a", load)
+        self.version = 2
+        self.assertIs(cache.get_or_load("a", load), first)
+        self.now = 1.5
+        self.assertIsNot(cache.get_or_load("a", load), first)
+        self.assertEqual(cache.stats()["invalidations"], 1)
+        self.assertEqual(cache.stats()["data_version"], 2)
+
+        # 로드하는 동안 버전이 바뀌면 (다른 스레드가 확인) 그 결과는 캐시하지 않음
+        def load_across_bump():
+            self.version = 3
+            self.now = 3.0
+            cache.get_or_load("b", load)
+            return "stale"
+
+        self.assertEqual(cache.get_or_load("c", load_across_bump), "stale")
+        self.assertNotEqual(cache.get_or_load("c", load), "stale")
+
+
+class ReplicaRouterTests(TestCase):
+    def _router(self, count=3, **options):
+        from infrastructures.postgres.replica_router import ReplicaRouter
+
+        return ReplicaRouter(
+            [{"host": f"replica{i}", "port": 5432} for i in range(count)], **options
+        )
+
+    def test_round_robin_rotates_and_skips_down_replicas(self):
+        """Test round robin order and retry_after for failed replicas"""
+        router = self._router(retry_after=60.0)
+        self.assertEqual(router.candidates(), [0, 1, 2])
+        self.assertEqual(router.candidates(), [1, 2, 0])
+        router.mark_down(2)
+        self.assertEqual(router.candidates(), [0, 1])
+
+        router = self._router(retry_after=0.0)
+        router.mark_down(0)
+        self.assertEqual(router.candidates(), [0, 1, 2])
+
+    def test_least_connections_prefers_idle_replica(self):
+        """Test least_connections orders replicas by checked-out clients"""
+        router = self._router(strategy="least_connections")
+        router.acquire(0)
+        router.acquire(0)
+        router.acquire(1)
+        self.assertEqual(router.candidates()[0], 2)
+        router.release(0)
+        router.release(0)
+        self.assertEqual(router.in_use(0), 0)
+        with self.assertRaises(ValueError):
+            self._router(strategy="random")
+
+    def test_lag_guard_caches_measurement(self):
+        """Test max_lag rejects lagging replicas and reuses recent measurements"""
+        router = self._router(max_lag=5.0, lag_check_interval=60.0)
+        with patch(
+            "infrastructures.postgres.replica_router.measure_lag", return_value=12.0
+        ) as mock_lag:
+            self.assertFalse(router.lag_ok(0, Mock()))
+            self.assertFalse(router.lag_ok(0, Mock()))
+            self.assertEqual(mock_lag.call_count, 1)
+            mock_lag.return_value = 0.0
+            self.assertTrue(router.lag_ok(1, Mock()))
+
+        self.assertTrue(self._router().lag_ok(0, None))
+
+    def test_client_falls_back_to_primary(self):
+        """Test replica=True uses the primary when no replica is reachable"""
+        from common.exceptions.db_error import DatabaseError
+
+        client = PostgresClient(replica=True, pooled=False)
+        client._replica_params = [{**client._params, "port": 1, "connect_timeout": 1}]
+        try:
+            with client as db:
+                self.assertTrue(db.conn.autocommit)
+                self.assertIsNone(db._replica_slot)
+                self.assertFalse(db.scalar("SELECT pg_is_in_recovery()"))
+        except DatabaseError as e:
+            self.skipTest(f"Database query failed: {e}")
+
+
+class StatementTimeoutTests(TestCase):
+    def test_timeout_prefix(self):
+        """SET LOCAL is sent per call in autocommit, and on change inside a transaction"""
+        from psycopg2 import extensions
+
+        client = PostgresClient(statement_timeout_ms=500)
+        client.conn = Mock(autocommit=True)
+        self.assertEqual(
+            client._timeout_prefix(), "SET LOCAL statement_timeout = 500; "
+        )
+        self.assertEqual(client._timeout_prefix(0), "")
+
+        client.conn = Mock(autocommit=False)
+        client.conn.get_transaction_status.return_value = (
+            extensions.TRANSACTION_STATUS_IDLE
+        )
+        self.assertEqual(
+            client._timeout_prefix(), "SET LOCAL statement_timeout = 500; "
+        )
+        client.conn.get_transaction_status.return_value = (
+            extensions.TRANSACTION_STATUS_INTRANS
+        )
+        self.assertEqual(client._timeout_prefix(), "")
+        self.assertEqual(
+            client._timeout_prefix(2000), "SET LOCAL statement_timeout = 2000; "
+        )
+        self.assertEqual(
+            client._timeout_prefix(0), "SET LOCAL statement_timeout = DEFAULT; "
+        )
+        client.conn = None
+
+    def test_statement_timeout_raises_database_timeout_error(self):
+        """Statements over budget are cancelled; per-call timeout_ms overrides"""
+        from common.exceptions.db_error import DatabaseError, DatabaseTimeoutError
+
+        for readonly in (True, False):
+            try:
+                with PostgresClient(readonly=readonly, statement_timeout_ms=50) as db:
+                    with self.assertRaises(DatabaseTimeoutError) as ctx:
+                        db.query_one("SELECT pg_sleep(1)")
+                    self.assertEqual(ctx.exception.status, 504)
+                    if not readonly:
+                        db.conn.rollback()
+                    db.query_one("SELECT pg_sleep(0.1)", timeout_ms=5000)
+                    with self.assertRaises(DatabaseTimeoutError):
+                        list(db.query_iter("SELECT pg_sleep(1)"))
+                    if not readonly:
+                        db.conn.rollback()
+                    self.assertEqual(db.scalar("SHOW statement_timeout"), "50ms")
+            except DatabaseTimeoutError:
+                raise
+            except DatabaseError as e:
+                self.skipTest(f"Database query failed: {e}")
+
+    def test_slow_query_explain_uses_statement_timeout(self):
+        """EXPLAIN ANALYZE of a slow query is cancelled at the same statement_timeout"""
+        import time
+
+        from common.exceptions.db_error import DatabaseError
+
+        for readonly in (True, False):
+            try:
+                with PostgresClient(readonly=readonly, statement_timeout_ms=50) as db:
+                    db.query_one("SELECT 1")
+                    started = time.perf_counter()
+                    self.assertIsNone(db._explain("SELECT pg_sleep(1)"))
+                    self.assertLess(time.perf_counter() - started, 0.5)
+                    # 취소된 EXPLAIN 뒤에도 세션/트랜잭션은 계속 사용 가능
+                    self.assertIsNotNone(db._explain("SELECT 1"))
+                    self.assertEqual(db.scalar("SELECT 2"), 2)
+            except DatabaseError as e:
+                self.skipTest(f"Database query failed: {e}")
+
+
+class PlanCheckTests(TestCase):
+    PLAN = [
+        {
+            "Plan": {
+                "Node Type": "Nested Loop",
+                "Total Cost": 120.5,
+                "Plans": [
+                    {
+                        "Node Type": "Seq Scan",
+                        "Relation Name": "building_violations",
+                        "Total Cost": 100.0,
+                    },
+                    {
+                        "Node Type": "Index Scan",
+                        "Relation Name": "building_registrations",
+                        "Index Name": "building_registrations_pkey",
+                        "Total Cost": 8.3,
+                    },
+                ],
+            }
+        }
+    ]
+
+    def _result(self, cost=120.5, seq_scans=("building_violations",)):
+        from infrastructures.postgres.plan_check import PlanResult
+
+        return PlanResult(
+            key="Repo.method:abc",
+            caller="Repo.method",
+            fingerprint="select ?",
+            shape=["Seq Scan on building_violations"],
+            total_cost=cost,
+            seq_scans=list(seq_scans),
+        )
+
+    def test_summarize_plan(self):
+        from infrastructures.postgres.plan_check import summarize_plan
+
+        shape, cost, seq_scans = summarize_plan(json.dumps(self.PLAN))
+        self.assertEqual(
+            shape,
+            [
+                "Nested Loop",
+                "  Seq Scan on building_violations",
+                "  Index Scan on building_registrations using building_registrations_pkey",
+            ],
+        )
+        self.assertEqual(cost, 120.5)
+        self.assertEqual(seq_scans, ["building_violations"])
+
+    def test_compare_flags_new_seq_scan_on_big_table(self):
+        from infrastructures.postgres.plan_check import compare
+
+        big = {"building_violations": 1_000_000}
+        baseline = {"shape": [], "total_cost": 100.0, "seq_scans": []}
+        result = compare(self._result(), baseline, big)
+        self.assertEqual(len(result.failures), 1)
+        self.assertIn("Seq Scan on building_violations", result.failures[0])
+        self.assertIn("plan shape changed", result.warnings)
+
+        # baseline 이 이미 허용한 seq scan, 또는 작은 테이블은 통과
+        baseline["seq_scans"] = ["building_violations"]
+        self.assertEqual(compare(self._result(), baseline, big).failures, [])
+        self.assertEqual(compare(self._result(), None, {}).failures, [])
+        self.assertEqual(len(compare(self._result(), None, big).failures), 1)
+
+    def test_compare_flags_cost_regressions(self):
+        from infrastructures.postgres.plan_check import compare
+
+        baseline = {
+            "shape": [],
+            "total_cost": 50.0,
+            "seq_scans": ["building_violations"],
+        }
+        self.assertEqual(compare(self._result(cost=99), baseline, {}).failures, [])
+        failures = compare(self._result(cost=101), baseline, {}).failures
+        self.assertEqual(len(failures), 1)
+        self.assertIn("2.0x baseline", failures[0])
+        failures = compare(self._result(cost=90), baseline, {}, max_cost=80).failures
+        self.assertEqual(failures, ["cost 90 exceeds max 80"])
+
+    def test_collect_plans_covers_both_repositories(self):
+        """Every repository statement is captured and EXPLAINs cleanly"""
+        from common.exceptions.db_error import DatabaseError
+        from infrastructures.postgres.plan_check import collect_plans
+
+        try:
+            results, errors, _ = collect_plans(analyze=False)
+        except DatabaseError as e:
+            self.skipTest(f"Database query failed: {e}")
+
+        self.assertEqual(errors, [])
+        callers = {r.caller for r in results}
+        for expected in (
+            "BuildingRepository._fetch_registration",
+            "BuildingRepository._fetch_acris",
+            "BuildingRepository.get_profile_by_bbl",
+            "BuildingRepository._fetch_sections_for_bbls",
+            "NeighborhoodRepository.get_neighborhood_stats_by_bounds",
+            "NeighborhoodRepository.get_borough_summary",
+            "NeighborhoodRepository.get_neighborhood_trends",
+            "NeighborhoodRepository._get_violations_heatmap",
+            "NeighborhoodRepository._get_evictions_heatmap",
+            "NeighborhoodRepository._get_complaints_heatmap",
+        ):
+            self.assertIn(expected, callers)
@@ -0,0 +1,72 @@
+import hashlib
+from datetime import date, datetime, time
+from functools import wraps
+
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
+from common.exceptions.db_error import DatabaseError
+from infrastructures.postgres.profile_cache import get_profile_cache
+
+
+def _validators(request, daily: bool):
+    """(etag, last_modified) of a GET from the crawl data version and its query string."""
+    try:
+        version = get_profile_cache().data_version()
+    except DatabaseError:
+        # 버전을 못 읽으면 조건부 처리 없이 뷰를 그대로 실행
+        return None, None
+    parts = [str(version.version), request.path]
+    parts += [f"{k}={v}" for k, values in sorted(request.GET.lists()) for v in values]
+    last_modified = version.updated_at
+    if daily:
+        # datetime.now() 기준 기간(최근 N년 등)을 쓰는 응답은 날짜가 바뀌어도 달라짐
+        today = date.today()
+        parts.append(today.isoformat())
+        day_start = datetime.combine(today, time.min).astimezone()
+        if last_modified is None or last_modified < day_start:
+            last_modified = day_start
+    digest = hashlib.md5("\n".join(parts).encode("utf-8")).hexdigest()[:20]
+    # 들여쓰기 등 표현만 다른 응답도 같은 태그이므로 weak ETag
+    return f'W/"{digest}"', last_modified
+
+
+def conditional_get(daily: bool = False):
+    """
+    Decorator for APIView.get: ETag / Last-Modified from the crawl data
+    version (bumped by every crawler load, see profile_cache) plus the
+    request path and query parameters.
+
+    A matching If-None-Match / If-Modified-Since is answered 304 before the
+    view runs, so no repository query is made. Only 200 responses carry
+    the validators, so a client can never revalidate an error. The version is re-read at
+    most once per BUILDING_CACHE_VERSION_CHECK seconds per worker.
+    daily=True also changes the validators at midnight, for views whose
+    results depend on today's date. Responses carry Cache-Control: no-cache
+    so clients and the CDN revalidate instead of guessing freshness.
+    """
+
+    def etag(request, *args, **kwargs):
+        return _validators(request, daily)[0]
+
+    def last_modified(request, *args, **kwargs):
+        return _validators(request, daily)[1]
+
+    def decorator(view):
+        conditional = condition(etag_func=etag, last_modified_func=last_modified)(view)
+
+        @wraps(view)
+        def get(request, *args, **kwargs):
+            response = conditional(request, *args, **kwargs)
+            if response.status_code not in (200, 304):
+                # 404/400/5xx 에 검증자를 주면 클라이언트가 그 오류를 304 로 재사용
+                del response["ETag"]
+                del response["Last-Modified"]
+            if not response.has_header("Cache-Control"):
+                patch_cache_control(response, no_cache=True)
+            return response
+
+        return get
+
+    return method_decorator(decorator)
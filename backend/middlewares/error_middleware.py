@@ -12,6 +12,13 @@ from rest_framework.response import Response
 from rest_framework.views import exception_handler as drf_exception_handler
 
 from common.exceptions.bad_request_error import BadRequestError
+from common.exceptions.db_error import DatabaseTimeoutError
+
+
+def _timeout_message(exc: DatabaseTimeoutError) -> str:
+    if exc.status == 503:
+        return "Database is busy. Please retry shortly."
+    return "Database query timed out."
 
 
 def custom_exception_handler(exc, context):
@@ -39,6 +46,12 @@ def custom_exception_handler(exc, context):
         }
         return response
 
+    if isinstance(exc, DatabaseTimeoutError):
+        return Response(
+            {"result": False, "error_message": _timeout_message(exc)},
+            status=exc.status,
+        )
+
     return Response(
         {"result": False, "error_message": "Internal server error."}, status=500
     )
@@ -57,6 +70,11 @@ class ErrorMiddleware:
                 {"result": False, "error_message": e.message},
                 status=e.status,
             )
+        except DatabaseTimeoutError as e:
+            return JsonResponse(
+                {"result": False, "error_message": _timeout_message(e)},
+                status=e.status,
+            )
 
         # rest framework exceptions
         except ValidationError as e:
@@ -1,19 +1,30 @@
+import json
+
 from rest_framework.renderers import JSONRenderer
 
+from common.utils.json_util import dumps
+
 
 class OkJSONRenderer(JSONRenderer):
+    """
+    Wraps successful payloads in {"result": true, "data": ...}.
+
+    Payloads may contain dataclass models, dates and Decimals directly;
+    they are encoded in one pass by common.utils.json_util.dumps.
+    """
+
     charset = "utf-8"
 
     def render(self, data, accepted_media_type=None, renderer_context=None):
         response = renderer_context.get("response") if renderer_context else None
 
         if response is not None and getattr(response, "exception", False):
-            return super().render(data, accepted_media_type, renderer_context)
+            return self._dumps(data, accepted_media_type, renderer_context)
 
         payload = data
 
         if isinstance(payload, dict) and "result" in payload:
-            return super().render(payload, accepted_media_type, renderer_context)
+            return self._dumps(payload, accepted_media_type, renderer_context)
 
         if isinstance(payload, dict) and {"count", "results"}.issubset(payload.keys()):
             payload = {
@@ -29,4 +40,14 @@ class OkJSONRenderer(JSONRenderer):
             "result": True,
             "data": payload,
         }
-        return super().render(wrapped, accepted_media_type, renderer_context)
+        return self._dumps(wrapped, accepted_media_type, renderer_context)
+
+    def _dumps(self, data, accepted_media_type, renderer_context):
+        if data is None:
+            return b""
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            # 들여쓰기 요청(Accept: application/json; indent=4)은 드문 경로 - 기본 렌더러로 포맷
+            return super().render(
+                json.loads(dumps(data)), accepted_media_type, renderer_context
+            )
+        return dumps(data)
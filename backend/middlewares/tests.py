@@ -14,6 +14,7 @@ from middlewares.error_middleware import ErrorMiddleware, custom_exception_handl
 from middlewares.ok_middleware import OkJSONRenderer
 from middlewares.pagenation import Pagination
 from common.exceptions.bad_request_error import BadRequestError
+from common.exceptions.db_error import DatabaseTimeoutError
 
 
 class ErrorMiddlewareTests(TestCase):
@@ -43,6 +44,20 @@ class ErrorMiddlewareTests(TestCase):
         self.assertIn("result", response.content.decode())
         self.assertIn("Test error", response.content.decode())
 
+    def test_error_middleware_database_timeout(self):
+        """Test ErrorMiddleware maps DatabaseTimeoutError to 504 / 503"""
+        for status, message in (
+            (504, "Database query timed out."),
+            (503, "Database is busy. Please retry shortly."),
+        ):
+
+            def get_response(request, status=status):
+                raise DatabaseTimeoutError("canceling statement", status=status)
+
+            response = ErrorMiddleware(get_response)(self.factory.get("/api/test/"))
+            self.assertEqual(response.status_code, status)
+            self.assertIn(message, response.content.decode())
+
     def test_error_middleware_validation_error(self):
         """Test ErrorMiddleware with ValidationError"""
 
@@ -172,6 +187,14 @@ class CustomExceptionHandlerTests(TestCase):
         self.assertEqual(response.data["result"], False)
         self.assertIn("error_message", response.data)
 
+    def test_custom_exception_handler_database_timeout(self):
+        """Test custom_exception_handler maps DatabaseTimeoutError from DRF views"""
+        response = custom_exception_handler(
+            DatabaseTimeoutError("canceling statement"), {"view": Mock()}
+        )
+        self.assertEqual(response.status_code, 504)
+        self.assertEqual(response.data["error_message"], "Database query timed out.")
+
     def test_custom_exception_handler_no_response(self):
         """Test custom_exception_handler when DRF returns None"""
         exc = Exception("Unknown error")
@@ -240,6 +263,122 @@ class OkJSONRendererTests(TestCase):
         self.assertIn(b"result", result)
         self.assertIn(b"data", result)
 
+    def test_ok_json_renderer_dataclass_payload(self):
+        """Test OkJSONRenderer encodes dataclass models without conversion"""
+        import json
+        from datetime import datetime
+
+        from common.models.neighborhood import NeighborhoodStats
+
+        stats = NeighborhoodStats(
+            bbl="1",
+            address="A",
+            borough="B",
+            zip_code="Z",
+            last_updated=datetime(2024, 1, 2),
+        )
+        result = self.renderer.render(
+            {"data": [stats]}, renderer_context=self.renderer_context
+        )
+        decoded = json.loads(result)
+        self.assertTrue(decoded["result"])
+        self.assertEqual(
+            decoded["data"]["data"][0]["last_updated"], "2024-01-02T00:00:00"
+        )
+
+        indented = self.renderer.render(
+            {"data": [stats]}, renderer_context={**self.renderer_context, "indent": 2}
+        )
+        self.assertEqual(json.loads(indented), decoded)
+        self.assertIn(b'\n  "result"', indented)
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        from datetime import datetime, timezone
+
+        from rest_framework.permissions import AllowAny
+        from rest_framework.views import APIView
+
+        from infrastructures.postgres.profile_cache import DataVersion, ProfileCache
+        from middlewares.conditional_get import conditional_get
+
+        self.version = DataVersion(7, datetime(2024, 1, 2, tzinfo=timezone.utc))
+        self.cache = ProfileCache(
+            version_loader=lambda: self.version, version_check_interval=0
+        )
+        self.calls = 0
+        test = self
+
+        class View(APIView):
+            permission_classes = [AllowAny]
+
+            @conditional_get()
+            def get(self, request):
+                test.calls += 1
+                if request.GET.get("bbl") == "0":
+                    return Response({"detail": "Not found."}, status=404)
+                return Response({"ok": True})
+
+        self.view = View.as_view()
+        self.factory = RequestFactory()
+        patcher = patch(
+            "middlewares.conditional_get.get_profile_cache", return_value=self.cache
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get(self, query="?bbl=1", **headers):
+        return self.view(self.factory.get("/api/test/" + query, **headers))
+
+    def test_etag_and_last_modified_answer_304_without_running_view(self):
+        """Test matching validators get a 304 before the view runs"""
+        from datetime import datetime, timezone
+
+        from infrastructures.postgres.profile_cache import DataVersion
+
+        first = self._get()
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first["ETag"].startswith('W/"'))
+        self.assertEqual(first["Last-Modified"], "Tue, 02 Jan 2024 00:00:00 GMT")
+        self.assertIn("no-cache", first["Cache-Control"])
+        self.assertNotEqual(self._get("?bbl=2")["ETag"], first["ETag"])
+        self.assertEqual(
+            self._get("?bbl=1&x=1")["ETag"], self._get("?x=1&bbl=1")["ETag"]
+        )
+        calls = self.calls
+
+        self.assertEqual(self._get(HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 304)
+        self.assertEqual(
+            self._get(HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]).status_code, 304
+        )
+        self.assertEqual(self.calls, calls)
+
+        # 크롤러 적재로 버전이 오르면 다시 전체 응답
+        self.version = DataVersion(8, datetime(2024, 1, 3, tzinfo=timezone.utc))
+        again = self._get(HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(again.status_code, 200)
+        self.assertNotEqual(again["ETag"], first["ETag"])
+        self.assertEqual(self.calls, calls + 1)
+
+    def test_error_responses_carry_no_validators(self):
+        """Test a 404 has no ETag / Last-Modified, so it is never answered 304"""
+        missing = self._get("?bbl=0")
+        self.assertEqual(missing.status_code, 404)
+        self.assertFalse(missing.has_header("ETag"))
+        self.assertFalse(missing.has_header("Last-Modified"))
+        self.assertIn("no-cache", missing["Cache-Control"])
+
+    def test_unreadable_version_serves_without_validators(self):
+        """Test a database error while reading the version skips conditional handling"""
+        from common.exceptions.db_error import DatabaseError
+
+        self.cache._version_loader = Mock(side_effect=DatabaseError("down"))
+        response = self._get(HTTP_IF_NONE_MATCH='W/"x"')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("ETag"))
+        self.assertEqual(self.calls, 1)
+
 
 class PaginationTests(TestCase):
     def setUp(self):
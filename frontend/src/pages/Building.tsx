@@ -138,6 +138,12 @@ interface BuildingData {
     acris_legals: number;
     acris_parties: number;
   };
+  // next-page cursors for /api/building/<collection>/ (null when complete)
+  cursors?: {
+    violations: string | null;
+    complaints: string | null;
+    evictions: string | null;
+  };
 }
 
 const BuildingHeader: React.FC<{ building: BuildingData }> = ({ building }) => {
@@ -317,7 +323,7 @@ const BuildingHeader: React.FC<{ building: BuildingData }> = ({ building }) => {
 
 const BuildingTabs: React.FC<{ building: BuildingData }> = ({ building }) => {
   const [activeTab, setActiveTab] = useState("overview");
-  const { contacts, complaints, violations, evictions } = building;
+  const { contacts, complaints, violations, evictions, counts } = building;
 
   const tabs = [
     { id: "overview", label: "Overview" },
@@ -448,7 +454,7 @@ const BuildingTabs: React.FC<{ building: BuildingData }> = ({ building }) => {
         return (
           <Box>
             <Typography variant="h6" gutterBottom>
-              Recent Complaints ({complaints.length})
+              Recent Complaints ({counts.complaints})
             </Typography>
             {complaints.slice(0, 5).map((complaint, index) => (
               <Paper key={index} sx={{ p: 2, mb: 2 }}>
@@ -485,7 +491,7 @@ const BuildingTabs: React.FC<{ building: BuildingData }> = ({ building }) => {
         return (
           <Box>
             <Typography variant="h6" gutterBottom>
-              Recent Violations ({violations.length})
+              Recent Violations ({counts.violations})
             </Typography>
             {violations.slice(0, 5).map((violation, index) => (
               <Paper key={index} sx={{ p: 2, mb: 2 }}>
@@ -529,7 +535,7 @@ const BuildingTabs: React.FC<{ building: BuildingData }> = ({ building }) => {
         return (
           <Box>
             <Typography variant="h6" gutterBottom>
-              Recent Evictions ({evictions.length})
+              Recent Evictions ({counts.evictions})
             </Typography>
             {evictions.slice(0, 5).map((eviction, index) => (
               <Paper key={index} sx={{ p: 2, mb: 2 }}>